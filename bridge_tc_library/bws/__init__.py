@@ -6,5 +6,7 @@ are stubs that demonstrate the intended API surface; replace with real BWS
 format handling or a live server integration as required.
 """
 from .client import BWSLiveClient
+from .ingest import ResultIngestor
+from .store import BWSStore
 
-__all__ = ["BWSLiveClient"]
+__all__ = ["BWSLiveClient", "BWSStore", "ResultIngestor"]
@@ -1,6 +1,53 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
-from bridge_tc_library.structure.tournament import Tournament
+from bridge_tc_library.scoring import LiveStandings
+from bridge_tc_library.structure.core import Position
+from bridge_tc_library.structure.tournament import Tournament, Sector, Table
+
+from .ingest import ResultIngestor
+from .store import BWSStore, TableKey
+
+
+def _pair_id(pairs: Optional[Dict[Any, Any]], position: Position) -> Optional[int]:
+    if not pairs:
+        return None
+    pair = pairs.get(position, pairs.get(position.value))
+    return getattr(pair, "id", pair)
+
+
+def table_key(table: Table) -> TableKey:
+    """Key of a table in the BWS structure: sectors number their tables from 1, so the sector is part of it."""
+    return table.sector.name if table.sector is not None else None, table.table_id
+
+
+def table_row(table: Table) -> Dict[str, Any]:
+    """BWS row of one table: current pair ids and board group id."""
+    board_group = table.current_board_set
+    return {
+        "sector": table.sector.name if table.sector is not None else None,
+        "ns": _pair_id(table.current_pairs, Position.NS),
+        "ew": _pair_id(table.current_pairs, Position.EW),
+        "board_group": getattr(board_group, "BoardGroupId", board_group),
+    }
+
+
+def empty_delta() -> Dict[str, Any]:
+    return {"tables": {}, "removed": [], "board_groups": {}}
+
+
+def merge_delta(into: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """Fold `delta` into the earlier delta `into`, as if both were applied in order."""
+    for key, row in delta["tables"].items():
+        into["tables"][key] = row
+        if key in into["removed"]:
+            into["removed"].remove(key)
+    into["board_groups"].update(delta["board_groups"])
+    for key in delta["removed"]:
+        into["tables"].pop(key, None)
+        into["board_groups"].pop(key, None)
+        if key not in into["removed"]:
+            into["removed"].append(key)
+    return into
 
 
 class BWSLiveClient:
@@ -9,14 +56,27 @@ class BWSLiveClient:
     Responsibilities:
     - create an initial BWS representation from a validated `Tournament`
     - apply incremental updates when the tournament changes
-    - persist/load BWS representation to/from storage
+    - persist/load BWS representation to/from a SQLite `BWSStore`
 
     The concrete representation used here is intentionally generic (`Dict`) so
     projects integrating with a real BWS format can adapt easily.
+
+    Updates are delta based: callers mark changed tables or sectors with
+    `mark_dirty` and `update_from_tournament` re-reads only those. The delta
+    applied last is kept in `last_delta` (see `compute_delta` for its shape)
+    so writers can persist just the changes.
     """
 
     def __init__(self) -> None:
         self._bws: Optional[Dict[str, Any]] = None
+        self._dirty_tables: Set[Table] = set()
+        self._dirty_sectors: Set[Sector] = set()
+        self.last_delta: Dict[str, Any] = empty_delta()
+        self._store: Optional[BWSStore] = None
+        # changes not yet written to the store; None when a full write is due
+        self._unsaved: Optional[Dict[str, Any]] = None
+        # key each table was last written under, so a table that changed sector drops its old row
+        self._keys: Dict[Table, TableKey] = {}
 
     def create_bws_from_tournament(self, tournament: Tournament) -> Dict[str, Any]:
         """Build an initial BWS-like structure from `Tournament`.
@@ -24,42 +84,155 @@ class BWSLiveClient:
         This function must be called only after the `tournament` has been
         validated for feasibility by the core movement/tournament module.
         """
-        # Minimal example structure: mapping table_id -> (ns_pair_id, ew_pair_id, boards)
+        # mapping (sector, table_id) -> {"sector", "ns", "ew", "board_group"} with pair and board group ids
+        self._keys = {t: table_key(t) for t in getattr(tournament, "tables", [])}
         bws = {
             "tournament_name": getattr(tournament, "name", ""),
-            "tables": {}
+            "tables": {key: table_row(t) for t, key in self._keys.items()},
         }
-        for t in getattr(tournament, "tables", []):
-            bws["tables"][t.table_id] = {
-                "ns": getattr(getattr(t, "current_pairs", {}), "get", lambda k: None)("NS"),
-                "ew": getattr(getattr(t, "current_pairs", {}), "get", lambda k: None)("EW"),
-                "board_group": getattr(t, "current_board_set", None)
-            }
         self._bws = bws
+        self._dirty_tables.clear()
+        self._dirty_sectors.clear()
+        self._unsaved = None
+        self.last_delta = {"tables": dict(bws["tables"]), "removed": [], "board_groups": {
+            key: row["board_group"] for key, row in bws["tables"].items()
+        }}
         return bws
 
+    def mark_dirty(self, *items: Union[Table, Sector, Iterable[Union[Table, Sector]]]) -> None:
+        """Record tables or whole sectors whose state changed since the last update."""
+        for item in items:
+            if isinstance(item, Table):
+                self._dirty_tables.add(item)
+            elif isinstance(item, Sector):
+                self._dirty_sectors.add(item)
+            else:
+                self.mark_dirty(*item)
+
+    def compute_delta(self, tournament: Tournament) -> Dict[str, Any]:
+        """Changes between the stored BWS structure and `tournament`.
+
+        Only tables marked dirty (directly or through their sector) are read;
+        when nothing is marked every table is compared. Returns
+        ``{"tables": {key: row}, "removed": [key], "board_groups": {key: board_group_id}}``
+        keyed by ``(sector, table_id)``, where ``tables`` holds changed or new
+        rows and ``board_groups`` the subset of those whose board group changed.
+        A table that moved to another sector is removed under its old key.
+        """
+        return self._read(tournament)[0]
+
+    def _read(self, tournament: Tournament) -> Tuple[Dict[str, Any], List[Table], Dict[TableKey, Table]]:
+        """The delta, the tables read and the attached ones by key."""
+        if self._bws is None:
+            raise RuntimeError("No BWS data to update; call create_bws_from_tournament first")
+        stored: Dict[TableKey, Dict[str, Any]] = self._bws["tables"]
+
+        if self._dirty_tables or self._dirty_sectors:
+            candidates: List[Table] = list(self._dirty_tables)
+            for sector in self._dirty_sectors:
+                candidates.extend(sector.tables)
+            sector_names = {sector.name for sector in self._dirty_sectors}
+        else:
+            candidates = list(getattr(tournament, "tables", []))
+            sector_names = None
+
+        # detached tables (sector None) drop out of the structure
+        current: Dict[TableKey, Table] = {}
+        for table in candidates:
+            if table.sector is not None:
+                current.setdefault(table_key(table), table)
+
+        delta = empty_delta()
+        for key, table in current.items():
+            row = table_row(table)
+            old = stored.get(key)
+            if row != old:
+                delta["tables"][key] = row
+                if old is None or old["board_group"] != row["board_group"]:
+                    delta["board_groups"][key] = row["board_group"]
+
+        checked = {self._keys[table] for table in candidates if table in self._keys}
+        checked.update(key for key in stored if sector_names is None or key[0] in sector_names)
+        delta["removed"] = [key for key in checked if key in stored and key not in current]
+        return delta, candidates, current
+
+    def apply_delta(self, delta: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply a delta produced by `compute_delta` to the in-memory structure."""
+        tables = self._bws["tables"]
+        tables.update(delta["tables"])
+        for key in delta["removed"]:
+            tables.pop(key, None)
+        self.last_delta = delta
+        if self._unsaved is not None:
+            merge_delta(self._unsaved, delta)
+        return self._bws
+
     def update_from_tournament(self, tournament: Tournament) -> Dict[str, Any]:
         """Apply an in-memory update from a tournament that has changed.
 
-        Implementations can choose to compute deltas or rebuild the structure.
+        Only the delta against the stored structure is applied; it remains
+        available in `last_delta`.
         """
         if self._bws is None:
             return self.create_bws_from_tournament(tournament)
-        # naive full rebuild for now
-        return self.create_bws_from_tournament(tournament)
+        full = not (self._dirty_tables or self._dirty_sectors)
+        delta, candidates, current = self._read(tournament)
+        self._dirty_tables.clear()
+        self._dirty_sectors.clear()
+        if full:
+            self._keys = {}
+        else:
+            for table in candidates:
+                self._keys.pop(table, None)
+        self._keys.update((table, key) for key, table in current.items())
+        return self.apply_delta(delta)
 
     def save(self, path: str) -> None:
-        """Persist the in-memory BWS representation to a file (JSON for now)."""
-        import json
+        """Persist the in-memory BWS representation to a SQLite BWS store.
 
+        The first save to `path` writes every table row; later saves to the
+        same store write only the rows changed since the previous save.
+        """
         if self._bws is None:
             raise RuntimeError("No BWS data to save")
-        with open(path, "w", encoding="utf-8") as fh:
-            json.dump(self._bws, fh, default=str, indent=2)
+        if self._store is None or self._store.path != path:
+            if self._store is not None:
+                self._store.close()
+            self._store = BWSStore(path)
+            self._unsaved = None
+        if self._unsaved is None:
+            self._store.set_meta("tournament_name", self._bws["tournament_name"])
+            self._store.write_tables(self._bws["tables"])
+        else:
+            self._store.apply_delta(self._unsaved)
+        self._unsaved = empty_delta()
 
-    def load(self, path: str) -> Dict[str, Any]:
-        import json
+    def load(self, path: str, tables: Optional[Iterable[int]] = None, section: Optional[str] = None) -> Dict[str, Any]:
+        """Load the BWS representation from a store; only the `tables` ids and the `section` when given.
 
-        with open(path, "r", encoding="utf-8") as fh:
-            self._bws = json.load(fh)
+        Tables are matched to rows by their current key afterwards: mark the old
+        sector of a table that moves before the next update.
+        """
+        if self._store is not None and self._store.path != path:
+            self._store.close()
+            self._store = None
+        if self._store is None:
+            self._store = BWSStore(path)
+        self._bws = {
+            "tournament_name": self._store.get_meta("tournament_name", ""),
+            "tables": self._store.load_tables(tables, section),
+        }
+        self._keys = {}
+        self._unsaved = empty_delta()
         return self._bws
+
+    def ingestor(self, standings: LiveStandings, **kwargs: Any) -> ResultIngestor:
+        """A `ResultIngestor` feeding `standings` from the store of the last `save` or `load`."""
+        if self._store is None:
+            raise RuntimeError("No BWS store; call save or load first")
+        return ResultIngestor(self._store.path, standings, **kwargs)
+
+    @property
+    def store(self) -> Optional[BWSStore]:
+        """The store used by the last `save` or `load`."""
+        return self._store
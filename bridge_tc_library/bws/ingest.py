@@ -0,0 +1,167 @@
+"""Asynchronous ingestion of results written to a BWS store.
+
+`ResultIngestor` polls ``ReceivedData`` for rows with an ID above its
+cursor, so each poll reads only new rows. Batches go through an
+`asyncio.Queue` to a scoring task that turns them into raw scores and feeds
+`LiveStandings`; when scoring falls behind the queue fills up and polling
+waits. The cursor is persisted in ``Meta`` after a batch is scored, so a
+restarted ingestor continues where the previous one stopped and no scored
+batch is lost. A row that cannot be scored (malformed contract, missing
+result) is recorded in `ResultIngestor.errors` and skipped.
+
+Database calls run in a worker thread (`asyncio.to_thread`) so the event
+loop stays responsive.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from bridge_tc_library.scoring import LiveStandings
+from bridge_tc_library.scoring.contract import parse_contract, raw_scores
+
+from .store import BWSStore
+
+CURSOR_KEY = "ingest_cursor"
+
+
+def result_row(received: Dict[str, Any]) -> Dict[str, Any]:
+    """Scoring row (see `bridge_tc_library.scoring.contract`) of a ReceivedData row.
+
+    Raises ValueError for a played contract without a result.
+    """
+    if not received["Result"] and parse_contract(received["Contract"]) is not None:
+        raise ValueError(f"No result for {received['Contract']} on board {received['Board']}")
+    row = {
+        "board": received["Board"],
+        "ns": received["PairNS"],
+        "ew": received["PairEW"],
+        "contract": received["Contract"],
+        "declarer": received["Declarer"],
+        "result": received["Result"],
+    }
+    if received["TableId"] is not None:
+        row["table"] = received["TableId"]
+    return row
+
+
+class ResultIngestor:
+    """Feeds results from a BWS store into live standings.
+
+    `on_batch`, if given, is called with the list of scored rows after each
+    batch is applied (e.g. to push standings to a display). Rows that could not
+    be scored are kept in `errors` as ``(ID, exception)`` pairs.
+    """
+
+    def __init__(self, path: str, standings: LiveStandings, batch_size: int = 500, interval: float = 0.2,
+                 max_pending: int = 4, on_batch: Optional[Callable[[List[Dict[str, Any]]], Any]] = None,
+                 cursor_key: str = CURSOR_KEY) -> None:
+        self.path = path
+        self.standings = standings
+        self.batch_size = batch_size
+        self.interval = interval
+        self.on_batch = on_batch
+        self.cursor_key = cursor_key
+        self._store = BWSStore(path, check_same_thread=False)
+        self._lock = asyncio.Lock()
+        self._queue: "asyncio.Queue[List[Dict[str, Any]]]" = asyncio.Queue(max_pending)
+        self.errors: List[Tuple[int, Exception]] = []
+        # highest ID read and highest ID scored (the persisted cursor)
+        self.read_cursor = self.cursor = int(self._store.get_meta(cursor_key, "0"))
+
+    async def _db(self, fn: Callable[..., Any], *args: Any) -> Any:
+        async with self._lock:
+            return await asyncio.to_thread(fn, *args)
+
+    async def poll(self) -> int:
+        """Read new rows once and queue them in batches; returns the number read.
+
+        Waits while the queue is full.
+        """
+        read = 0
+        while True:
+            rows = await self._db(self._store.results, self.read_cursor, self.batch_size)
+            if not rows:
+                return read
+            await self._queue.put(rows)
+            self.read_cursor = rows[-1]["ID"]
+            read += len(rows)
+            if len(rows) < self.batch_size:
+                return read
+
+    def apply(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Apply one batch of ReceivedData rows to the standings; returns the scored rows.
+
+        A row that fails to score is appended to `errors` and the batch goes on.
+        """
+        submitted = []
+        for received in batch:
+            if received["Erased"]:
+                try:
+                    self.standings.remove(received["Board"], received["PairNS"], received["PairEW"])
+                except KeyError:
+                    pass
+            elif received["Contract"]:
+                try:
+                    row = raw_scores([result_row(received)])[0]
+                    self.standings.submit(row)
+                except (ValueError, KeyError, TypeError) as exc:
+                    self.errors.append((received["ID"], exc))
+                    continue
+                submitted.append(row)
+        return submitted
+
+    async def _score_next(self) -> None:
+        batch = await self._queue.get()
+        try:
+            scored = self.apply(batch)
+            self.cursor = batch[-1]["ID"]
+            await self._db(self._store.set_meta, self.cursor_key, self.cursor)
+            if self.on_batch is not None:
+                self.on_batch(scored)
+        finally:
+            self._queue.task_done()
+
+    async def _score_forever(self) -> None:
+        while True:
+            await self._score_next()
+
+    async def _with_scorer(self, work: Awaitable[Any]) -> Any:
+        """Run `work` alongside the scoring task; if scoring fails, `work` is cancelled and the error raised."""
+        scorer = asyncio.create_task(self._score_forever())
+        task = asyncio.ensure_future(work)
+        try:
+            await asyncio.wait((scorer, task), return_when=asyncio.FIRST_COMPLETED)
+            if scorer.done():
+                task.cancel()
+                scorer.result()
+            return await task
+        finally:
+            scorer.cancel()
+            task.cancel()
+
+    async def _poll_until(self, stop: Optional[asyncio.Event]) -> None:
+        while stop is None or not stop.is_set():
+            await self.poll()
+            if stop is None:
+                await asyncio.sleep(self.interval)
+            else:
+                try:
+                    await asyncio.wait_for(stop.wait(), self.interval)
+                except asyncio.TimeoutError:
+                    pass
+        await self._queue.join()
+
+    async def _poll_all(self) -> int:
+        read = await self.poll()
+        await self._queue.join()
+        return read
+
+    async def run(self, stop: Optional[asyncio.Event] = None) -> None:
+        """Poll every `interval` seconds until `stop` is set, scoring as rows arrive."""
+        await self._with_scorer(self._poll_until(stop))
+
+    async def catch_up(self) -> int:
+        """Score every row currently in the store; returns the number of rows read."""
+        return await self._with_scorer(self._poll_all())
+
+    def close(self) -> None:
+        self._store.close()
@@ -0,0 +1,236 @@
+"""SQLite storage for BWS data.
+
+The schema follows the relational layout of real BWS files: ``Tables`` holds
+the current state of each table, keyed like ``RoundData`` by section and table
+number so sections may reuse table numbers, ``RoundData`` the movement (who plays which
+boards where in every round), ``ReceivedData`` the results entered at the
+tables and ``Meta`` small key/value settings such as the tournament name.
+
+The database runs in WAL mode so readers (scoring, displays) are not blocked
+by the writer. Bulk data such as a whole movement is written with
+`executemany` in one transaction; everything else runs in small transactions
+touching only the affected rows.
+"""
+import sqlite3
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from bridge_tc_library.structure.core import Position
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS Tables (
+    Section TEXT NOT NULL,
+    TableId INTEGER NOT NULL,
+    NSPair INTEGER,
+    EWPair INTEGER,
+    BoardGroup INTEGER,
+    PRIMARY KEY (Section, TableId)
+);
+CREATE TABLE IF NOT EXISTS RoundData (
+    Section TEXT NOT NULL,
+    TableId INTEGER NOT NULL,
+    Round INTEGER NOT NULL,
+    NSPair INTEGER,
+    EWPair INTEGER,
+    LowBoard INTEGER,
+    HighBoard INTEGER,
+    PRIMARY KEY (Section, TableId, Round)
+);
+CREATE TABLE IF NOT EXISTS ReceivedData (
+    ID INTEGER PRIMARY KEY AUTOINCREMENT,
+    Section TEXT,
+    TableId INTEGER,
+    Round INTEGER,
+    Board INTEGER NOT NULL,
+    PairNS INTEGER NOT NULL,
+    PairEW INTEGER NOT NULL,
+    Declarer TEXT,
+    Contract TEXT,
+    Result TEXT,
+    Erased INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS ReceivedDataBoard ON ReceivedData (Board);
+CREATE TABLE IF NOT EXISTS Meta (
+    Key TEXT PRIMARY KEY,
+    Value TEXT
+);
+"""
+
+TableRow = Dict[str, Any]
+# (section, table_id): sections may reuse table numbers
+TableKey = Tuple[Optional[str], int]
+
+RESULT_COLUMNS = ("ID", "Section", "TableId", "Round", "Board", "PairNS", "PairEW", "Declarer", "Contract", "Result", "Erased")
+
+
+def movement_round_rows(movement: Any, section: str, rounds: int) -> List[Tuple[Any, ...]]:
+    """RoundData rows of the first `rounds` rounds of a `BaseMovement`.
+
+    Only tables with both lines seated get a row; the board range spans all
+    board groups played at the table in that round.
+    """
+    rows = []
+    for rnd, tables in movement.iter_rounds(1, rounds):
+        for table, (sitting, groups) in tables.items():
+            if not sitting or sitting.get(Position.NS) is None or sitting.get(Position.EW) is None:
+                continue
+            boards = [board for group in groups for board in group.boards]
+            rows.append((section, table.table_id, rnd, sitting[Position.NS].id, sitting[Position.EW].id,
+                         min(boards) if boards else None, max(boards) if boards else None))
+    return rows
+
+
+class BWSStore:
+    """A BWS database file.
+
+    `path` may be ``":memory:"`` for a throwaway store. Use as a context
+    manager or call `close` when done. Pass ``check_same_thread=False`` to
+    use the store from worker threads; calls must then not overlap.
+    """
+
+    def __init__(self, path: str, check_same_thread: bool = True) -> None:
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=check_same_thread)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "BWSStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    # -- meta --------------------------------------------------------------
+
+    def get_meta(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        row = self._conn.execute("SELECT Value FROM Meta WHERE Key = ?", (key,)).fetchone()
+        return row[0] if row is not None else default
+
+    def set_meta(self, key: str, value: Any) -> None:
+        with self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO Meta (Key, Value) VALUES (?, ?)", (key, str(value)))
+
+    # -- tables ------------------------------------------------------------
+
+    @property
+    def total_changes(self) -> int:
+        """Rows inserted, updated or deleted through this store since it was opened."""
+        return self._conn.total_changes
+
+    @staticmethod
+    def _table_params(tables: Dict[TableKey, TableRow]) -> List[Tuple[Any, ...]]:
+        # sections are part of the key, so a table without one is stored under ""
+        return [(section or "", table_id, row["ns"], row["ew"], row["board_group"]) for (section, table_id), row in tables.items()]
+
+    def write_tables(self, tables: Dict[TableKey, TableRow], section: Optional[str] = None) -> None:
+        """Replace the Tables table in one transaction; with `section` only that section's rows."""
+        with self._conn:
+            if section is None:
+                self._conn.execute("DELETE FROM Tables")
+            else:
+                self._conn.execute("DELETE FROM Tables WHERE Section = ?", (section,))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO Tables (Section, TableId, NSPair, EWPair, BoardGroup) VALUES (?, ?, ?, ?, ?)",
+                self._table_params(tables),
+            )
+
+    def apply_delta(self, delta: Dict[str, Any]) -> None:
+        """Write a `BWSLiveClient` delta: delete the ``removed`` rows, then upsert the changed ``tables``."""
+        with self._conn:
+            self._conn.executemany(
+                "DELETE FROM Tables WHERE Section = ? AND TableId = ?",
+                [(section or "", table_id) for section, table_id in delta["removed"]],
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO Tables (Section, TableId, NSPair, EWPair, BoardGroup) VALUES (?, ?, ?, ?, ?)",
+                self._table_params(delta["tables"]),
+            )
+
+    def load_tables(self, table_ids: Optional[Iterable[int]] = None, section: Optional[str] = None) -> Dict[TableKey, TableRow]:
+        """Table rows by ``(section, table_id)``; only `table_ids` and only `section` when given."""
+        clauses, params = [], []
+        if table_ids is not None:
+            ids = list(table_ids)
+            clauses.append(f"TableId IN ({','.join('?' * len(ids))})")
+            params.extend(ids)
+        if section is not None:
+            clauses.append("Section = ?")
+            params.append(section)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        cursor = self._conn.execute(f"SELECT Section, TableId, NSPair, EWPair, BoardGroup FROM Tables{where} ORDER BY Section, TableId", params)
+        return {
+            (section or None, table_id): {"sector": section or None, "ns": ns, "ew": ew, "board_group": group}
+            for section, table_id, ns, ew, group in cursor
+        }
+
+    # -- movement ----------------------------------------------------------
+
+    def write_round_data(self, rows: Sequence[Tuple[Any, ...]], section: Optional[str] = None) -> None:
+        """Bulk-insert RoundData rows ``(section, table_id, round, ns, ew, low, high)``.
+
+        With `section` the existing rows of that section are replaced.
+        """
+        with self._conn:
+            if section is not None:
+                self._conn.execute("DELETE FROM RoundData WHERE Section = ?", (section,))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO RoundData (Section, TableId, Round, NSPair, EWPair, LowBoard, HighBoard) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def write_movement(self, movement: Any, section: str, rounds: int) -> None:
+        self.write_round_data(movement_round_rows(movement, section, rounds), section)
+
+    def round_data(self, section: Optional[str] = None, round_number: Optional[int] = None) -> List[Tuple[Any, ...]]:
+        """RoundData rows, optionally restricted to one section and/or round."""
+        clauses, params = [], []
+        if section is not None:
+            clauses.append("Section = ?")
+            params.append(section)
+        if round_number is not None:
+            clauses.append("Round = ?")
+            params.append(round_number)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._conn.execute(
+            f"SELECT Section, TableId, Round, NSPair, EWPair, LowBoard, HighBoard FROM RoundData{where} ORDER BY Section, Round, TableId",
+            params,
+        ).fetchall()
+
+    # -- results -----------------------------------------------------------
+
+    def add_result(self, board: int, ns: int, ew: int, contract: str, declarer: Optional[str] = None,
+                   result: Optional[str] = None, section: Optional[str] = None, table_id: Optional[int] = None,
+                   round_number: Optional[int] = None) -> int:
+        """Insert one result row and return its ID."""
+        with self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO ReceivedData (Section, TableId, Round, Board, PairNS, PairEW, Declarer, Contract, Result) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (section, table_id, round_number, board, ns, ew, declarer, contract, result),
+            )
+        return cursor.lastrowid
+
+    def erase_result(self, board: int, ns: int, ew: int, section: Optional[str] = None,
+                     table_id: Optional[int] = None, round_number: Optional[int] = None) -> int:
+        """Record that the result of `ns` vs `ew` on `board` was deleted.
+
+        As in BWS files, an erasure is a new row flagged ``Erased`` rather than
+        an update of the old one, so readers following the ID catch it.
+        """
+        with self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO ReceivedData (Section, TableId, Round, Board, PairNS, PairEW, Erased) VALUES (?, ?, ?, ?, ?, ?, 1)",
+                (section, table_id, round_number, board, ns, ew),
+            )
+        return cursor.lastrowid
+
+    def results(self, since_id: int = 0, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """ReceivedData rows with ID greater than `since_id`, oldest first."""
+        query = f"SELECT {', '.join(RESULT_COLUMNS)} FROM ReceivedData WHERE ID > ? ORDER BY ID"
+        params: List[Any] = [since_id]
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return [dict(zip(RESULT_COLUMNS, row)) for row in self._conn.execute(query, params)]
@@ -0,0 +1,25 @@
+from bridge_tc_library.structure.core import BoardGroup, Pair, Player, Position
+from bridge_tc_library.structure.tournament import Sector, Tournament
+
+
+def make_tournament(num_sectors=2, tables_per_sector=3):
+    """Sectors A, B, ... each numbering its tables from 1; the n-th table overall seats pairs n and 100 + n with group n."""
+    tournament = Tournament(total_boards=24)
+    n = 1
+    for s in range(num_sectors):
+        sector = Sector(chr(ord("A") + s))
+        sector.add_tables(tables_per_sector)
+        for table in sector.tables:
+            seat(table, n, 100 + n, n)
+            n += 1
+        tournament.add_sector(sector)
+    return tournament
+
+
+def seat(table, ns, ew, group):
+    table.current_pairs = {Position.NS: make_pair(ns), Position.EW: make_pair(ew)}
+    table.current_board_set = BoardGroup(group, (group,))
+
+
+def make_pair(pair_id):
+    return Pair(pair_id, (Player(f"{pair_id}a"), Player(f"{pair_id}b")))
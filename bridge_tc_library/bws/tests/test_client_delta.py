@@ -0,0 +1,87 @@
+from bridge_tc_library.bws import BWSLiveClient
+from bridge_tc_library.bws.tests.helpers import make_tournament, seat
+from bridge_tc_library.structure.tournament import Sector
+
+
+def test_initial_structure_uses_ids():
+    client = BWSLiveClient()
+    bws = client.create_bws_from_tournament(make_tournament())
+    # both sectors number their tables from 1
+    assert sorted(bws["tables"]) == [("A", 1), ("A", 2), ("A", 3), ("B", 1), ("B", 2), ("B", 3)]
+    assert bws["tables"][("A", 1)] == {"sector": "A", "ns": 1, "ew": 101, "board_group": 1}
+    assert bws["tables"][("B", 1)] == {"sector": "B", "ns": 4, "ew": 104, "board_group": 4}
+    assert len(client.last_delta["tables"]) == 6
+
+
+def test_dirty_table_produces_minimal_delta():
+    tournament = make_tournament()
+    client = BWSLiveClient()
+    client.create_bws_from_tournament(tournament)
+    table = tournament.sectors[0].tables[1]
+    seat(table, 2, 105, 9)
+    untouched = tournament.sectors[1].tables[0]
+    seat(untouched, 50, 150, 50)
+
+    client.mark_dirty(table)
+    bws = client.update_from_tournament(tournament)
+
+    assert client.last_delta == {
+        "tables": {("A", 2): {"sector": "A", "ns": 2, "ew": 105, "board_group": 9}},
+        "removed": [],
+        "board_groups": {("A", 2): 9},
+    }
+    assert bws["tables"][("A", 2)]["ew"] == 105
+    # not marked, so not re-read
+    assert bws["tables"][("B", 1)]["ns"] == 4
+
+
+def test_full_diff_without_marks_matches_rebuild():
+    tournament = make_tournament()
+    client = BWSLiveClient()
+    client.create_bws_from_tournament(tournament)
+    seat(tournament.sectors[1].tables[2], 6, 101, 6)
+    tournament.sectors[0].tables[0].change_sector(None)
+
+    bws = client.update_from_tournament(tournament)
+
+    assert client.last_delta["removed"] == [("A", 1)]
+    assert client.last_delta["board_groups"] == {}
+    assert bws == BWSLiveClient().create_bws_from_tournament(tournament)
+
+
+def test_dirty_sector_detects_removed_tables():
+    tournament = make_tournament()
+    client = BWSLiveClient()
+    client.create_bws_from_tournament(tournament)
+    sector = tournament.sectors[1]
+    sector.tables.pop()
+
+    client.mark_dirty(sector)
+    client.update_from_tournament(tournament)
+
+    assert client.last_delta["removed"] == [("B", 3)]
+    assert ("B", 3) not in client.create_bws_from_tournament(tournament)["tables"]
+
+
+def test_table_moving_sector_is_removed_under_its_old_key():
+    tournament = make_tournament()
+    client = BWSLiveClient()
+    client.create_bws_from_tournament(tournament)
+    extra = Sector("C")
+    tournament.add_sector(extra)
+    table = tournament.sectors[0].tables[2]
+    table.change_sector(extra)
+
+    client.mark_dirty(table)
+    bws = client.update_from_tournament(tournament)
+
+    assert client.last_delta["removed"] == [("A", 3)]
+    assert bws["tables"][("C", 3)]["ns"] == 3
+    # sector B's table 3 is a different table
+    assert bws["tables"][("B", 3)]["ns"] == 6
+
+    table.change_sector(None)
+    client.mark_dirty(table)
+    client.update_from_tournament(tournament)
+    assert client.last_delta["removed"] == [("C", 3)]
+    assert sorted(bws["tables"]) == [("A", 1), ("A", 2), ("B", 1), ("B", 2), ("B", 3)]
@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+
+from bridge_tc_library.bws import BWSStore, ResultIngestor
+from bridge_tc_library.scoring import LiveStandings, ScoreCalculator
+from bridge_tc_library.scoring.contract import raw_scores
+
+
+def test_ingest_reads_only_new_rows_and_persists_cursor(tmp_path):
+    path = str(tmp_path / "event.bws")
+    store = BWSStore(path)
+    store.add_result(1, 1, 11, "4S", "N", "=")
+    store.add_result(1, 2, 12, "4S", "N", "+1")
+    store.add_result(1, 3, 13, "3NT", "E", "-1")
+
+    async def scenario():
+        standings = LiveStandings(results_per_board=3)
+        batches = []
+        ingestor = ResultIngestor(path, standings, batch_size=2, on_batch=batches.append)
+        assert await ingestor.catch_up() == 3
+        assert [len(batch) for batch in batches] == [2, 1]
+
+        store.add_result(1, 1, 11, "4S", "N", "-1")  # correction
+        store.erase_result(1, 3, 13)
+        assert await ingestor.catch_up() == 2
+        ingestor.close()
+        return standings, ingestor.cursor
+
+    standings, cursor = asyncio.run(scenario())
+    assert cursor == 5
+    assert store.get_meta("ingest_cursor") == "5"
+
+    expected = ScoreCalculator().compute_matchpoints(
+        raw_scores([{"board": 1, "ns": 1, "ew": 11, "contract": "4S", "declarer": "N", "result": "-1"},
+                    {"board": 1, "ns": 2, "ew": 12, "contract": "4S", "declarer": "N", "result": "+1"}]),
+        results_per_board=3,
+    )
+    assert {row["ns"]: row["ns_mp"] for row in standings.scored_rows()} == {row["ns"]: row["ns_mp"] for row in expected}
+
+    restarted = ResultIngestor(path, LiveStandings())
+    assert restarted.cursor == 5
+    assert asyncio.run(restarted.catch_up()) == 0
+    restarted.close()
+    store.close()
+
+
+def test_run_picks_up_rows_while_polling(tmp_path):
+    path = str(tmp_path / "event.bws")
+    store = BWSStore(path)
+
+    async def scenario():
+        standings = LiveStandings()
+        stop = asyncio.Event()
+        ingestor = ResultIngestor(path, standings, interval=0.01, max_pending=1,
+                                  on_batch=lambda rows: stop.set() if standings.standings() else None)
+        task = asyncio.create_task(ingestor.run(stop))
+        await asyncio.sleep(0.02)
+        store.add_result(3, 1, 2, "2H", "S", "=")
+        await asyncio.wait_for(task, 2)
+        ingestor.close()
+        return standings
+
+    standings = asyncio.run(scenario())
+    assert {entry["pair"] for entry in standings.standings()} == {1, 2}
+    store.close()
+
+
+def test_bad_rows_are_recorded_and_skipped(tmp_path):
+    path = str(tmp_path / "event.bws")
+    store = BWSStore(path)
+    bad = store.add_result(1, 1, 11, "9Z", "N", "=")
+    missing = store.add_result(1, 2, 12, "4S", "N", None)
+    store.add_result(2, 3, 13, "PASS")
+    for ns in (1, 2, 3, 4):
+        store.add_result(1, ns, 10 + ns, "3NT", "S", "=")
+
+    async def scenario():
+        standings = LiveStandings()
+        ingestor = ResultIngestor(path, standings, batch_size=1, max_pending=1)
+        read = await asyncio.wait_for(ingestor.catch_up(), 5)
+        ingestor.close()
+        return standings, ingestor, read
+
+    standings, ingestor, read = asyncio.run(scenario())
+    assert read == 7
+    assert ingestor.cursor == 7
+    assert [row_id for row_id, _ in ingestor.errors] == [bad, missing]
+    assert all(isinstance(exc, ValueError) for _, exc in ingestor.errors)
+    assert sorted(row["ns"] for row in standings.scored_rows()) == [1, 2, 3, 3, 4]
+    store.close()
+
+
+def test_scorer_failure_is_raised(tmp_path):
+    path = str(tmp_path / "event.bws")
+    store = BWSStore(path)
+    for ns in (1, 2, 3):
+        store.add_result(1, ns, 10 + ns, "3NT", "S", "=")
+
+    def fail(rows):
+        raise RuntimeError("display is down")
+
+    async def scenario():
+        ingestor = ResultIngestor(path, LiveStandings(), batch_size=1, max_pending=1, on_batch=fail)
+        try:
+            await asyncio.wait_for(ingestor.catch_up(), 5)
+        finally:
+            ingestor.close()
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(scenario())
+    store.close()
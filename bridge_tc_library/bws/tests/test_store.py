@@ -0,0 +1,96 @@
+from bridge_tc_library.bws import BWSLiveClient, BWSStore
+from bridge_tc_library.bws.tests.helpers import make_tournament, seat
+from bridge_tc_library.structure.movements.tests.helpers import make_howell_movement
+from bridge_tc_library.structure.tournament import Sector
+
+
+def test_save_writes_only_changed_rows(tmp_path):
+    path = str(tmp_path / "event.bws")
+    tournament = make_tournament()
+    client = BWSLiveClient()
+    client.create_bws_from_tournament(tournament)
+    client.save(path)
+
+    table = tournament.sectors[0].tables[0]
+    seat(table, 1, 106, 7)
+    client.mark_dirty(table)
+    client.update_from_tournament(tournament)
+    tournament.sectors[1].tables.pop()
+    client.mark_dirty(tournament.sectors[1])
+    client.update_from_tournament(tournament)
+
+    before = client.store.total_changes
+    client.save(path)
+    # one upsert and one delete
+    assert client.store.total_changes - before == 2
+
+    loaded = BWSLiveClient().load(path)
+    assert loaded == client.create_bws_from_tournament(tournament)
+
+
+def test_multi_section_round_trip(tmp_path):
+    path = str(tmp_path / "event.bws")
+    tournament = make_tournament()
+    client = BWSLiveClient()
+    bws = client.create_bws_from_tournament(tournament)
+    client.save(path)
+    assert BWSLiveClient().load(path) == bws
+
+    extra = Sector("C")
+    tournament.add_sector(extra)
+    table = tournament.sectors[0].tables[0]
+    table.change_sector(extra)
+    client.mark_dirty(table)
+    client.update_from_tournament(tournament)
+    client.save(path)
+
+    loaded = BWSLiveClient().load(path)
+    assert loaded == client.create_bws_from_tournament(tournament)
+    assert sorted(loaded["tables"]) == [("A", 2), ("A", 3), ("B", 1), ("B", 2), ("B", 3), ("C", 1)]
+    assert sorted(BWSLiveClient().load(path, section="B")["tables"]) == [("B", 1), ("B", 2), ("B", 3)]
+
+
+def test_sections_reuse_table_numbers(tmp_path):
+    path = str(tmp_path / "event.bws")
+    row_a = {"sector": "A", "ns": 1, "ew": 2, "board_group": 1}
+    row_b = {"sector": "B", "ns": 11, "ew": 12, "board_group": 1}
+    tables = {("A", 1): row_a, ("A", 2): dict(row_a, ns=3, ew=4), ("B", 1): row_b}
+    with BWSStore(path) as store:
+        store.write_tables(tables)
+    with BWSStore(path) as store:
+        assert store.load_tables() == tables
+        assert store.load_tables([1]) == {("A", 1): row_a, ("B", 1): row_b}
+        assert store.load_tables(section="B") == {("B", 1): row_b}
+
+        store.write_tables({("B", 2): row_b}, section="B")
+        assert store.load_tables(section="A") == {("A", 1): row_a, ("A", 2): dict(row_a, ns=3, ew=4)}
+        store.apply_delta({"tables": {("B", 1): dict(row_b, ew=13)}, "removed": [("A", 2)]})
+        assert store.load_tables() == {("A", 1): row_a, ("B", 1): dict(row_b, ew=13), ("B", 2): row_b}
+
+
+def test_load_selected_tables(tmp_path):
+    path = str(tmp_path / "event.bws")
+    client = BWSLiveClient()
+    client.create_bws_from_tournament(make_tournament())
+    client.save(path)
+
+    loaded = BWSLiveClient().load(path, tables=[2, 3])
+    assert sorted(loaded["tables"]) == [("A", 2), ("A", 3), ("B", 2), ("B", 3)]
+    assert loaded["tables"][("B", 2)] == {"sector": "B", "ns": 5, "ew": 105, "board_group": 5}
+
+
+def test_round_data_and_results():
+    movement = make_howell_movement()
+    with BWSStore(":memory:") as store:
+        store.write_movement(movement, "A", 7)
+        first = store.round_data("A", 1)
+        assert len(first) == 4
+        assert all(high - low == 2 for *_, low, high in first)
+        assert len(store.round_data("A")) == 28
+
+        first_id = store.add_result(1, 1, 2, "4S", "N", "=")
+        store.add_result(2, 1, 2, "3NT", "S", "+1")
+        store.erase_result(1, 1, 2)
+        rows = store.results()
+        assert [row["Erased"] for row in rows] == [0, 0, 1]
+        assert [row["Board"] for row in store.results(since_id=first_id)] == [2, 1]
@@ -1,10 +1,11 @@
 """Scoring utilities for tournament calculator.
 
 This package contains a `ScoreCalculator` which consumes a validated
-`Tournament` and a BWS representation to compute match/board scores. The
-implementation here is a placeholder API; replace scoring logic with real
-bridge scoring algorithms as needed.
+`Tournament` and a BWS representation to compute match/board scores. Matchpoints
+are computed in batch (`ScoreCalculator.compute_matchpoints`) or live, one
+result row at a time (`LiveStandings`).
 """
 from .calculator import ScoreCalculator
+from .live import LiveStandings
 
-__all__ = ["ScoreCalculator"]
+__all__ = ["ScoreCalculator", "LiveStandings"]
@@ -1,6 +1,19 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, List, Optional
 
-from bridge_tc_library.structure.tournament import Tournament
+from bridge_tc_library.structure.tournament import Tournament, Table
+
+from .matchpoints import score_matchpoints, pair_totals
+from .live import LiveStandings
+from .imps import score_butler, score_cross_imps
+from .contract import raw_scores
+
+
+def tournament_tables(tournament: Tournament) -> Iterable[Table]:
+    """Tables of a tournament, either listed directly or collected from its sectors."""
+    tables = getattr(tournament, "tables", None)
+    if tables is not None:
+        return tables
+    return [t for sector in getattr(tournament, "sectors", []) for t in sector.tables]
 
 
 class ScoreCalculator:
@@ -11,25 +24,64 @@ class ScoreCalculator:
     BWS mapping describing boards and pair assignments.
     """
 
-    def __init__(self) -> None:
-        pass
+    def __init__(self, points_per_win: int = 2) -> None:
+        self.points_per_win = points_per_win
 
     def compute_scores(self, tournament: Tournament, bws_data: Dict[str, Any]) -> Dict[int, List[Dict[str, Any]]]:
         """Return a mapping from table_id to a list of computed score entries.
 
-        The returned structure is intentionally generic; replace with your
-        application's canonical score model.
+        Result rows are read from ``bws_data["results"]`` (see
+        `bridge_tc_library.scoring.matchpoints` for the row format) and are
+        assigned to tables through their ``table`` key.
         """
-        # Placeholder: return empty scores for each table
         out: Dict[int, List[Dict[str, Any]]] = {}
-        for t in getattr(tournament, "tables", []):
+        for t in tournament_tables(tournament):
             out[t.table_id] = []
+        for row in self.compute_matchpoints(bws_data.get("results", [])):
+            if row.get("table") is not None:
+                out.setdefault(row["table"], []).append(row)
         return out
 
-    def compute_matchpoints(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Example helper to compute matchpoints from raw result rows.
+    def compute_raw_scores(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Fill in the NS ``score`` of result rows from contract, declarer and tricks.
+
+        See `bridge_tc_library.scoring.contract` for the row format; the
+        output feeds `compute_matchpoints` and `compute_imps` directly.
+        """
+        return raw_scores(results)
+
+    def compute_matchpoints(self, results: List[Dict[str, Any]], results_per_board: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Matchpoint all boards in `results` in one batch.
+
+        Each board is sorted once; ties share points, boards with fewer
+        results are factored to the common top (Neuberg) and adjusted rows
+        receive A+/A/A- (60/50/40%).
+        """
+        return score_matchpoints(results, self.points_per_win, results_per_board)
+
+    def compute_imps(self, results: List[Dict[str, Any]], mode: str = "butler", trim_percent: float = 10) -> List[Dict[str, Any]]:
+        """IMP all boards in `results` in one batch.
+
+        mode="butler" compares each score with its board's datum (average
+        without the top and bottom `trim_percent` percent); mode="cross"
+        cross-IMPs each score against every other score on the board.
+        """
+        if mode == "butler":
+            return score_butler(results, trim_percent)
+        if mode == "cross":
+            return score_cross_imps(results)
+        raise ValueError(f"Unknown IMP scoring mode {mode!r}, expected 'butler' or 'cross'")
+
+    def compute_standings(self, results: List[Dict[str, Any]], results_per_board: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Rank pairs by matchpoint percentage over the boards in `results`."""
+        totals = pair_totals(self.compute_matchpoints(results, results_per_board))
+        ranking = sorted(totals.items(), key=lambda item: (-item[1]["pct"], item[0]))
+        return [dict(entry, pair=pair_id, rank=rank) for rank, (pair_id, entry) in enumerate(ranking, start=1)]
+
+    def live_standings(self, results_per_board: Optional[int] = None) -> LiveStandings:
+        """Start an incremental scoring session fed one result row at a time.
 
-        Replace with accurate scoring logic for IMPs/MPs/percentages.
+        Rows are submitted, corrected and removed on the returned
+        `LiveStandings`; standings can be read at any moment.
         """
-        # trivial pass-through for now
-        return results
+        return LiveStandings(self.points_per_win, results_per_board)
@@ -0,0 +1,173 @@
+"""Raw bridge scores from contract, declarer, vulnerability and tricks.
+
+Every possible outcome is precomputed once into `SCORE_TABLE`, a flat list
+indexed by (level, strain, doubled state, vulnerability, tricks taken), and
+board numbers map to vulnerability and dealer through the 16-board cycle in
+`BOARD_VULNERABILITY` / `BOARD_DEALER`. Scoring a batch reads the rows into
+columns once (contract strings are parsed once per distinct string), then
+computes every table index and gathers the scores in one pass, vectorized
+with numpy when it is installed (the ``fast`` extra).
+
+Rows carry ``board``, ``contract`` (``"4S"``, ``"3NTX"``, ``"6 H xx"``,
+``"PASS"``), ``declarer`` (``"N"``, ``"E"``, ``"S"``, ``"W"``) and either
+``tricks`` (tricks taken) or ``result`` (``"="``, ``"+1"``, ``"-2"`` or an int
+relative to the contract).
+"""
+import re
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency: pip install bridge-tc-library[fast]
+    np = None
+
+STRAINS = ("C", "D", "H", "S", "NT")
+DOUBLED = ("", "X", "XX")
+DIRECTIONS = "NESW"
+
+# vulnerability of boards 1..16: (NS vulnerable, EW vulnerable)
+BOARD_VULNERABILITY: Tuple[Tuple[bool, bool], ...] = tuple(
+    {"-": (False, False), "NS": (True, False), "EW": (False, True), "ALL": (True, True)}[v]
+    for v in ("-", "NS", "EW", "ALL", "NS", "EW", "ALL", "-", "EW", "ALL", "-", "NS", "ALL", "-", "NS", "EW")
+)
+BOARD_DEALER: Tuple[str, ...] = tuple(DIRECTIONS[i % 4] for i in range(16))
+
+_CONTRACT_RE = re.compile(r"^([1-7])(C|D|H|S|NT|N)(X{0,2})$")
+
+
+def _score(level: int, strain: int, doubled: int, vulnerable: bool, tricks: int) -> int:
+    """Declarer's score for one outcome."""
+    needed = level + 6
+    if tricks < needed:
+        down = needed - tricks
+        if doubled == 0:
+            return -down * (100 if vulnerable else 50)
+        if vulnerable:
+            penalty = 200 + 300 * (down - 1)
+        else:
+            penalty = 100 + 200 * min(down - 1, 2) + 300 * max(down - 3, 0)
+        return -penalty * doubled
+
+    multiplier = (1, 2, 4)[doubled]
+    per_trick = 20 if strain < 2 else 30
+    trick_score = (per_trick * level + (10 if strain == 4 else 0)) * multiplier
+    score = trick_score
+    score += (500 if vulnerable else 300) if trick_score >= 100 else 50
+    if level == 6:
+        score += 750 if vulnerable else 500
+    elif level == 7:
+        score += 1500 if vulnerable else 1000
+    score += (0, 50, 100)[doubled]
+
+    over = tricks - needed
+    if doubled == 0:
+        score += over * per_trick
+    else:
+        score += over * (200 if vulnerable else 100) * doubled
+    return score
+
+
+def _index(level: int, strain: int, doubled: int, vulnerable: bool, tricks: int) -> int:
+    return ((((level - 1) * len(STRAINS) + strain) * len(DOUBLED) + doubled) * 2 + vulnerable) * 14 + tricks
+
+
+SCORE_TABLE: List[int] = [0] * (7 * len(STRAINS) * len(DOUBLED) * 2 * 14)
+for _level in range(1, 8):
+    for _strain in range(len(STRAINS)):
+        for _doubled in range(len(DOUBLED)):
+            for _vul in (False, True):
+                for _tricks in range(14):
+                    SCORE_TABLE[_index(_level, _strain, _doubled, _vul, _tricks)] = _score(_level, _strain, _doubled, _vul, _tricks)
+
+if np is not None:
+    _SCORE_ARRAY = np.asarray(SCORE_TABLE, dtype=np.int64)
+    _VULNERABILITY_ARRAY = np.asarray(BOARD_VULNERABILITY, dtype=np.int64)
+
+
+def parse_contract(contract: str) -> Optional[Tuple[int, int, int]]:
+    """``"3NTX"`` -> (level, strain index, doubled state); None for a passed-out board."""
+    text = contract.replace(" ", "").upper()
+    if text in ("PASS", "P", "AP", ""):
+        return None
+    match = _CONTRACT_RE.match(text)
+    if match is None:
+        raise ValueError(f"Invalid contract {contract!r}")
+    level, strain, doubled = match.groups()
+    return int(level), STRAINS.index("NT" if strain == "N" else strain), len(doubled)
+
+
+def board_vulnerability(board: int) -> Tuple[bool, bool]:
+    return BOARD_VULNERABILITY[(board - 1) % 16]
+
+
+def board_dealer(board: int) -> str:
+    return BOARD_DEALER[(board - 1) % 16]
+
+
+def contract_score(contract: str, declarer: str, board: int, tricks: int) -> int:
+    """NS score of a single result."""
+    return raw_scores([{"contract": contract, "declarer": declarer, "board": board, "tricks": tricks}])[0]["score"]
+
+
+def _tricks(row: Dict[str, Any], level: int) -> int:
+    if row.get("tricks") is not None:
+        return row["tricks"]
+    result = row["result"]
+    if isinstance(result, str):
+        result = 0 if result.strip() in ("=", "") else int(result)
+    return level + 6 + result
+
+
+def _lookup(bases: Sequence[int], sides: Sequence[int], boards: Sequence[int], tricks: Sequence[int]) -> List[int]:
+    """NS scores of played results given as columns.
+
+    ``bases[i]`` is ``_index`` of the contract and declaring side with
+    vulnerability and tricks left at 0 (see `_declaration`); `sides` is 0 when
+    NS declares.
+    """
+    if np is None:
+        out = []
+        for base, side, board, taken in zip(bases, sides, boards, tricks):
+            if not 0 <= taken <= 13:
+                raise ValueError(f"Invalid number of tricks {taken} on board {board}")
+            score = SCORE_TABLE[base + BOARD_VULNERABILITY[(board - 1) % 16][side] * 14 + taken]
+            out.append(score if side == 0 else -score)
+        return out
+
+    taken = np.asarray(tricks, dtype=np.int64)
+    bad = np.flatnonzero((taken < 0) | (taken > 13))
+    if len(bad):
+        raise ValueError(f"Invalid number of tricks {tricks[bad[0]]} on board {boards[bad[0]]}")
+    side = np.asarray(sides, dtype=np.int64)
+    vulnerable = _VULNERABILITY_ARRAY[(np.asarray(boards, dtype=np.int64) - 1) % 16, side]
+    scores = _SCORE_ARRAY[np.asarray(bases, dtype=np.int64) + vulnerable * 14 + taken]
+    return np.where(side == 0, scores, -scores).tolist()
+
+
+def _declaration(contract: str, declarer: str) -> Optional[Tuple[int, int, int]]:
+    """(level, table index base, declaring side) of a contract, None when passed out."""
+    spec = parse_contract(contract)
+    if spec is None:
+        return None
+    level, strain, doubled = spec
+    return level, _index(level, strain, doubled, False, 0), DIRECTIONS.index(declarer.upper()) % 2
+
+
+def raw_scores(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Copy of `rows` with the NS ``score`` of each result filled in."""
+    rows = list(rows)
+    keys = [(row["contract"], row["declarer"]) for row in rows]
+    # a session repeats a few dozen contract/declarer pairs; each is parsed once
+    declarations = {key: _declaration(*key) for key in set(keys)}
+    specs = [declarations[key] for key in keys]
+    played = [idx for idx, spec in enumerate(specs) if spec is not None]
+
+    bases = [specs[idx][1] for idx in played]
+    sides = [specs[idx][2] for idx in played]
+    boards = [rows[idx]["board"] for idx in played]
+    tricks = [_tricks(rows[idx], specs[idx][0]) for idx in played]
+
+    scores = [0] * len(rows)
+    for idx, score in zip(played, _lookup(bases, sides, boards, tricks)):
+        scores[idx] = score
+    return [dict(row, score=score) for row, score in zip(rows, scores)]
@@ -0,0 +1,207 @@
+"""IMP scoring: cross-IMPs and Butler (datum) scoring.
+
+Rows use the format of `bridge_tc_library.scoring.matchpoints`. Point
+differences are converted with `IMP_TABLE`, a lookup indexed by
+``difference // 10``. Cross-IMPs do not compare every pair of scores: a
+score's total against the board equals, for every step of the IMP scale, the
+number of scores at least that step below it minus those at least that step
+above it, which two bisections on the sorted board give directly.
+
+With numpy installed (the ``fast`` extra) a session is scored in one batch,
+as in `bridge_tc_library.scoring.matchpoints`: one lexsort groups the scores
+by board, Butler datums are trimmed means taken from running sums, and all
+differences go through a single search of `IMP_SCALE`.
+"""
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency: pip install bridge-tc-library[fast]
+    np = None
+
+from .matchpoints import group_by_board, is_adjusted
+
+IMP_SCALE = (20, 50, 90, 130, 170, 220, 270, 320, 370, 430, 500, 600, 750, 900,
+             1100, 1300, 1500, 1750, 2000, 2250, 2500, 3000, 3500, 4000)
+
+# IMP_TABLE[d // 10] is the IMP value of a difference of d points
+IMP_TABLE = [bisect_right(IMP_SCALE, 10 * i) for i in range(IMP_SCALE[-1] // 10 + 1)]
+
+AVERAGE_IMPS: Dict[str, int] = {"A+": 3, "A": 0, "A-": -3}
+
+
+def imps(difference: float) -> int:
+    """IMPs won by a side `difference` points better than the comparison."""
+    idx = min(int(abs(difference)) // 10, len(IMP_TABLE) - 1)
+    return IMP_TABLE[idx] if difference >= 0 else -IMP_TABLE[idx]
+
+
+def butler_datum(scores: List[int], trim_percent: float = 10) -> int:
+    """Average NS score without the top and bottom `trim_percent` percent, rounded to 10."""
+    ordered = sorted(scores)
+    trim = int(len(ordered) * trim_percent / 100)
+    if len(ordered) - 2 * trim < 1:
+        trim = (len(ordered) - 1) // 2
+    kept = ordered[trim:len(ordered) - trim]
+    mean = sum(kept) / len(kept)
+    return int((mean / 10 + 0.5) // 1) * 10
+
+
+def cross_imps(ordered: List[int], score: int) -> int:
+    """Sum of IMPs of `score` against every score in the sorted board `ordered`."""
+    total = 0
+    n = len(ordered)
+    for step in IMP_SCALE:
+        total += bisect_right(ordered, score - step) - (n - bisect_left(ordered, score + step))
+    return total
+
+
+def _board_groups(boards, scores):
+    """Sort order of (board, score) and, per sorted row, the bounds of its board."""
+    board_arr = np.asarray(boards, dtype=np.int64)
+    score_arr = np.asarray(scores, dtype=np.int64)
+    count = len(score_arr)
+    order = np.lexsort((score_arr, board_arr))
+    sorted_boards = board_arr[order]
+    new_board = np.empty(count, dtype=bool)
+    new_board[0] = True
+    new_board[1:] = sorted_boards[1:] != sorted_boards[:-1]
+    starts = np.flatnonzero(new_board)
+    group = np.cumsum(new_board) - 1
+    ends = np.append(starts[1:], count)
+    return order, score_arr[order], group, starts[group], ends[group]
+
+
+def _imps_of(differences):
+    values = np.searchsorted(np.asarray(IMP_SCALE), np.abs(differences), side="right")
+    return np.where(differences >= 0, values, -values)
+
+
+def batch_butler(boards: Sequence[int], scores: Sequence[int], trim_percent: float = 10) -> Tuple[List[int], List[int]]:
+    """Butler datum of each score's board and the NS IMPs of the score against it.
+
+    `boards[i]` is the board of `scores[i]`. Uses numpy when available.
+    """
+    if np is None:
+        by_board: Dict[int, List[int]] = {}
+        for idx, board in enumerate(boards):
+            by_board.setdefault(board, []).append(idx)
+        datums, ns_imps = [0] * len(scores), [0] * len(scores)
+        for idxs in by_board.values():
+            datum = butler_datum([scores[i] for i in idxs], trim_percent)
+            for i in idxs:
+                datums[i], ns_imps[i] = datum, imps(scores[i] - datum)
+        return datums, ns_imps
+
+    if not len(scores):
+        return [], []
+    order, ordered, _, start, end = _board_groups(boards, scores)
+    played = end - start
+    trim = (played * trim_percent / 100).astype(np.int64)
+    trim = np.where(played - 2 * trim < 1, (played - 1) // 2, trim)
+    sums = np.concatenate(([0], np.cumsum(ordered)))
+    mean = (sums[end - trim] - sums[start + trim]) / (played - 2 * trim)
+    datum = (np.floor(mean / 10 + 0.5) * 10).astype(np.int64)
+
+    datums = np.empty(len(ordered), dtype=np.int64)
+    datums[order] = datum
+    return datums.tolist(), _imps_of(np.asarray(scores, dtype=np.int64) - datums).tolist()
+
+
+def batch_cross_imps(boards: Sequence[int], scores: Sequence[int]) -> Tuple[List[float], List[int]]:
+    """Cross-IMPs of each score per comparison, and the number of comparisons on its board.
+
+    `boards[i]` is the board of `scores[i]`. Uses numpy when available: the
+    scores of each board sit in their own band of one sorted key array, so the
+    bisections of every score for every step of the scale are one search.
+    """
+    if np is None:
+        by_board: Dict[int, List[int]] = {}
+        for idx, board in enumerate(boards):
+            by_board.setdefault(board, []).append(idx)
+        averages, counts = [0.0] * len(scores), [0] * len(scores)
+        for idxs in by_board.values():
+            ordered = sorted(scores[i] for i in idxs)
+            comparisons = len(ordered) - 1
+            # boards repeat a handful of distinct scores; each is bisected once
+            per_score = {score: cross_imps(ordered, score) / comparisons if comparisons else 0.0 for score in set(ordered)}
+            for i in idxs:
+                averages[i], counts[i] = per_score[scores[i]], comparisons
+        return averages, counts
+
+    if not len(scores):
+        return [], []
+    order, ordered, group, start, end = _board_groups(boards, scores)
+    steps = np.asarray(IMP_SCALE, dtype=np.int64)
+    # band b holds board b's scores shifted clear of its neighbours by the largest step
+    low = int(ordered.min()) - int(steps[-1])
+    span = int(ordered.max()) + int(steps[-1]) - low + 1
+    keys = group * span + (ordered - low)
+    below = np.searchsorted(keys, keys[:, None] - steps, side="right") - start[:, None]
+    above = end[:, None] - np.searchsorted(keys, keys[:, None] + steps, side="left")
+    totals = (below - above).sum(axis=1)
+    comparisons = end - start - 1
+    average = np.where(comparisons > 0, totals / np.maximum(comparisons, 1), 0.0)
+
+    averages = np.empty(len(ordered), dtype=np.float64)
+    counts = np.empty(len(ordered), dtype=np.int64)
+    averages[order] = average
+    counts[order] = comparisons
+    return averages.tolist(), counts.tolist()
+
+
+def _with_adjusted(rows, scored_real, extra):
+    """Merge IMP results of real rows with adjusted rows, keeping board order."""
+    out = []
+    real = iter(scored_real)
+    for row in rows:
+        if is_adjusted(row):
+            ns_award, ew_award = row.get("adjusted") or ("A", "A")
+            out.append(dict(row, ns_imps=AVERAGE_IMPS[ns_award], ew_imps=AVERAGE_IMPS[ew_award], **extra))
+        else:
+            out.append(next(real))
+    return out
+
+
+def _real_rows(results: Iterable[Dict[str, Any]]) -> Tuple[List[Tuple[int, List[Dict[str, Any]]]], List[Dict[str, Any]]]:
+    """Boards in order with their rows, and the real rows of all of them in the same order."""
+    boards = sorted(group_by_board(results).items())
+    return boards, [row for _, rows in boards for row in rows if not is_adjusted(row)]
+
+
+def score_butler(results: Iterable[Dict[str, Any]], trim_percent: float = 10) -> List[Dict[str, Any]]:
+    """IMP every real score against its board's Butler datum.
+
+    Returned rows are grouped by board and carry ``datum``, ``ns_imps`` and
+    ``ew_imps``; adjusted rows get A+/A/A- as +3/0/-3 IMPs.
+    """
+    boards, real = _real_rows(results)
+    datums, ns_imps = batch_butler([row["board"] for row in real], [row["score"] for row in real], trim_percent)
+    scored_real = iter([dict(row, datum=d, ns_imps=i, ew_imps=-i) for row, d, i in zip(real, datums, ns_imps)])
+
+    scored: List[Dict[str, Any]] = []
+    for _, rows in boards:
+        board_real = [next(scored_real) for row in rows if not is_adjusted(row)]
+        datum = board_real[0]["datum"] if board_real else None
+        scored.extend(_with_adjusted(rows, board_real, {"datum": datum}))
+    return scored
+
+
+def score_cross_imps(results: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Cross-IMP every real score against all other real scores on its board.
+
+    ``ns_imps`` is the cross-IMP total divided by the number of comparisons,
+    so boards played a different number of times weigh the same;
+    ``comparisons`` holds that number.
+    """
+    boards, real = _real_rows(results)
+    averages, counts = batch_cross_imps([row["board"] for row in real], [row["score"] for row in real])
+    scored_real = iter([dict(row, comparisons=c, ns_imps=a, ew_imps=-a) for row, a, c in zip(real, averages, counts)])
+
+    scored: List[Dict[str, Any]] = []
+    for _, rows in boards:
+        board_real = [next(scored_real) for row in rows if not is_adjusted(row)]
+        comparisons = board_real[0]["comparisons"] if board_real else -1
+        scored.extend(_with_adjusted(rows, board_real, {"comparisons": comparisons}))
+    return scored
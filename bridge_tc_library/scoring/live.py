@@ -0,0 +1,232 @@
+"""Incremental matchpoint standings maintained one result row at a time.
+
+Each board keeps its real scores in an `OrderedMultiset` and the pair
+ranking is one as well, so every insertion, removal and rank query is
+O(log n). Only rows whose matchpoints can change are rescored: a correction
+that keeps the number of results on a board rescores the rows scoring
+between the old and the new score, while a new or removed result rescores
+the board (its Neuberg factor changes). Changes are summed per pair and each
+affected pair is moved in the ranking once.
+Row format and scoring rules are those of `bridge_tc_library.scoring.matchpoints`.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .matchpoints import AVERAGES, is_adjusted, neuberg
+from .ordered import OrderedMultiset
+
+ResultKey = Tuple[int, int, int]
+Award = Tuple[float, float, float]
+
+
+class _BoardState:
+    __slots__ = ("scores", "by_score", "rows", "awards")
+
+    def __init__(self) -> None:
+        self.scores = OrderedMultiset()
+        # score -> keys of the real rows with that score
+        self.by_score: Dict[int, Dict[ResultKey, None]] = {}
+        self.rows: Dict[ResultKey, Dict[str, Any]] = {}
+        # key -> (ns_mp, ew_mp, top) currently credited to the pairs
+        self.awards: Dict[ResultKey, Award] = {}
+
+    def add_score(self, key: ResultKey, score: int) -> None:
+        self.scores.add(score)
+        self.by_score.setdefault(score, {})[key] = None
+
+    def drop_score(self, key: ResultKey, score: int) -> None:
+        self.scores.remove(score)
+        keys = self.by_score[score]
+        del keys[key]
+        if not keys:
+            del self.by_score[score]
+
+
+class LiveStandings:
+    """Matchpoint standings updated per result row.
+
+    `results_per_board` fixes the common top; when omitted the most played
+    board so far is used and all boards are rescored when that count changes.
+    """
+
+    def __init__(self, points_per_win: int = 2, results_per_board: Optional[int] = None) -> None:
+        self.points_per_win = points_per_win
+        self.results_per_board = results_per_board
+        self._expected = results_per_board or 1
+        self._boards: Dict[int, _BoardState] = {}
+        # number of rows -> number of boards with that many rows
+        self._sizes: Dict[int, int] = {}
+        # pair_id -> [mp, top, boards]
+        self._pairs: Dict[int, List[float]] = {}
+        # (-pct, pair_id) of every pair, and each pair's current key
+        self._ranking = OrderedMultiset()
+        self._rank_keys: Dict[int, Tuple[float, int]] = {}
+
+    @staticmethod
+    def key(row: Dict[str, Any]) -> ResultKey:
+        return row["board"], row["ns"], row["ew"]
+
+    def submit(self, row: Dict[str, Any]) -> None:
+        """Insert a result, or correct it if a row for the same board and pairs exists."""
+        board_no, _, _ = key = self.key(row)
+        board = self._boards.setdefault(board_no, _BoardState())
+        old = board.rows.get(key)
+        played = len(board.scores)
+        if old is not None and not is_adjusted(old):
+            board.drop_score(key, old["score"])
+        board.rows[key] = dict(row)
+        if not is_adjusted(row):
+            board.add_score(key, row["score"])
+
+        deltas: Dict[int, List[float]] = {}
+        if old is None and self._resize(len(board.rows) - 1, len(board.rows)):
+            for other in self._boards.values():
+                self._rescore(other, deltas)
+        elif len(board.scores) != played:
+            self._rescore(board, deltas)
+        else:
+            changed = [key]
+            if not is_adjusted(row):
+                low, high = sorted((old["score"], row["score"]))
+                changed += [other for score, _ in board.scores.items(low, high) for other in board.by_score[score]]
+            self._rescore(board, deltas, changed)
+        self._apply(deltas)
+
+    def remove(self, board_no: int, ns: int, ew: int) -> None:
+        """Delete the result of `ns` vs `ew` on `board_no`."""
+        board = self._boards.get(board_no)
+        key = (board_no, ns, ew)
+        if board is None or key not in board.rows:
+            raise KeyError(f"No result for board {board_no}, {ns} vs {ew}")
+        old = board.rows.pop(key)
+        if not is_adjusted(old):
+            board.drop_score(key, old["score"])
+        deltas: Dict[int, List[float]] = {}
+        self._credit(deltas, old, board.awards.pop(key), -1)
+        if not board.rows:
+            del self._boards[board_no]
+
+        if self._resize(len(board.rows) + 1, len(board.rows)):
+            for other in self._boards.values():
+                self._rescore(other, deltas)
+        elif not is_adjusted(old):
+            self._rescore(board, deltas)
+        self._apply(deltas)
+
+    def _resize(self, old_size: int, new_size: int) -> bool:
+        """Track a board going from `old_size` to `new_size` rows; True if the common top changed."""
+        sizes = self._sizes
+        if old_size:
+            sizes[old_size] -= 1
+            if not sizes[old_size]:
+                del sizes[old_size]
+        if new_size:
+            sizes[new_size] = sizes.get(new_size, 0) + 1
+        if self.results_per_board is not None:
+            return False
+        # sizes move by one, so the largest is new_size or, when old_size was the last of its kind, old_size - 1
+        expected = self._expected
+        if new_size > expected:
+            expected = new_size
+        elif old_size == expected and old_size not in sizes:
+            expected = max(old_size - 1, 1)
+        changed = expected != self._expected
+        self._expected = expected
+        return changed
+
+    def _awards(self, board: _BoardState, keys: Optional[Iterable[ResultKey]]) -> Iterable[Tuple[ResultKey, Award]]:
+        ppw = self.points_per_win
+        expected = self._expected
+        top = ppw * (expected - 1)
+        played = len(board.scores)
+
+        def real(score: int, below: int, ties: int) -> Award:
+            ns_mp = ppw * below + ppw / 2 * ties
+            if played != expected:
+                ns_mp = neuberg(ns_mp, played, expected, ppw)
+            return ns_mp, top - ns_mp, top
+
+        def adjusted(row: Dict[str, Any]) -> Award:
+            ns_award, ew_award = row.get("adjusted") or ("A", "A")
+            return top * AVERAGES[ns_award], top * AVERAGES[ew_award], top
+
+        if keys is None:
+            # whole board: walk the scores in order, counting the ones below
+            below = 0
+            for score, count in board.scores.items():
+                award = real(score, below, count - 1)
+                for key in board.by_score[score]:
+                    yield key, award
+                below += count
+            for key, row in board.rows.items():
+                if is_adjusted(row):
+                    yield key, adjusted(row)
+            return
+
+        for key in keys:
+            row = board.rows[key]
+            if is_adjusted(row):
+                yield key, adjusted(row)
+            else:
+                score = row["score"]
+                yield key, real(score, board.scores.count_less(score), board.scores.count(score) - 1)
+
+    def _rescore(self, board: _BoardState, deltas: Dict[int, List[float]], keys: Optional[Iterable[ResultKey]] = None) -> None:
+        """Recompute the awards of `keys` (every row when None), collecting per-pair changes in `deltas`."""
+        for key, award in self._awards(board, keys):
+            old = board.awards.get(key)
+            if old != award:
+                row = board.rows[key]
+                if old is not None:
+                    self._credit(deltas, row, old, -1)
+                self._credit(deltas, row, award, 1)
+                board.awards[key] = award
+
+    @staticmethod
+    def _credit(deltas: Dict[int, List[float]], row: Dict[str, Any], award: Award, sign: int) -> None:
+        ns_mp, ew_mp, top = award
+        for pair_id, mp in ((row["ns"], ns_mp), (row["ew"], ew_mp)):
+            delta = deltas.get(pair_id)
+            if delta is None:
+                delta = deltas[pair_id] = [0.0, 0.0, 0]
+            delta[0] += sign * mp
+            delta[1] += sign * top
+            delta[2] += sign
+
+    def _apply(self, deltas: Dict[int, List[float]]) -> None:
+        """Add per-pair changes to the totals and move each changed pair in the ranking once."""
+        for pair_id, (mp, top, boards) in deltas.items():
+            entry = self._pairs.get(pair_id)
+            if entry is None:
+                entry = self._pairs[pair_id] = [0.0, 0.0, 0]
+            else:
+                self._ranking.remove(self._rank_keys.pop(pair_id))
+            entry[0] += mp
+            entry[1] += top
+            entry[2] += boards
+            if entry[2]:
+                rank_key = self._rank_keys[pair_id] = (-self._pct(entry), pair_id)
+                self._ranking.add(rank_key)
+            else:
+                del self._pairs[pair_id]
+
+    @staticmethod
+    def _pct(entry: List[float]) -> float:
+        return 100.0 * entry[0] / entry[1] if entry[1] else 50.0
+
+    def pair(self, pair_id: int) -> Dict[str, float]:
+        mp, top, boards = self._pairs[pair_id]
+        return {"mp": mp, "top": top, "pct": self._pct(self._pairs[pair_id]), "boards": boards}
+
+    def standings(self) -> List[Dict[str, Any]]:
+        """Current ranking, best percentage first."""
+        return [dict(self.pair(pair_id), pair=pair_id, rank=rank) for rank, (_, pair_id) in enumerate(self._ranking, start=1)]
+
+    def scored_rows(self) -> List[Dict[str, Any]]:
+        """Every current row with the matchpoints it is credited with."""
+        out = []
+        for board_no in sorted(self._boards):
+            board = self._boards[board_no]
+            for key, row in board.rows.items():
+                ns_mp, ew_mp, top = board.awards[key]
+                out.append(dict(row, ns_mp=ns_mp, ew_mp=ew_mp, top=top))
+        return out
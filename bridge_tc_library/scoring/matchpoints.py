@@ -0,0 +1,177 @@
+"""Matchpoint scoring for pairs events.
+
+Result rows are plain dicts:
+
+- ``board``: board number
+- ``ns`` / ``ew``: pair ids
+- ``score``: NS score in points (``None`` for an artificial result)
+- ``adjusted``: optional ``(ns_award, ew_award)`` with awards ``"A+"``, ``"A"``
+  or ``"A-"`` (60/50/40% of top); a row with ``adjusted`` takes no part in
+  the ranking of the board
+
+Scores on a board are sorted once and each result gets ``points_per_win``
+for every score it beats and half of that for every tie, so a board of n
+results costs O(n log n). Boards played fewer times than the rest are
+factored up to the common top with Neuberg's formula. With numpy installed
+(the ``fast`` extra) `score_matchpoints` ranks the scores of all boards in
+one vectorized batch; otherwise each board is ranked with bisection.
+"""
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency: pip install bridge-tc-library[fast]
+    np = None
+
+AVERAGES: Dict[str, float] = {"A+": 0.6, "A": 0.5, "A-": 0.4}
+
+
+def group_by_board(results: Iterable[Dict[str, Any]]) -> Dict[int, List[Dict[str, Any]]]:
+    boards: Dict[int, List[Dict[str, Any]]] = {}
+    for row in results:
+        boards.setdefault(row["board"], []).append(row)
+    return boards
+
+
+def is_adjusted(row: Dict[str, Any]) -> bool:
+    return row.get("adjusted") is not None or row.get("score") is None
+
+
+def neuberg(mp: float, played: int, expected: int, points_per_win: int = 2) -> float:
+    """Factor a board's matchpoints from `played` comparable results up to `expected`."""
+    half = points_per_win / 2
+    return (mp + half) * expected / played - half
+
+
+def matchpoints_against(ordered: List[int], score: int, points_per_win: int = 2) -> float:
+    """NS matchpoints of `score`, itself part of the sorted board scores `ordered`."""
+    below = bisect_left(ordered, score)
+    ties = bisect_right(ordered, score) - below - 1
+    return points_per_win * below + points_per_win / 2 * ties
+
+
+def board_matchpoints(scores: List[int], points_per_win: int = 2) -> List[float]:
+    """NS matchpoints of each score against the others on the same board."""
+    ordered = sorted(scores)
+    return [matchpoints_against(ordered, score, points_per_win) for score in scores]
+
+
+def batch_matchpoints(boards: Sequence[int], scores: Sequence[int], expected: int, points_per_win: int = 2) -> List[float]:
+    """NS matchpoints of each score against the other scores of its board, factored to `expected` results.
+
+    `boards[i]` is the board of `scores[i]`. Uses numpy when available: one
+    lexsort of (board, score) and group boundaries give every rank at once.
+    """
+    if np is None:
+        by_board: Dict[int, List[int]] = {}
+        for idx, board in enumerate(boards):
+            by_board.setdefault(board, []).append(idx)
+        out = [0.0] * len(scores)
+        for idxs in by_board.values():
+            mps = board_matchpoints([scores[i] for i in idxs], points_per_win)
+            played = len(idxs)
+            for i, mp in zip(idxs, mps):
+                out[i] = neuberg(mp, played, expected, points_per_win) if played != expected else mp
+        return out
+
+    board_arr = np.asarray(boards, dtype=np.int64)
+    score_arr = np.asarray(scores, dtype=np.int64)
+    count = len(score_arr)
+    if not count:
+        return []
+    order = np.lexsort((score_arr, board_arr))
+    sorted_boards, sorted_scores = board_arr[order], score_arr[order]
+
+    new_board = np.empty(count, dtype=bool)
+    new_board[0] = True
+    new_board[1:] = sorted_boards[1:] != sorted_boards[:-1]
+    new_score = new_board.copy()
+    new_score[1:] |= sorted_scores[1:] != sorted_scores[:-1]
+
+    def bounds(starts_mask):
+        starts = np.flatnonzero(starts_mask)
+        group = np.cumsum(starts_mask) - 1
+        ends = np.append(starts[1:], count)
+        return starts[group], ends[group]
+
+    board_start, board_end = bounds(new_board)
+    score_start, score_end = bounds(new_score)
+    below = score_start - board_start
+    ties = score_end - score_start - 1
+    mps = points_per_win * below + points_per_win / 2 * ties
+
+    played = board_end - board_start
+    half = points_per_win / 2
+    factored = played != expected
+    mps = np.where(factored, (mps + half) * expected / played - half, mps)
+
+    out = np.empty(count, dtype=np.float64)
+    out[order] = mps
+    return out.tolist()
+
+
+def _score_rows(rows: List[Dict[str, Any]], expected: int, points_per_win: int, real_mps: Iterable[float]) -> List[Dict[str, Any]]:
+    top = points_per_win * (expected - 1)
+    mps = iter(real_mps)
+    scored = []
+    for row in rows:
+        if is_adjusted(row):
+            ns_award, ew_award = row.get("adjusted") or ("A", "A")
+            ns_mp, ew_mp = top * AVERAGES[ns_award], top * AVERAGES[ew_award]
+        else:
+            ns_mp = next(mps)
+            ew_mp = top - ns_mp
+        scored.append(dict(row, ns_mp=ns_mp, ew_mp=ew_mp, top=top))
+
+    for row in scored:
+        row["ns_pct"] = 100.0 * row["ns_mp"] / top if top else 50.0
+        row["ew_pct"] = 100.0 * row["ew_mp"] / top if top else 50.0
+    return scored
+
+
+def score_board(rows: List[Dict[str, Any]], expected: int, points_per_win: int = 2) -> List[Dict[str, Any]]:
+    """Score the rows of one board against a top of ``points_per_win * (expected - 1)``."""
+    real = [row["score"] for row in rows if not is_adjusted(row)]
+    mps = board_matchpoints(real, points_per_win)
+    if len(real) != expected:
+        mps = [neuberg(mp, len(real), expected, points_per_win) for mp in mps]
+    return _score_rows(rows, expected, points_per_win, mps)
+
+
+def score_matchpoints(results: Iterable[Dict[str, Any]], points_per_win: int = 2, results_per_board: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Score every board of a session in one batch.
+
+    `results_per_board` is the number of results each board should have; it
+    defaults to the most played board. Returned rows are copies of the input
+    rows, grouped by board, with ``ns_mp``, ``ew_mp``, ``top``, ``ns_pct`` and
+    ``ew_pct`` added.
+    """
+    boards = group_by_board(results)
+    if not boards:
+        return []
+    expected = results_per_board or max(len(rows) for rows in boards.values())
+    order = sorted(boards)
+    real = [(board, row["score"]) for board in order for row in boards[board] if not is_adjusted(row)]
+    mps = iter(batch_matchpoints([b for b, _ in real], [s for _, s in real], expected, points_per_win))
+
+    scored: List[Dict[str, Any]] = []
+    for board in order:
+        rows = boards[board]
+        board_mps = [next(mps) for row in rows if not is_adjusted(row)]
+        scored.extend(_score_rows(rows, expected, points_per_win, board_mps))
+    return scored
+
+
+def pair_totals(scored: Iterable[Dict[str, Any]]) -> Dict[int, Dict[str, float]]:
+    """Sum scored rows per pair into ``{pair_id: {"mp", "top", "pct", "boards"}}``."""
+    totals: Dict[int, Dict[str, float]] = {}
+    for row in scored:
+        for side in ("ns", "ew"):
+            entry = totals.setdefault(row[side], {"mp": 0.0, "top": 0.0, "pct": 0.0, "boards": 0})
+            entry["mp"] += row[f"{side}_mp"]
+            entry["top"] += row["top"]
+            entry["boards"] += 1
+    for entry in totals.values():
+        entry["pct"] = 100.0 * entry["mp"] / entry["top"] if entry["top"] else 50.0
+    return totals
@@ -0,0 +1,142 @@
+"""Ordered multiset with logarithmic updates and rank queries.
+
+`OrderedMultiset` is a treap (a binary search tree kept balanced by random
+node priorities) whose nodes carry a key, its multiplicity and the size of
+their subtree. Adding or removing a key and counting the keys below a value
+take O(log n) expected time; iterating keys from a lower bound costs
+O(log n) plus the number of keys returned. Keys must be mutually comparable
+and hashable.
+"""
+import random
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+
+class _Node:
+    __slots__ = ("key", "count", "size", "priority", "left", "right")
+
+    def __init__(self, key: Any) -> None:
+        self.key = key
+        self.count = 1
+        self.size = 1
+        self.priority = random.random()
+        self.left: Optional["_Node"] = None
+        self.right: Optional["_Node"] = None
+
+
+def _size(node: Optional[_Node]) -> int:
+    return node.size if node is not None else 0
+
+
+def _update(node: _Node) -> None:
+    node.size = node.count + _size(node.left) + _size(node.right)
+
+
+def _split(node: Optional[_Node], key: Any, inclusive: bool) -> Tuple[Optional[_Node], Optional[_Node]]:
+    """Split into keys below `key` (or up to it when `inclusive`) and the rest."""
+    if node is None:
+        return None, None
+    if node.key < key or (inclusive and node.key == key):
+        node.right, rest = _split(node.right, key, inclusive)
+        _update(node)
+        return node, rest
+    below, node.left = _split(node.left, key, inclusive)
+    _update(node)
+    return below, node
+
+
+def _merge(low: Optional[_Node], high: Optional[_Node]) -> Optional[_Node]:
+    """Join two treaps whose keys are all ordered `low` < `high`."""
+    if low is None:
+        return high
+    if high is None:
+        return low
+    if low.priority > high.priority:
+        low.right = _merge(low.right, high)
+        _update(low)
+        return low
+    high.left = _merge(low, high.left)
+    _update(high)
+    return high
+
+
+class OrderedMultiset:
+    """Keys in sorted order, each with a multiplicity."""
+
+    __slots__ = ("_root", "_nodes")
+
+    def __init__(self) -> None:
+        self._root: Optional[_Node] = None
+        self._nodes: Dict[Any, _Node] = {}
+
+    def __len__(self) -> int:
+        return _size(self._root)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._nodes
+
+    def __iter__(self) -> Iterator[Any]:
+        for key, count in self.items():
+            for _ in range(count):
+                yield key
+
+    def count(self, key: Any) -> int:
+        node = self._nodes.get(key)
+        return node.count if node is not None else 0
+
+    def _resize_path(self, key: Any, delta: int) -> None:
+        node = self._root
+        while node.key != key:
+            node.size += delta
+            node = node.left if key < node.key else node.right
+        node.count += delta
+        node.size += delta
+
+    def add(self, key: Any) -> None:
+        if key in self._nodes:
+            self._resize_path(key, 1)
+            return
+        node = self._nodes[key] = _Node(key)
+        below, rest = _split(self._root, key, False)
+        self._root = _merge(_merge(below, node), rest)
+
+    def remove(self, key: Any) -> None:
+        """Remove one occurrence of `key`; KeyError if it is absent."""
+        node = self._nodes[key]
+        if node.count > 1:
+            self._resize_path(key, -1)
+            return
+        del self._nodes[key]
+        below, rest = _split(self._root, key, False)
+        _, above = _split(rest, key, True)
+        self._root = _merge(below, above)
+
+    def count_less(self, key: Any) -> int:
+        """Number of keys (with multiplicity) strictly below `key`."""
+        node, below = self._root, 0
+        while node is not None:
+            if node.key < key:
+                below += _size(node.left) + node.count
+                node = node.right
+            else:
+                node = node.left
+        return below
+
+    def items(self, low: Any = None, high: Any = None) -> Iterator[Tuple[Any, int]]:
+        """(key, count) in order, limited to `low` <= key <= `high` when given."""
+        stack = []
+        node = self._root
+        while node is not None:
+            if low is not None and node.key < low:
+                node = node.right
+            else:
+                stack.append(node)
+                node = node.left
+        while stack:
+            node = stack.pop()
+            if high is not None and high < node.key:
+                return
+            yield node.key, node.count
+            node = node.right
+            while node is not None:
+                stack.append(node)
+                node = node.left
@@ -0,0 +1,76 @@
+import itertools
+
+import pytest
+
+from bridge_tc_library.scoring import ScoreCalculator, contract as contract_module
+from bridge_tc_library.scoring.contract import DIRECTIONS, _score, board_dealer, board_vulnerability, contract_score, raw_scores
+
+
+@pytest.mark.parametrize("contract, declarer, board, tricks, expected", [
+    ("4S", "N", 2, 10, 620),     # NS vulnerable game
+    ("3NT", "S", 1, 10, 430),
+    ("1NTX", "N", 1, 7, 180),
+    ("2H X", "N", 1, 8, 470),    # doubled into game
+    ("7NTXX", "N", 4, 13, 2980),
+    ("3NTX", "N", 2, 6, -800),
+    ("4SX", "N", 1, 6, -800),
+    ("6 D", "N", 1, 13, 940),
+    ("4H", "E", 3, 11, -650),    # EW vulnerable, score from NS view
+    ("4H", "W", 1, 9, 50),
+    ("PASS", "N", 1, 0, 0),
+])
+def test_contract_scores(contract, declarer, board, tricks, expected):
+    assert contract_score(contract, declarer, board, tricks) == expected
+
+
+def test_board_cycle():
+    assert board_vulnerability(1) == (False, False)
+    assert board_vulnerability(7) == (True, True)
+    assert board_vulnerability(17) == board_vulnerability(1)
+    assert [board_dealer(b) for b in (1, 2, 3, 4, 5)] == ["N", "E", "S", "W", "N"]
+
+
+def test_batch_with_relative_results():
+    rows = [
+        {"board": 1, "ns": 1, "ew": 2, "contract": "4S", "declarer": "N", "result": "+1"},
+        {"board": 1, "ns": 3, "ew": 4, "contract": "4 S", "declarer": "S", "result": "="},
+        {"board": 1, "ns": 5, "ew": 6, "contract": "5Dx", "declarer": "W", "result": -2},
+    ]
+    calc = ScoreCalculator()
+    scored = calc.compute_raw_scores(rows)
+    assert [r["score"] for r in scored] == [450, 420, 300]
+    assert [r["ns_mp"] for r in calc.compute_matchpoints(scored)] == [4, 2, 0]
+
+
+def test_invalid_contract():
+    with pytest.raises(ValueError):
+        contract_score("8NT", "N", 1, 13)
+
+
+def test_batch_matches_outcome_by_outcome(monkeypatch):
+    rows = [
+        {"board": board, "contract": f"{level}{strain}{doubled}", "declarer": declarer, "tricks": tricks}
+        for level, strain, doubled, declarer, board, tricks in itertools.product(
+            range(1, 8), ("C", "H", "NT"), ("", "X", "XX"), DIRECTIONS, (1, 2, 3, 4), (0, 7, 13))
+    ]
+    rows.append({"board": 5, "contract": "PASS", "declarer": "N", "tricks": 0})
+    scored = raw_scores(rows)
+    for row in scored[:-1]:
+        level, strain, doubled = contract_module.parse_contract(row["contract"])
+        side = DIRECTIONS.index(row["declarer"]) % 2
+        expected = _score(level, strain, doubled, board_vulnerability(row["board"])[side], row["tricks"])
+        assert row["score"] == (expected if side == 0 else -expected)
+    assert scored[-1]["score"] == 0
+
+    monkeypatch.setattr(contract_module, "np", None)
+    assert raw_scores(rows) == scored
+
+
+@pytest.mark.parametrize("numpy_path", [True, False])
+def test_invalid_tricks(monkeypatch, numpy_path):
+    if not numpy_path:
+        monkeypatch.setattr(contract_module, "np", None)
+    rows = [{"board": 1, "contract": "4S", "declarer": "N", "tricks": 10},
+            {"board": 7, "contract": "4S", "declarer": "N", "result": "+4"}]
+    with pytest.raises(ValueError, match="tricks 14 on board 7"):
+        raw_scores(rows)
@@ -0,0 +1,62 @@
+import itertools
+import random
+
+import pytest
+
+from bridge_tc_library.scoring import ScoreCalculator, imps as imps_module
+from bridge_tc_library.scoring.imps import IMP_SCALE, butler_datum, imps, score_butler, score_cross_imps
+
+
+def test_imp_scale_lookup():
+    assert [imps(d) for d in (0, 10, 20, 40, 50, 420, 430, 3990, 4000, 9000)] == [0, 0, 1, 1, 2, 9, 10, 23, 24, 24]
+    assert imps(-620) == -12
+    assert len(IMP_SCALE) == 24
+
+
+def test_butler_datum_trims_extremes():
+    scores = [-1100, 420, 450, 420, 400, 2000, 430, 420, 450, 420]
+    # 10% of 10 scores: drop one from each end
+    assert butler_datum(scores, trim_percent=10) == 430
+
+
+def test_cross_imps_match_pairwise_sum():
+    rng = random.Random(3)
+    results = [{"board": b, "ns": t, "ew": 50 + t, "score": rng.choice([-200, -100, 110, 140, 170, 420, 450, 620, 1430])}
+               for b in range(1, 4) for t in range(9)]
+    scored = ScoreCalculator().compute_imps(results, mode="cross")
+    for row in scored:
+        others = [r["score"] for r in results if r["board"] == row["board"] and r is not row and r["ns"] != row["ns"]]
+        assert row["ns_imps"] == pytest.approx(sum(imps(row["score"] - o) for o in others) / len(others))
+
+
+def test_butler_rows_and_adjusted():
+    results = [
+        {"board": 1, "ns": 1, "ew": 2, "score": 420},
+        {"board": 1, "ns": 3, "ew": 4, "score": -50},
+        {"board": 1, "ns": 5, "ew": 6, "score": None, "adjusted": ("A-", "A+")},
+    ]
+    scored = ScoreCalculator().compute_imps(results, mode="butler", trim_percent=0)
+    assert [(r["ns_imps"], r["ew_imps"]) for r in scored] == [(6, -6), (-6, 6), (-3, 3)]
+    assert scored[0]["datum"] == 190
+
+
+@pytest.mark.parametrize("trim_percent", [0, 10, 25, 50])
+def test_batch_matches_per_board(monkeypatch, trim_percent):
+    rng = random.Random(7)
+    results = [{"board": b, "ns": t, "ew": 50 + t, "score": rng.choice([-1400, -200, -100, 110, 140, 420, 450, 620, 1430, 2210])}
+               for b in range(1, 9) for t in range(rng.randint(1, 12))]
+    results.append({"board": 3, "ns": 90, "ew": 91, "score": None, "adjusted": ("A+", "A-")})
+    results.append({"board": 20, "ns": 92, "ew": 93, "score": None})
+    butler, cross = score_butler(results, trim_percent), score_cross_imps(results)
+    monkeypatch.setattr(imps_module, "np", None)
+    assert score_butler(results, trim_percent) == butler
+    assert score_cross_imps(results) == cross
+    for _, rows in itertools.groupby(butler, key=lambda row: row["board"]):
+        rows = [row for row in rows if row["score"] is not None]
+        if rows:
+            assert rows[0]["datum"] == butler_datum([row["score"] for row in rows], trim_percent)
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        ScoreCalculator().compute_imps([], mode="swiss")
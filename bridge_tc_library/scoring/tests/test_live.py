@@ -0,0 +1,94 @@
+import random
+
+import pytest
+
+from bridge_tc_library.scoring import ScoreCalculator
+
+
+def totals(standings):
+    return {s["pair"]: (round(s["mp"], 6), s["top"], s["boards"]) for s in standings}
+
+
+def test_live_matches_batch_after_edits():
+    rng = random.Random(7)
+    calc = ScoreCalculator()
+    live = calc.live_standings(results_per_board=6)
+    current = {}
+
+    for _ in range(400):
+        board, table = rng.randint(1, 8), rng.randint(0, 5)
+        key = (board, table, 100 + table)
+        if key in current and rng.random() < 0.3:
+            del current[key]
+            live.remove(*key)
+            continue
+        row = {"board": board, "ns": table, "ew": 100 + table, "score": rng.choice([-100, 50, 110, 140, 420, 620])}
+        if rng.random() < 0.05:
+            row["score"], row["adjusted"] = None, ("A+", "A-")
+        current[key] = row
+        live.submit(row)
+
+    expected = calc.compute_standings(list(current.values()), results_per_board=6)
+    assert totals(live.standings()) == totals(expected)
+    assert [s["pct"] for s in live.standings()] == pytest.approx([s["pct"] for s in expected])
+
+
+def test_growing_top_rescores_earlier_boards():
+    live = ScoreCalculator().live_standings()
+    live.submit({"board": 1, "ns": 1, "ew": 2, "score": 100})
+    live.submit({"board": 1, "ns": 3, "ew": 4, "score": 200})
+    live.submit({"board": 2, "ns": 1, "ew": 4, "score": 100})
+    live.submit({"board": 2, "ns": 3, "ew": 2, "score": 0})
+    live.submit({"board": 2, "ns": 5, "ew": 6, "score": 50})
+    assert live.pair(3)["top"] == 8
+    assert live.standings()[0]["pair"] == 2
+    assert live.pair(2)["mp"] == pytest.approx(7.5)
+
+
+def test_remove_unknown_result():
+    live = ScoreCalculator().live_standings()
+    with pytest.raises(KeyError):
+        live.remove(1, 1, 2)
+
+
+def result_key(row):
+    return row["board"], row["ns"], row["ew"]
+
+
+def test_removals_shrink_the_common_top():
+    rng = random.Random(11)
+    calc = ScoreCalculator()
+    live = calc.live_standings()
+    current = {}
+
+    for step in range(600):
+        board, table = rng.randint(1, 5), rng.randint(0, 7)
+        key = (board, table, 100 + table)
+        # remove more often in the second half so the most played board shrinks
+        if key in current and rng.random() < (0.3 if step < 300 else 0.8):
+            del current[key]
+            live.remove(*key)
+        else:
+            row = {"board": board, "ns": table, "ew": 100 + table, "score": rng.choice([-100, 50, 110, 140, 420])}
+            current[key] = row
+            live.submit(row)
+        if step % 50 == 0 or step == 599:
+            expected = calc.compute_matchpoints(list(current.values()))
+            got = {result_key(row): (row["ns_mp"], row["top"]) for row in live.scored_rows()}
+            assert got == pytest.approx({result_key(row): (row["ns_mp"], row["top"]) for row in expected})
+
+
+def test_correction_rescores_only_rows_in_between():
+    live = ScoreCalculator().live_standings(results_per_board=5)
+    for ns, score in enumerate([-100, 50, 110, 420, 620], start=1):
+        live.submit({"board": 1, "ns": ns, "ew": 10 + ns, "score": score})
+    before = {row["ns"]: row["ns_mp"] for row in live.scored_rows()}
+
+    changed = []
+    credit = live._credit
+    live._credit = lambda deltas, row, award, sign: (changed.append(row["ns"]), credit(deltas, row, award, sign))
+    live.submit({"board": 1, "ns": 2, "ew": 12, "score": 140})
+    after = {row["ns"]: row["ns_mp"] for row in live.scored_rows()}
+
+    assert sorted(set(changed)) == [2, 3]
+    assert {ns for ns in before if before[ns] != after[ns]} == {2, 3}
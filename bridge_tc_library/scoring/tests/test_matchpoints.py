@@ -0,0 +1,74 @@
+from types import SimpleNamespace
+
+import pytest
+
+from bridge_tc_library.scoring import ScoreCalculator, matchpoints
+from bridge_tc_library.structure.tournament import Table
+
+
+def row(board, ns, ew, score=None, adjusted=None, table=None):
+    return {"board": board, "ns": ns, "ew": ew, "score": score, "adjusted": adjusted, "table": table}
+
+
+def by_pair(scored):
+    return {r["ns"]: (r["ns_mp"], r["ew_mp"]) for r in scored}
+
+
+def test_ties_share_points():
+    calc = ScoreCalculator()
+    scored = calc.compute_matchpoints([row(1, 1, 2, 420), row(1, 3, 4, 420), row(1, 5, 6, 170), row(1, 7, 8, -50)])
+    assert by_pair(scored) == {1: (5, 1), 3: (5, 1), 5: (2, 4), 7: (0, 6)}
+    assert all(r["top"] == 6 for r in scored)
+
+
+def test_half_point_scale():
+    calc = ScoreCalculator(points_per_win=1)
+    scored = calc.compute_matchpoints([row(1, 1, 2, 100), row(1, 3, 4, 100), row(1, 5, 6, 50)])
+    assert by_pair(scored) == {1: (1.5, 0.5), 3: (1.5, 0.5), 5: (0, 2)}
+
+
+def test_unequal_tops_are_factored():
+    calc = ScoreCalculator()
+    results = [row(1, n, n + 1, s) for n, s in ((1, 100), (3, 200), (5, 300), (7, 400))]
+    results += [row(2, n, n + 1, s) for n, s in ((1, 100), (3, 200), (5, 300))]
+    scored = [r for r in calc.compute_matchpoints(results) if r["board"] == 2]
+    assert [r["ns_mp"] for r in scored] == pytest.approx([1 / 3, 3, 17 / 3])
+    assert all(r["top"] == 6 for r in scored)
+
+
+def test_averages():
+    calc = ScoreCalculator()
+    scored = calc.compute_matchpoints([row(1, 1, 2, 100), row(1, 3, 4, 200), row(1, 5, 6, adjusted=("A+", "A-"))])
+    adjusted = [r for r in scored if r["ns"] == 5][0]
+    assert (adjusted["ns_pct"], adjusted["ew_pct"]) == pytest.approx((60, 40))
+    # the remaining two results are factored up to a top of 4
+    assert by_pair(scored)[3] == pytest.approx((3.5, 0.5))
+
+
+def test_standings():
+    calc = ScoreCalculator()
+    results = [row(1, 1, 2, 420, table=1), row(1, 3, 4, 170, table=2)]
+    standings = calc.compute_standings(results)
+    assert [(s["pair"], s["rank"], s["pct"]) for s in standings[:2]] == [(1, 1, 100.0), (4, 2, 100.0)]
+
+
+def test_scores_per_table():
+    calc = ScoreCalculator()
+    tournament = SimpleNamespace(tables=[Table(1), Table(2), Table(3)])
+    results = [row(1, 1, 2, 420, table=1), row(1, 3, 4, 170, table=2), row(2, 1, 4, 100, table=1), row(2, 3, 2, -50)]
+    by_table = calc.compute_scores(tournament, {"results": results})
+    assert sorted(by_table) == [1, 2, 3]
+    assert [(r["board"], r["ns"], r["ns_mp"]) for r in by_table[1]] == [(1, 1, 2), (2, 1, 2)]
+    assert [(r["board"], r["ns"], r["ew_mp"]) for r in by_table[2]] == [(1, 3, 2)]
+    assert by_table[3] == []
+
+
+def test_batch_matches_per_board(monkeypatch):
+    pytest.importorskip("numpy")
+    calc = ScoreCalculator()
+    results = [row(b, t, 1000 + t, (t * 37 + b * 11) % 23 * 10) for b in range(1, 31) for t in range(150 - b % 3)]
+    results.append(row(4, 500, 501, adjusted=("A", "A-")))
+    vectorized = calc.compute_matchpoints(results)
+    monkeypatch.setattr(matchpoints, "np", None)
+    assert calc.compute_matchpoints(results) == vectorized
+    assert len(vectorized) == len(results)
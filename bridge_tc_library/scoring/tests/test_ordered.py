@@ -0,0 +1,49 @@
+import random
+
+import pytest
+
+from bridge_tc_library.scoring.ordered import OrderedMultiset
+
+
+def test_matches_sorted_list():
+    rng = random.Random(3)
+    keys = OrderedMultiset()
+    reference = []
+    for _ in range(3000):
+        key = rng.randint(-50, 50)
+        if reference and rng.random() < 0.4:
+            key = rng.choice(reference)
+            keys.remove(key)
+            reference.remove(key)
+        else:
+            keys.add(key)
+            reference.append(key)
+        probe = rng.randint(-60, 60)
+        assert keys.count_less(probe) == sum(k < probe for k in reference)
+        assert keys.count(probe) == reference.count(probe)
+    reference.sort()
+    assert list(keys) == reference
+    assert len(keys) == len(reference)
+    assert list(keys.items(-10, 10)) == [(k, reference.count(k)) for k in sorted(set(reference)) if -10 <= k <= 10]
+
+
+def test_remove_missing_key():
+    keys = OrderedMultiset()
+    keys.add((1, "a"))
+    keys.remove((1, "a"))
+    assert (1, "a") not in keys and len(keys) == 0
+    with pytest.raises(KeyError):
+        keys.remove((1, "a"))
+
+
+def test_stays_shallow_on_sorted_input():
+    keys = OrderedMultiset()
+    for key in range(20000):
+        keys.add(key)
+
+    def depth(node):
+        return 0 if node is None else 1 + max(depth(node.left), depth(node.right))
+
+    # a plain binary search tree would be a 20000-deep chain
+    assert depth(keys._root) < 100
+    assert keys.count_less(12345) == 12345
@@ -1,3 +1,12 @@
 from .tournament import *
 from .core import *
-from .movements import *
\ No newline at end of file
+from .movements import *
+
+
+def __getattr__(name):
+    # the movements package resolves its analysis helpers lazily
+    from . import movements
+    try:
+        return getattr(movements, name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
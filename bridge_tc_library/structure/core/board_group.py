@@ -1,13 +1,18 @@
 from dataclasses import dataclass
 from typing import Tuple
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BoardGroup:
 	"""
 	A group of board numbers played together in one round at one table.
+	`boards` is stored as a tuple whatever sequence it is given as.
 	"""
 	BoardGroupId: int
 	boards: Tuple[int, ...]
 
+	def __post_init__(self):
+		if type(self.boards) is not tuple:
+			object.__setattr__(self, 'boards', tuple(self.boards))
+
 	def __str__(self):
 		return f"{self.BoardGroupId} ({self.boards[0]}-{self.boards[-1]})"
\ No newline at end of file
@@ -1,9 +1,11 @@
+from abc import ABCMeta
 from dataclasses import dataclass
 from typing import Tuple
 from .player import Player
 
-@dataclass(frozen=True)
-class Pair:
+# ABCMeta lets registry handles register as virtual subclasses without inheriting the slots
+@dataclass(frozen=True, slots=True)
+class Pair(metaclass=ABCMeta):
 	id: int
 	players: Tuple[Player, Player]
 
@@ -1,7 +1,9 @@
+from abc import ABCMeta
 from dataclasses import dataclass
 
-@dataclass(frozen=True)
-class Player:
+# ABCMeta lets registry handles register as virtual subclasses without inheriting the slots
+@dataclass(frozen=True, slots=True)
+class Player(metaclass=ABCMeta):
 	first_name: str = ""
 	last_name: str = ""
 	wk: float = 0.0
@@ -0,0 +1,305 @@
+"""
+Struct-of-arrays storage for players, pairs and tables.
+
+For simulations with thousands of tournaments, `StructureRegistry` keeps every
+field in a parallel array addressed by an integer index instead of one Python
+object per player, pair or table. `player(i)`, `pair(i)` and `table(i)` return
+flyweight handles holding only the registry and the index; they are registered
+as virtual subclasses of `Player`, `Pair` and `Table`, so they keep the
+attribute API (and `isinstance` checks) without carrying the storage of those
+classes. Two handles of the same entry compare and hash equal, so they can key
+`round_data` like the objects they stand for.
+
+Import it from this module; it is not re-exported by the `core` package because
+it needs `bridge_tc_library.structure.tournament`.
+"""
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
+
+from .pair import Pair
+from .player import Player
+from .status import Status
+from bridge_tc_library.structure.tournament.table import Table
+
+if TYPE_CHECKING:
+	from bridge_tc_library.structure.tournament import Sector
+
+_STATUSES: Tuple[Status, ...] = tuple(Status)
+_STATUS_INDEX = {status: idx for idx, status in enumerate(_STATUSES)}
+_NONE = -1
+
+
+class _Handle:
+	__slots__ = ('_registry', '_index')
+
+	def __init__(self, registry: 'StructureRegistry', index: int):
+		self._registry = registry
+		self._index = index
+
+	def __eq__(self, other: Any) -> bool:
+		return type(other) is type(self) and other._registry is self._registry and other._index == self._index
+
+	def __hash__(self) -> int:
+		return hash((id(self._registry), self._index))
+
+	@property
+	def index(self) -> int:
+		return self._index
+
+
+class PlayerHandle(_Handle):
+	__slots__ = ()
+
+	@property
+	def first_name(self) -> str:
+		return self._registry._first_names[self._index]
+
+	@property
+	def last_name(self) -> str:
+		return self._registry._last_names[self._index]
+
+	@property
+	def wk(self) -> float:
+		return self._registry._wks[self._index]
+
+	@property
+	def db_id(self) -> int:
+		return self._registry._db_ids[self._index]
+
+	def __repr__(self) -> str:
+		return f"PlayerHandle(first_name={self.first_name!r}, last_name={self.last_name!r}, wk={self.wk!r}, db_id={self.db_id!r})"
+
+
+class PairHandle(_Handle):
+	__slots__ = ()
+
+	@property
+	def id(self) -> int:
+		return self._registry._pair_ids[self._index]
+
+	@property
+	def players(self) -> Tuple[PlayerHandle, PlayerHandle]:
+		registry, index = self._registry, self._index
+		return registry.player(registry._pair_players[2 * index]), registry.player(registry._pair_players[2 * index + 1])
+
+	__str__ = Pair.__str__
+
+	def __repr__(self) -> str:
+		return f"PairHandle(id={self.id!r})"
+
+
+class TableHandle(_Handle):
+	__slots__ = ()
+
+	table_id = Table.table_id
+	start = Table.start
+	next_deal = Table.next_deal
+	change_sector = Table.change_sector
+	__str__ = Table.__str__
+	__repr__ = Table.__repr__
+
+	@property
+	def _table_id(self) -> int:
+		return self._registry._table_ids[self._index]
+
+	@property
+	def display_id(self) -> int:
+		return self._registry._display_ids[self._index]
+
+	@display_id.setter
+	def display_id(self, value: int):
+		self._registry._display_ids[self._index] = value
+
+	@property
+	def isplayable(self) -> bool:
+		return bool(self._registry._playable[self._index])
+
+	@isplayable.setter
+	def isplayable(self, value: bool):
+		self._registry._playable[self._index] = bool(value)
+
+	@property
+	def status(self) -> Status:
+		return _STATUSES[self._registry._statuses[self._index]]
+
+	@status.setter
+	def status(self, value: Status):
+		self._registry._statuses[self._index] = _STATUS_INDEX[value]
+
+	@property
+	def current_round(self) -> Optional[int]:
+		value = self._registry._current_rounds[self._index]
+		return None if value == _NONE else value
+
+	@current_round.setter
+	def current_round(self, value: Optional[int]):
+		self._registry._current_rounds[self._index] = _NONE if value is None else value
+
+	@property
+	def current_board(self) -> Optional[int]:
+		value = self._registry._current_boards[self._index]
+		return None if value == _NONE else value
+
+	@current_board.setter
+	def current_board(self, value: Optional[int]):
+		self._registry._current_boards[self._index] = _NONE if value is None else value
+
+	@property
+	def sector(self) -> Optional['Sector']:
+		registry = self._registry
+		return registry._sector_list[registry._sectors[self._index]]
+
+	@sector.setter
+	def sector(self, value: Optional['Sector']):
+		self._registry._sectors[self._index] = self._registry._sector_code(value)
+
+	@property
+	def og_sector(self) -> Optional['Sector']:
+		registry = self._registry
+		return registry._sector_list[registry._og_sectors[self._index]]
+
+	@og_sector.setter
+	def og_sector(self, value: Optional['Sector']):
+		self._registry._og_sectors[self._index] = self._registry._sector_code(value)
+
+
+def _object_field(name: str) -> property:
+	def getter(self: TableHandle):
+		return getattr(self._registry, name)[self._index]
+
+	def setter(self: TableHandle, value):
+		getattr(self._registry, name)[self._index] = value
+
+	return property(getter, setter)
+
+
+TableHandle.current_pairs = _object_field('_current_pairs')
+TableHandle.current_board_set = _object_field('_current_board_sets')
+
+Player.register(PlayerHandle)
+Pair.register(PairHandle)
+Table.register(TableHandle)
+
+
+class StructureRegistry:
+	"""
+	Players, pairs and tables as parallel arrays. Integer fields live in `array`s,
+	flags and statuses in `bytearray`s and sectors as codes into a short list of
+	sectors; only current pairs and board sets take one list slot each.
+	"""
+
+	def __init__(self):
+		self._first_names: List[str] = []
+		self._last_names: List[str] = []
+		self._wks = array('d')
+		self._db_ids = array('q')
+
+		self._pair_ids = array('i')
+		# player indices, two per pair
+		self._pair_players = array('i')
+
+		self._table_ids = array('i')
+		self._display_ids = array('i')
+		self._playable = bytearray()
+		self._statuses = bytearray()
+		self._current_rounds = array('i')
+		self._current_boards = array('i')
+		# sector codes index _sector_list; code 0 is "no sector"
+		self._sector_list: List[Optional['Sector']] = [None]
+		self._sector_codes: Dict[int, int] = {}
+		self._sectors = array('I')
+		self._og_sectors = array('I')
+		self._current_pairs: List[Optional[dict]] = []
+		self._current_board_sets: List[Optional[Any]] = []
+
+	def _sector_code(self, sector: Optional['Sector']) -> int:
+		if sector is None:
+			return 0
+		code = self._sector_codes.get(id(sector))
+		if code is None:
+			code = self._sector_codes[id(sector)] = len(self._sector_list)
+			self._sector_list.append(sector)
+		return code
+
+	@property
+	def num_players(self) -> int:
+		return len(self._db_ids)
+
+	@property
+	def num_pairs(self) -> int:
+		return len(self._pair_ids)
+
+	@property
+	def num_tables(self) -> int:
+		return len(self._table_ids)
+
+	def add_player(self, first_name: str = "", last_name: str = "", wk: float = 0.0, db_id: int = 0) -> int:
+		self._first_names.append(first_name)
+		self._last_names.append(last_name)
+		self._wks.append(wk)
+		self._db_ids.append(db_id)
+		return len(self._db_ids) - 1
+
+	def add_pair(self, pair_id: int, first_player: Optional[int] = None, second_player: Optional[int] = None) -> int:
+		"""Adds a pair of two existing players (by index); missing players are created blank."""
+		if first_player is None:
+			first_player = self.add_player()
+		if second_player is None:
+			second_player = self.add_player()
+		for player in (first_player, second_player):
+			if not 0 <= player < self.num_players:
+				raise IndexError(f"No player with index {player}")
+		self._pair_ids.append(pair_id)
+		self._pair_players.extend((first_player, second_player))
+		return len(self._pair_ids) - 1
+
+	def add_table(self, table_id: int, sector: Optional['Sector'] = None, isplayable: bool = True) -> int:
+		"""Adds a table with the same initial state as `Table(table_id, sector, isplayable)`."""
+		self._table_ids.append(table_id)
+		self._display_ids.append(table_id)
+		self._playable.append(bool(isplayable))
+		self._statuses.append(_STATUS_INDEX[Status.INACTIVE])
+		self._current_rounds.append(_NONE)
+		self._current_boards.append(_NONE)
+		code = self._sector_code(sector)
+		self._sectors.append(code)
+		self._og_sectors.append(code)
+		self._current_pairs.append(None)
+		self._current_board_sets.append(None)
+		return len(self._table_ids) - 1
+
+	def add_pairs(self, count: int, first_id: int = 1) -> range:
+		start = self.num_pairs
+		for offset in range(count):
+			self.add_pair(first_id + offset)
+		return range(start, start + count)
+
+	def add_tables(self, count: int, sector: Optional['Sector'] = None, first_id: int = 1) -> range:
+		start = self.num_tables
+		for offset in range(count):
+			self.add_table(first_id + offset, sector)
+		return range(start, start + count)
+
+	def player(self, index: int) -> PlayerHandle:
+		if not 0 <= index < self.num_players:
+			raise IndexError(f"No player with index {index}")
+		return PlayerHandle(self, index)
+
+	def pair(self, index: int) -> PairHandle:
+		if not 0 <= index < self.num_pairs:
+			raise IndexError(f"No pair with index {index}")
+		return PairHandle(self, index)
+
+	def table(self, index: int) -> TableHandle:
+		if not 0 <= index < self.num_tables:
+			raise IndexError(f"No table with index {index}")
+		return TableHandle(self, index)
+
+	def players(self) -> Iterator[PlayerHandle]:
+		return (PlayerHandle(self, idx) for idx in range(self.num_players))
+
+	def pairs(self) -> Iterator[PairHandle]:
+		return (PairHandle(self, idx) for idx in range(self.num_pairs))
+
+	def tables(self) -> Iterator[TableHandle]:
+		return (TableHandle(self, idx) for idx in range(self.num_tables))
@@ -0,0 +1,120 @@
+import pickle
+import sys
+import tracemalloc
+
+import pytest
+
+from bridge_tc_library.structure.core import BoardGroup, Pair, Player, Status
+from bridge_tc_library.structure.core.registry import PairHandle, StructureRegistry, TableHandle
+from bridge_tc_library.structure.tournament import Sector, Table
+
+
+def test_slotted_domain_objects():
+    for obj in (Player(), Pair(1, (Player(), Player())), BoardGroup(1, (1, 2)), Table(1), Sector("A")):
+        assert not hasattr(obj, "__dict__")
+
+    group = BoardGroup(3, [7, 8, 9])
+    assert group.boards == (7, 8, 9)
+    assert group == BoardGroup(3, (7, 8, 9))
+    assert hash(group) == hash(BoardGroup(3, range(7, 10)))
+    assert pickle.loads(pickle.dumps(group)) == group
+
+
+def test_table_handles_keep_table_api():
+    registry = StructureRegistry()
+    sector = Sector("A")
+    registry.add_tables(3, sector)
+    table = registry.table(1)
+
+    assert isinstance(table, Table)
+    assert (table.table_id, table.display_id, table.isplayable, table.status) == (2, 2, True, Status.INACTIVE)
+    assert table.sector is sector and table.og_sector is sector
+    assert table.current_round is None and table.current_pairs is None
+    assert str(table) == "A2"
+
+    table.display_id = 7
+    table.isplayable = False
+    table.status = Status.ACTIVE
+    table.current_round = 3
+    again = registry.table(1)
+    assert again is not table and again == table and hash(again) == hash(table)
+    assert (again.display_id, again.isplayable, again.status, again.current_round) == (7, False, Status.ACTIVE, 3)
+    assert str(again) == "_A7"
+    assert registry.table(0) != table
+
+    other = Sector("B")
+    table.change_sector(other)
+    assert registry.table(1).sector is other
+    assert other.tables == [registry.table(1)]
+
+    with pytest.raises(IndexError):
+        registry.table(3)
+
+
+def test_pair_handles():
+    registry = StructureRegistry()
+    ann = registry.add_player("Ann", "Smith", 1.5, 10)
+    bob = registry.add_player("Bob", "Jones")
+    idx = registry.add_pair(4, ann, bob)
+    pair = registry.pair(idx)
+
+    assert isinstance(pair, Pair)
+    assert str(pair) == "4"
+    first, second = pair.players
+    assert (first.first_name, first.last_name, first.wk, first.db_id) == ("Ann", "Smith", 1.5, 10)
+    assert second.first_name == "Bob"
+    assert pair == registry.pair(idx) and hash(pair) == hash(registry.pair(idx))
+    assert {pair: 1}[registry.pair(idx)] == 1
+
+    blank = registry.pair(registry.add_pair(5))
+    assert registry.num_players == 4
+    assert [p.id for p in registry.pairs()] == [4, 5]
+    assert blank != pair
+    with pytest.raises(IndexError):
+        registry.add_pair(6, 0, 99)
+
+
+def test_registry_uses_less_memory():
+    count = 5000
+
+    def traced(build):
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            kept = build()
+            return (tracemalloc.get_traced_memory()[0] - before) / count, kept
+        finally:
+            tracemalloc.stop()
+
+    tables, _ = traced(lambda: [Table(i) for i in range(count)])
+    pairs, _ = traced(lambda: [Pair(i, (Player(), Player())) for i in range(count)])
+
+    def build_registry():
+        registry = StructureRegistry()
+        registry.add_tables(count)
+        registry.add_pairs(count)
+        return registry
+
+    arrays, _ = traced(build_registry)
+    assert arrays * 2 < tables + pairs
+
+    # with one handle held per entry, as in sector.tables or round_data keys
+    def held_tables():
+        registry = StructureRegistry()
+        registry.add_tables(count)
+        return registry, list(registry.tables())
+
+    def held_pairs():
+        registry = StructureRegistry()
+        registry.add_pairs(count)
+        return registry, list(registry.pairs())
+
+    assert traced(held_tables)[0] < tables
+    assert traced(held_pairs)[0] < pairs
+
+    registry = StructureRegistry()
+    registry.add_table(1)
+    registry.add_pair(1)
+    assert sys.getsizeof(registry.table(0)) < sys.getsizeof(Table(1))
+    assert sys.getsizeof(registry.pair(0)) <= sys.getsizeof(Pair(1, ()))
+    assert sys.getsizeof(registry.player(0)) < sys.getsizeof(Player())
@@ -0,0 +1,68 @@
+"""
+Compares BaseMovement (dict/object engine) with ArrayMovement (NumPy engine).
+
+Run with:
+    PYTHONPATH=$(pwd) python bridge_tc_library/structure/examples/benchmark_movement_engines.py
+"""
+import time
+
+from bridge_tc_library.structure.core import BoardGroup, Pair, Player, Position
+from bridge_tc_library.structure.movements.array_movement import ArrayMovement
+from bridge_tc_library.structure.movements.movement import BaseMovement
+from bridge_tc_library.structure.movements.strategy import MovementStrategy
+from bridge_tc_library.structure.tournament import Sector, Table
+
+ROUNDS = 26
+REPEATS = 3
+
+
+def mitchell_like_movement(num_tables: int) -> BaseMovement:
+    """NS stationary, EW one table up, boards one table down."""
+    sector = Sector("A")
+    tables = [Table(i + 1, sector) for i in range(num_tables)]
+    pairs = [Pair(i + 1, (Player(), Player())) for i in range(2 * num_tables)]
+    board_groups = [BoardGroup(i + 1, (2 * i + 1, 2 * i + 2)) for i in range(num_tables)]
+    pair_moves = [((tables[n - 1], Position.EW), (tables[n], Position.EW)) for n in range(num_tables)]
+    board_moves = [(tables[n], tables[n - 1]) for n in range(num_tables)]
+    strategy = MovementStrategy([(pair_moves, board_moves, list(range(1, ROUNDS + 1)))])
+
+    movement = BaseMovement(tables, board_groups, pairs, strategy)
+    movement.autogenerate_initial_sitting()
+    movement.autogenerate_initial_boardgroup_placement()
+    return movement
+
+
+def best_of(fn) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def object_engine(movement: BaseMovement, compiled: bool):
+    movement.round_data = {}
+    movement.construct_movement(ROUNDS, compiled=compiled)
+    for rnd in range(1, ROUNDS + 1):
+        movement.get_sitting_for_round(rnd)
+        movement.get_boards_for_round(rnd)
+
+
+def array_engine(movement: ArrayMovement):
+    movement.construct_movement(ROUNDS)
+    for rnd in range(1, ROUNDS + 1):
+        movement.get_sitting_for_round(rnd)
+        movement.get_boards_for_round(rnd)
+
+
+if __name__ == "__main__":
+    print(f"construct {ROUNDS} rounds and read every round, best of {REPEATS} [ms]")
+    print("tables\tdict snapshots\tcompiled plan\tnumpy arrays")
+    for num_tables in (10, 100, 1000):
+        movement = mitchell_like_movement(num_tables)
+        arrays = ArrayMovement.from_movement(movement)
+        legacy = best_of(lambda: object_engine(movement, compiled=False))
+        compiled = best_of(lambda: object_engine(movement, compiled=True))
+        dense = best_of(lambda: array_engine(arrays))
+        print(f"{num_tables}\t{legacy * 1e3:.2f}\t\t{compiled * 1e3:.2f}\t\t{dense * 1e3:.2f}")
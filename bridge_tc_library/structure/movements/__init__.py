@@ -14,9 +14,47 @@ try:
 except Exception:
     BaseMovement = None  # type: ignore
 
+try:
+    from .index import RoundIndex, BoardPlay, PairRound  # type: ignore
+except Exception:
+    RoundIndex = None  # type: ignore
+    BoardPlay = None  # type: ignore
+    PairRound = None  # type: ignore
+
+# The analysis, search and export helpers are imported on first access, so importing the
+# package (and every rotation module with it) does not pay for numpy, multiprocessing or json.
+# The numpy engine is not exported: import ArrayMovement from .array_movement.
+_LAZY = {
+    'VerificationReport': '.verifier', 'verify_round_data': '.verifier', 'verify_strategy': '.verifier',
+    'MovementTemplate': '.template', 'get_template': '.template',
+    'MovementLibrary': '.library', 'LibraryEntry': '.library',
+    'BalanceReport': '.balance', 'analyze_balance': '.balance',
+    'OptimizedMovement': '.optimizer', 'optimize_movement': '.optimizer',
+    'AnalysisCache': '.canonical', 'canonical_form': '.canonical', 'fingerprint': '.canonical',
+    'strategy_fingerprint': '.canonical',
+    'build_itineraries': '.itinerary', 'build_table_cards': '.itinerary', 'export_pair_cards': '.itinerary',
+    'export_table_cards': '.itinerary',
+}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
 __all__ = [
     name for name in (
-        'MovementStrategy', 'AbstractRotation', 'RotationParams', 'BaseMovement'
+        'MovementStrategy', 'AbstractRotation', 'RotationParams', 'BaseMovement', 'RoundIndex', 'BoardPlay', 'PairRound'
     ) if name in globals() and globals()[name] is not None
 ]
+# lazy names stay out of __all__: a star import would resolve them all
 
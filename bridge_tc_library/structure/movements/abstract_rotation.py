@@ -9,10 +9,12 @@ if TYPE_CHECKING:
 
 
 class RotationParams(NamedTuple):
-	"""Parameters describing a possible rotation configuration."""
+	"""Parameters describing a possible rotation configuration.
+	num_rounds is set by rotations that can be played over fewer rounds than a full cycle."""
 	num_tables: int
 	num_board_groups: int
 	boards_per_board_group: int
+	num_rounds: Optional[int] = None
 
 
 class AbstractRotation(ABC):
@@ -20,6 +22,8 @@ class AbstractRotation(ABC):
 	"""
 	Abstract base class for rotation calculators.
 	"""
+	# name of the template family (see `template.get_template`) the rotation is built from, if any
+	family: Optional[str] = None
 
 	def __init__(self, tables: List['Table']):
 		self.tables = tables
@@ -40,6 +44,15 @@ class AbstractRotation(ABC):
 		Generates movement strategy for the given number of rounds.
 		"""
 
+	@staticmethod
+	def boards_per_boardgroup_range(boards_per_unit: int, min_boards_amount: int, max_boards_amount: int, min_boards_per_boardgroup: int) -> range:
+		"""
+		Board group sizes b with min_boards_amount <= b * boards_per_unit <= max_boards_amount,
+		b >= min_boards_per_boardgroup, computed without stepping through candidates.
+		"""
+		low = max(min_boards_per_boardgroup, 1, -(-min_boards_amount // boards_per_unit))
+		return range(low, max_boards_amount // boards_per_unit + 1)
+
 	def check_if_bye_needed(self, num_pairs: int) -> bool:
 		"""
 		Indicates if bye is needed in the rotation.
@@ -0,0 +1,251 @@
+"""
+NumPy-backed movement engine for very large fields.
+
+`ArrayMovement` holds a whole movement in dense arrays instead of per-table
+dicts: sitting is an int32 array (rounds x tables x 2) of pair indices and
+board-group locations are int32/int64 arrays (rounds x board_groups). Strategy
+moves are applied as vectorized gathers compiled from `CompiledMovementPlan`.
+Results are exposed through read-only mapping views with the same shape as
+`BaseMovement.get_sitting_for_round` / `get_boards_for_round`.
+"""
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Tuple, TYPE_CHECKING
+
+# optional dependency (pip install bridge-tc-library[fast]), imported by the first ArrayMovement
+np = None
+
+from .compiled import SEAT_POSITIONS, CompiledMovementPlan
+from .strategy import MovementStrategy
+from bridge_tc_library.structure.core import Position, Pair, BoardGroup
+
+if TYPE_CHECKING:
+	from bridge_tc_library.structure.tournament import Table
+	from .movement import BaseMovement
+
+EMPTY = -1
+
+
+def _require_numpy():
+	global np
+	if np is None:
+		try:
+			import numpy
+		except ImportError:
+			raise ImportError("ArrayMovement requires numpy (pip install bridge-tc-library[fast])") from None
+		np = numpy
+
+
+class _ArrayBlock:
+	"""Vectorized form of one `CompiledBlock`."""
+	__slots__ = ('pair_layers', 'board_pops', 'pop_moves', 'move_dst')
+
+	def __init__(self, block, num_tables: int):
+		# layer k holds the k-th most recent writer of every seat written more than k times;
+		# layers are applied lowest priority first so the last write wins
+		layers: List[Tuple[List[int], List[int]]] = []
+		for dst, srcs in block.pair_moves:
+			for k, src in enumerate(srcs):
+				if k == len(layers):
+					layers.append(([], []))
+				layers[k][0].append(dst)
+				layers[k][1].append(src)
+		self.pair_layers = [(np.array(d, dtype=np.intp), np.array(s, dtype=np.intp)) for d, s in reversed(layers)]
+
+		self.board_pops = np.array(block.board_pops, dtype=np.int32)
+		max_pops = max(block.board_pops, default=0)
+		self.pop_moves = np.full((num_tables, max(max_pops, 1)), EMPTY, dtype=np.int64)
+		self.move_dst = np.array([dst for dst, _, _ in block.board_appends], dtype=np.int32)
+		for move_idx, (_, src, k) in enumerate(block.board_appends):
+			self.pop_moves[src, k] = move_idx
+
+
+class _SittingView(Mapping):
+	"""Read-only {Table: {Position: Pair}} view over one round of `ArrayMovement.sitting`."""
+
+	def __init__(self, movement: 'ArrayMovement', round_index: int):
+		self._movement = movement
+		self._row = movement.sitting[round_index]
+		self._seated = np.flatnonzero((self._row[:, 0] != EMPTY) & (self._row[:, 1] != EMPTY))
+
+	def __getitem__(self, table: 'Table') -> Dict[Position, Pair]:
+		idx = self._movement.table_index.get(table)
+		if idx is None or EMPTY in self._row[idx]:
+			raise KeyError(table)
+		pairs = self._movement.pairs
+		return {position: pairs[self._row[idx, offset]] for offset, position in enumerate(SEAT_POSITIONS)}
+
+	def __iter__(self) -> Iterator['Table']:
+		tables = self._movement.tables
+		return (tables[idx] for idx in self._seated)
+
+	def __len__(self) -> int:
+		return len(self._seated)
+
+
+class _BoardsView(Mapping):
+	"""Read-only {Table: (BoardGroup, ...)} view over one round of the board arrays."""
+
+	def __init__(self, movement: 'ArrayMovement', round_index: int):
+		self._movement = movement
+		table = movement.board_table[round_index]
+		located = np.flatnonzero(table != EMPTY)
+		order = located[np.lexsort((movement.board_order[round_index, located], table[located]))]
+		self._groups = order
+		self._bounds = np.searchsorted(table[order], np.arange(len(movement.tables) + 1))
+
+	def __getitem__(self, table: 'Table') -> Tuple[BoardGroup, ...]:
+		idx = self._movement.table_index.get(table)
+		if idx is None:
+			raise KeyError(table)
+		board_groups = self._movement.board_groups
+		return tuple(board_groups[g] for g in self._groups[self._bounds[idx]:self._bounds[idx + 1]])
+
+	def __iter__(self) -> Iterator['Table']:
+		return iter(self._movement.tables)
+
+	def __len__(self) -> int:
+		return len(self._movement.tables)
+
+
+class ArrayMovement:
+	"""
+	Dense-array counterpart of `BaseMovement`.
+	- sitting: int32[rounds, tables, 2], index into `pairs` (NS, EW) or -1 when empty
+	- board_table: int32[rounds, board_groups], index of the table holding each group or -1
+	- board_order: int64[rounds, board_groups], FIFO key ordering groups held by one table
+	"""
+
+	def __init__(self, tables: list['Table'], board_groups: list['BoardGroup'], pairs: list[Pair], movement_strategies: MovementStrategy):
+		_require_numpy()
+		self.tables = tables
+		self.board_groups = board_groups
+		self.pairs = pairs
+		self.movement_strategies = movement_strategies
+		self.initial_sitting: Dict['Table', Dict[Position, Pair]] = None
+		self.initial_boardgroup_placement: Dict['Table', list['BoardGroup']] = None
+		self.table_index: Dict['Table', int] = {}
+		self.sitting = np.empty((0, len(tables), len(SEAT_POSITIONS)), dtype=np.int32)
+		self.board_table = np.empty((0, len(board_groups)), dtype=np.int32)
+		self.board_order = np.empty((0, len(board_groups)), dtype=np.int64)
+
+	@classmethod
+	def from_movement(cls, movement: 'BaseMovement') -> 'ArrayMovement':
+		"""Creates an array engine sharing the configuration and initial state of a `BaseMovement`."""
+		new = cls(movement.tables, movement.board_groups, movement.pairs, movement.movement_strategies)
+		new.initial_sitting = movement.initial_sitting
+		new.initial_boardgroup_placement = movement.initial_boardgroup_placement
+		return new
+
+	def set_initial_sitting(self, initial_sitting: Dict['Table', Dict[Position, Pair]]):
+		self.initial_sitting = initial_sitting
+
+	def set_initial_boardgroup_placement(self, initial_boardgroup_placement: Dict['Table', list['BoardGroup']]):
+		self.initial_boardgroup_placement = initial_boardgroup_placement
+
+	@property
+	def rounds(self) -> int:
+		return self.sitting.shape[0]
+
+	def _initial_arrays(self, plan: CompiledMovementPlan):
+		pair_index = {id(pair): idx for idx, pair in enumerate(self.pairs)}
+		group_index = {id(bg): idx for idx, bg in enumerate(self.board_groups)}
+		seats, queues = plan.initial_state(self.initial_sitting, self.initial_boardgroup_placement)
+
+		sitting = np.array([EMPTY if pair is None else pair_index[id(pair)] for pair in seats], dtype=np.int32)
+		board_table = np.full(len(self.board_groups), EMPTY, dtype=np.int32)
+		board_order = np.zeros(len(self.board_groups), dtype=np.int64)
+		for table_idx, queue in enumerate(queues):
+			for order, bg in enumerate(queue):
+				board_table[group_index[id(bg)]] = table_idx
+				board_order[group_index[id(bg)]] = order
+		return sitting, board_table, board_order
+
+	def construct_movement(self, rounds: int) -> 'ArrayMovement':
+		"""
+		Builds the sitting and board arrays for rounds 1..rounds with the same
+		semantics as `BaseMovement.construct_movement`.
+		"""
+		plan = self.movement_strategies.compile(self.tables)
+		self.table_index = plan.table_index
+		num_tables = len(self.tables)
+		num_groups = len(self.board_groups)
+
+		blocks: Dict[int, _ArrayBlock] = {}
+		block_ids = []
+		for rnd in range(2, rounds + 1):
+			block_id = plan.round_lookup.get(rnd)
+			if block_id is None:
+				raise ValueError(f"No strategy defined for round {rnd}")
+			if block_id not in blocks:
+				blocks[block_id] = _ArrayBlock(plan.blocks[block_id], num_tables)
+			block_ids.append(block_id)
+		# every round gets a key range above all earlier keys so appended groups queue last
+		stride = max([len(b.move_dst) for b in blocks.values()] + [num_groups]) + 1
+
+		sitting = np.empty((rounds, num_tables * len(SEAT_POSITIONS)), dtype=np.int32)
+		board_table = np.empty((rounds, num_groups), dtype=np.int32)
+		board_order = np.empty((rounds, num_groups), dtype=np.int64)
+		sitting[0], board_table[0], board_order[0] = self._initial_arrays(plan)
+
+		group_ids = np.arange(num_groups)
+		for r, block_id in enumerate(block_ids, start=1):
+			block = blocks[block_id]
+			prev_seats = sitting[r - 1]
+			seats = prev_seats.copy()
+			for dst, src in block.pair_layers:
+				moved = prev_seats[src]
+				seats[dst] = np.where(moved != EMPTY, moved, seats[dst])
+			sitting[r] = seats
+
+			table = board_table[r - 1].copy()
+			order = board_order[r - 1].copy()
+			located = group_ids[table != EMPTY]
+			if len(located) and len(block.move_dst):
+				by_queue = located[np.lexsort((order[located], table[located]))]
+				queue_tables = table[by_queue]
+				starts = np.searchsorted(queue_tables, queue_tables)
+				rank = np.arange(len(by_queue)) - starts
+				leaving = rank < block.board_pops[queue_tables]
+				groups = by_queue[leaving]
+				move_idx = block.pop_moves[queue_tables[leaving], rank[leaving]]
+				table[groups] = block.move_dst[move_idx]
+				order[groups] = (r + 1) * stride + move_idx
+			board_table[r] = table
+			board_order[r] = order
+
+		self.sitting = sitting.reshape(rounds, num_tables, len(SEAT_POSITIONS))
+		self.board_table = board_table
+		self.board_order = board_order
+		return self
+
+	def _round_index(self, round_number: int) -> int:
+		if not 1 <= round_number <= self.rounds:
+			raise ValueError(f"Round {round_number} not found. Make sure to run construct_movement first.")
+		return round_number - 1
+
+	def get_sitting_for_round(self, round_number: int) -> Mapping:
+		"""
+		{Table: {Position: Pair}} for tables with both NS and EW seated.
+		"""
+		return _SittingView(self, self._round_index(round_number))
+
+	def get_boards_for_round(self, round_number: int) -> Mapping:
+		"""
+		{Table: (BoardGroup, ...)} in FIFO order for every table.
+		"""
+		return _BoardsView(self, self._round_index(round_number))
+
+	def to_round_data(self) -> Dict[int, Dict['Table', Tuple[Dict[Position, Pair], List[BoardGroup]]]]:
+		"""Materializes the arrays in the `BaseMovement.round_data` shape."""
+		round_data = {}
+		for rnd in range(1, self.rounds + 1):
+			row = self.sitting[rnd - 1]
+			boards = self.get_boards_for_round(rnd)
+			round_data[rnd] = {
+				table: (
+					{position: self.pairs[row[idx, offset]] for offset, position in enumerate(SEAT_POSITIONS) if row[idx, offset] != EMPTY},
+					list(boards[table]),
+				)
+				for idx, table in enumerate(self.tables)
+			}
+		return round_data
@@ -0,0 +1,142 @@
+"""
+Balance analysis of a movement, built with NumPy.
+
+From a constructed `round_data` the analyzer collects, in one pass over the
+rounds, which pair played which board in which direction. Everything else is
+matrix algebra on the resulting pairs x boards incidence matrices:
+- meetings[p, q]: how often p and q sat at the same table
+- boards_in_common[p, q]: boards both played, in any direction
+- comparisons[p, q]: boards both played in the same direction, i.e. on which
+  their scores are compared when matchpointing
+- ns_boards / ew_boards: boards each pair played in each direction
+
+`BalanceReport.scores` condenses these into fairness measures so candidate
+movements can be ranked (see `RotationCalculator.rank_by_balance`).
+"""
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+try:
+	import numpy as np
+except ImportError:  # optional dependency: pip install bridge-tc-library[fast]
+	np = None
+
+from bridge_tc_library.structure.core import Position, Pair, BoardGroup
+
+if TYPE_CHECKING:
+	from bridge_tc_library.structure.tournament import Table
+	from .template import MovementTemplate
+
+RoundData = Dict[int, Dict['Table', Tuple[Dict[Position, Pair], List[BoardGroup]]]]
+
+
+class BalanceReport:
+	"""Comparison matrices of a movement; rows and columns follow `pairs` (sorted by id) and `boards`."""
+
+	def __init__(self, pairs: List[Pair], boards: List[int], direction, meetings):
+		self.pairs = pairs
+		self.boards = boards
+		self.pair_index: Dict[Pair, int] = {pair: idx for idx, pair in enumerate(pairs)}
+		# +1 played NS, -1 played EW, 0 not played; pairs x boards
+		self.direction = direction
+		ns = (direction == 1).astype(np.int32)
+		ew = (direction == -1).astype(np.int32)
+		played = ns + ew
+		self.ns_boards = ns.sum(axis=1)
+		self.ew_boards = ew.sum(axis=1)
+		self.boards_in_common = played @ played.T
+		self.comparisons = ns @ ns.T + ew @ ew.T
+		np.fill_diagonal(self.boards_in_common, 0)
+		np.fill_diagonal(self.comparisons, 0)
+		self.pair_comparisons = self.comparisons.sum(axis=1)
+		self.meetings = meetings
+		self._scores_cache: Optional[Dict[str, float]] = None
+
+	def _scores(self) -> Dict[str, float]:
+		if self._scores_cache is not None:
+			return self._scores_cache
+		num_pairs = len(self.pairs)
+		upper = np.triu_indices(num_pairs, k=1)
+		met = self.meetings[upper]
+		compared = self.comparisons[upper].astype(np.float64)
+		per_pair = self.pair_comparisons.astype(np.float64)
+		played = (self.ns_boards + self.ew_boards).astype(np.float64)
+
+		def spread(values) -> float:
+			mean = values.mean() if values.size else 0.0
+			return float(values.std() / mean) if mean else 0.0
+
+		direction = np.abs(self.ns_boards - self.ew_boards) / np.maximum(played, 1)
+		scores = {
+			"meeting_coverage": float((met > 0).mean()) if met.size else 1.0,
+			"repeat_meetings": float((met > 1).mean()) if met.size else 0.0,
+			"comparison_spread": spread(compared),
+			"pair_comparison_spread": spread(per_pair),
+			"direction_imbalance": float(direction.mean()) if direction.size else 0.0,
+		}
+		scores["fairness"] = 1.0 / (1.0 + scores["comparison_spread"] + scores["pair_comparison_spread"] + scores["direction_imbalance"] + scores["repeat_meetings"])
+		self._scores_cache = scores
+		return scores
+
+	@property
+	def scores(self) -> Dict[str, float]:
+		"""
+		- meeting_coverage: share of pairs of pairs that met at least once
+		- repeat_meetings: share that met more than once
+		- comparison_spread / pair_comparison_spread: coefficient of variation of the comparison
+		  counts between two pairs / per pair (0 when perfectly even)
+		- direction_imbalance: mean |NS - EW| boards over boards played
+		- fairness: 1 / (1 + sum of the spreads, imbalance and repeats); 1 is perfectly balanced
+		"""
+		return dict(self._scores())
+
+	@property
+	def fairness(self) -> float:
+		return self._scores()["fairness"]
+
+	def __repr__(self) -> str:
+		return f"<BalanceReport pairs={len(self.pairs)} boards={len(self.boards)} fairness={self.fairness:.3f}>"
+
+
+def analyze_balance(round_data: RoundData) -> BalanceReport:
+	"""Balance of a constructed `round_data`; tables with an empty seat are not played."""
+	if np is None:
+		raise ImportError("analyze_balance requires numpy (pip install bridge-tc-library[fast])")
+	ns_pairs: List[Pair] = []
+	ew_pairs: List[Pair] = []
+	table_boards: List[Tuple[int, ...]] = []
+	for rnd in sorted(round_data):
+		for sitting, groups in round_data[rnd].values():
+			ns, ew = sitting.get(Position.NS), sitting.get(Position.EW)
+			if ns is None or ew is None:
+				continue
+			ns_pairs.append(ns)
+			ew_pairs.append(ew)
+			table_boards.append(tuple(board for group in groups for board in group.boards))
+
+	pairs = sorted(set(ns_pairs) | set(ew_pairs), key=lambda pair: pair.id)
+	boards = sorted({board for played in table_boards for board in played})
+	pair_index = {pair: idx for idx, pair in enumerate(pairs)}
+	board_index = {board: idx for idx, board in enumerate(boards)}
+
+	ns_idx = np.fromiter((pair_index[p] for p in ns_pairs), dtype=np.int64, count=len(ns_pairs))
+	ew_idx = np.fromiter((pair_index[p] for p in ew_pairs), dtype=np.int64, count=len(ew_pairs))
+	counts = np.fromiter((len(played) for played in table_boards), dtype=np.int64, count=len(table_boards))
+	board_cols = np.fromiter((board_index[b] for played in table_boards for b in played), dtype=np.int64, count=int(counts.sum()))
+
+	direction = np.zeros((len(pairs), len(boards)), dtype=np.int8)
+	direction[np.repeat(ns_idx, counts), board_cols] = 1
+	direction[np.repeat(ew_idx, counts), board_cols] = -1
+
+	meetings = np.zeros((len(pairs), len(pairs)), dtype=np.int32)
+	np.add.at(meetings, (ns_idx, ew_idx), 1)
+	np.add.at(meetings, (ew_idx, ns_idx), 1)
+	return BalanceReport(pairs, boards, direction, meetings)
+
+
+def template_round_data(template: 'MovementTemplate', boards_per_board_group: int = 1, num_pairs: int = None) -> RoundData:
+	"""See `MovementTemplate.round_data`."""
+	return template.round_data(boards_per_board_group, num_pairs)
+
+
+def template_balance(template: 'MovementTemplate', boards_per_board_group: int = 1, num_pairs: int = None) -> BalanceReport:
+	return analyze_balance(template_round_data(template, boards_per_board_group, num_pairs))
@@ -0,0 +1,223 @@
+"""
+Canonical forms and fingerprints of movements.
+
+Two movements that differ only by renumbering tables, pairs or board groups
+get the same canonical form. A movement is read as its plays: in every round,
+each table where a pair is seated gives (round, table, NS pair, EW pair, board
+groups). Labels are assigned by a breadth-first walk over pairs: starting from
+one pair, every play of a labeled pair (in round order) labels its table, its
+opponent and its board groups in order of discovery. The walk is tried from
+every pair with the smallest seating profile (its NS/EW/out sequence over the
+rounds) and the lexicographically smallest encoding is kept; pairs the walk
+cannot reach (e.g. separate sections) are labeled by further walks the same way.
+
+Positions and round order are kept, as are board group sizes; relay tables
+(no pair seated) and board numbers are not part of the form.
+"""
+import hashlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, TYPE_CHECKING
+
+from bridge_tc_library.structure.core import Position, Pair, BoardGroup, Player
+from .compiled import CompiledMovementPlan
+
+if TYPE_CHECKING:
+	from bridge_tc_library.structure.tournament import Table
+	from .strategy import MovementStrategy
+	from .verifier import VerificationReport
+	from .balance import BalanceReport
+
+RoundData = Dict[int, Dict['Table', Tuple[Dict[Position, Pair], List[BoardGroup]]]]
+# (rounds, sorted (round, table, ns, ew, board groups) label tuples, board group sizes by label)
+CanonicalForm = Tuple[int, Tuple[Tuple[Any, ...], ...], Tuple[int, ...]]
+
+_OUT = 2
+_PROFILE_CODE = {Position.NS: 0, Position.EW: 1}
+
+
+class _Plays:
+	"""Plays of a `round_data` indexed by pair."""
+
+	def __init__(self, round_data: RoundData):
+		self.rounds = len(round_data)
+		self.plays: List[Tuple[int, Any, Optional[Pair], Optional[Pair], Tuple[BoardGroup, ...]]] = []
+		self.by_pair: Dict[Pair, List[int]] = {}
+		for rnd_idx, rnd in enumerate(sorted(round_data)):
+			for table, (sitting, groups) in round_data[rnd].items():
+				if not sitting:
+					continue
+				play = len(self.plays)
+				self.plays.append((rnd_idx, table, sitting.get(Position.NS), sitting.get(Position.EW), tuple(groups)))
+				for pair in sitting.values():
+					self.by_pair.setdefault(pair, []).append(play)
+
+	def profile(self, pair: Pair) -> Tuple[int, ...]:
+		profile = [_OUT] * self.rounds
+		for play in self.by_pair[pair]:
+			rnd_idx, _, ns, _, _ = self.plays[play]
+			profile[rnd_idx] = _PROFILE_CODE[Position.NS if ns == pair else Position.EW]
+		return tuple(profile)
+
+
+class _Labels:
+	__slots__ = ('pairs', 'tables', 'groups')
+
+	def __init__(self, pairs=None, tables=None, groups=None):
+		self.pairs: Dict[Pair, int] = dict(pairs or {})
+		self.tables: Dict[Any, int] = dict(tables or {})
+		self.groups: Dict[BoardGroup, int] = dict(groups or {})
+
+	def copy(self) -> '_Labels':
+		return _Labels(self.pairs, self.tables, self.groups)
+
+
+def _walk(plays: _Plays, labels: _Labels, start: Pair):
+	pairs, tables, groups = labels.pairs, labels.tables, labels.groups
+	pairs[start] = len(pairs)
+	queue = [start]
+	head = 0
+	while head < len(queue):
+		pair = queue[head]
+		head += 1
+		for play in plays.by_pair[pair]:
+			_, table, ns, ew, played = plays.plays[play]
+			if table not in tables:
+				tables[table] = len(tables)
+			for other in (ns, ew):
+				if other is not None and other not in pairs:
+					pairs[other] = len(pairs)
+					queue.append(other)
+			for group in played:
+				if group not in groups:
+					groups[group] = len(groups)
+
+
+def _encode(plays: _Plays, labels: _Labels) -> Tuple[Tuple[Tuple[Any, ...], ...], Tuple[int, ...]]:
+	pairs, tables, groups = labels.pairs, labels.tables, labels.groups
+	encoded = []
+	for rnd_idx, table, ns, ew, played in plays.plays:
+		seated = ns if ns is not None else ew
+		if seated not in pairs:
+			continue
+		encoded.append((
+			rnd_idx, tables[table],
+			-1 if ns is None else pairs[ns], -1 if ew is None else pairs[ew],
+			tuple(groups[group] for group in played),
+		))
+	encoded.sort()
+	sizes = [0] * len(groups)
+	for group, label in groups.items():
+		sizes[label] = len(group.boards)
+	return tuple(encoded), tuple(sizes)
+
+
+def canonical_form(round_data: RoundData) -> CanonicalForm:
+	"""The form of `round_data` shared by every relabeling of its tables, pairs and board groups."""
+	plays = _Plays(round_data)
+	profiles = {pair: plays.profile(pair) for pair in plays.by_pair}
+	labels = _Labels()
+	encoded: Tuple[Tuple[Tuple[Any, ...], ...], Tuple[int, ...]] = ((), ())
+	while len(labels.pairs) < len(profiles):
+		unlabeled = [pair for pair in profiles if pair not in labels.pairs]
+		smallest = min(profiles[pair] for pair in unlabeled)
+		best: Optional[Tuple[Any, _Labels]] = None
+		for start in unlabeled:
+			if profiles[start] != smallest:
+				continue
+			candidate = labels.copy()
+			_walk(plays, candidate, start)
+			candidate_encoded = _encode(plays, candidate)
+			if best is None or candidate_encoded < best[0]:
+				best = (candidate_encoded, candidate)
+		encoded, labels = best
+	return (plays.rounds,) + encoded
+
+
+def fingerprint(round_data: RoundData) -> str:
+	"""Hex digest of `canonical_form(round_data)`."""
+	return hashlib.blake2b(repr(canonical_form(round_data)).encode(), digest_size=16).hexdigest()
+
+
+def strategy_round_data(strategy: 'MovementStrategy', rounds: Optional[int] = None) -> RoundData:
+	"""
+	Plays `strategy` with a distinct placeholder pair on every seat a pair move touches and one
+	board group on every table a board move touches, over `rounds` rounds (default: the last
+	round the strategy defines).
+	"""
+	tables: List['Table'] = []
+	seats: List[Tuple['Table', Position]] = []
+	board_tables: List['Table'] = []
+	seen_tables, seen_seats, seen_board_tables = set(), set(), set()
+	for pair_moves, board_moves, _ in strategy.as_list():
+		for move in pair_moves:
+			for table, position in move:
+				if (table, position) not in seen_seats:
+					seen_seats.add((table, position))
+					seats.append((table, position))
+				if table not in seen_tables:
+					seen_tables.add(table)
+					tables.append(table)
+		for move in board_moves:
+			for table in move:
+				if table not in seen_board_tables:
+					seen_board_tables.add(table)
+					board_tables.append(table)
+				if table not in seen_tables:
+					seen_tables.add(table)
+					tables.append(table)
+
+	sitting: Dict['Table', Dict[Position, Pair]] = {}
+	for idx, (table, position) in enumerate(seats):
+		sitting.setdefault(table, {})[position] = Pair(idx + 1, (Player(), Player()))
+	placement = {table: [BoardGroup(idx + 1, (idx + 1,))] for idx, table in enumerate(board_tables)}
+
+	return CompiledMovementPlan(strategy, tables).play(sitting, placement, rounds)
+
+
+def strategy_fingerprint(strategy: 'MovementStrategy', rounds: Optional[int] = None) -> str:
+	"""Fingerprint of `strategy` itself, invariant under renumbering its tables."""
+	return fingerprint(strategy_round_data(strategy, rounds))
+
+
+class AnalysisCache:
+	"""
+	Results of movement analyses keyed by (fingerprint, kind), least recently used dropped past
+	`maxsize`. A cached result was computed on the first movement of its class: invariant values
+	(`VerificationReport.ok`, `BalanceReport.scores`) hold for all of them, while pairs and
+	tables inside the result belong to that first movement.
+	"""
+
+	def __init__(self, maxsize: int = 1024):
+		self.maxsize = maxsize
+		self._results: 'OrderedDict[Tuple[str, Hashable], Any]' = OrderedDict()
+		self.hits = 0
+		self.misses = 0
+
+	def __len__(self) -> int:
+		return len(self._results)
+
+	def get(self, round_data: RoundData, kind: Hashable, compute: Callable[[RoundData], Any], key: Optional[str] = None) -> Any:
+		"""`compute(round_data)`, run once per movement class; `key` is a precomputed fingerprint."""
+		cache_key = (fingerprint(round_data) if key is None else key, kind)
+		if cache_key in self._results:
+			self.hits += 1
+			self._results.move_to_end(cache_key)
+			return self._results[cache_key]
+		self.misses += 1
+		result = compute(round_data)
+		self._results[cache_key] = result
+		if len(self._results) > self.maxsize:
+			self._results.popitem(last=False)
+		return result
+
+	def verify(self, round_data: RoundData, key: Optional[str] = None) -> 'VerificationReport':
+		from .verifier import verify_round_data
+		return self.get(round_data, "verify", verify_round_data, key)
+
+	def balance(self, round_data: RoundData, key: Optional[str] = None) -> 'BalanceReport':
+		from .balance import analyze_balance
+		return self.get(round_data, "balance", analyze_balance, key)
+
+	def clear(self):
+		self._results.clear()
+		self.hits = self.misses = 0
@@ -0,0 +1,152 @@
+"""
+Compiled, integer-indexed form of a `MovementStrategy`.
+
+A strategy is compiled once against an ordered list of tables. Every seat is
+addressed as `table_index * 2 + position_index` and every board queue by its
+table index, so applying a round becomes a gather over flat lists instead of
+rebuilding per-table dict snapshots.
+"""
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from bridge_tc_library.structure.core import Position, Pair, BoardGroup
+
+if TYPE_CHECKING:
+	from bridge_tc_library.structure.tournament import Table
+	from .strategy import MovementStrategy
+
+
+SEAT_POSITIONS: Tuple[Position, Position] = (Position.NS, Position.EW)
+POSITION_INDEX: Dict[Position, int] = {pos: idx for idx, pos in enumerate(SEAT_POSITIONS)}
+
+# seats[i] is the pair sitting at seat i (or None), queues[t] the FIFO board queue of table t
+Seats = List[Optional[Pair]]
+Queues = List[List[BoardGroup]]
+
+
+class CompiledBlock:
+	"""
+	Permutation arrays for one strategy entry.
+	- pair_moves: (dst_seat, src_seats) for every written seat; src_seats is ordered
+	  so the move applied last comes first (last write wins), unwritten seats carry over
+	- board_pops: number of board groups each table sends away, indexed by table
+	- board_appends: (dst_table, src_table, k) in move order, k being the k-th pop from src_table
+	"""
+	__slots__ = ('pair_moves', 'board_pops', 'board_appends')
+
+	def __init__(self, pair_moves: List[Tuple[int, Tuple[int, ...]]], board_pops: List[int], board_appends: List[Tuple[int, int, int]]):
+		self.pair_moves = pair_moves
+		self.board_pops = board_pops
+		self.board_appends = board_appends
+
+
+class CompiledMovementPlan:
+	"""
+	A `MovementStrategy` turned into a per-round lookup plus pair/board
+	permutation arrays keyed by table index.
+
+	Applying a round costs O(tables + moves), so a whole movement is built in
+	O(tables x rounds). Semantics match `BaseMovement.construct_movement`:
+	simultaneous moves for pairs and FIFO queues for board groups.
+	"""
+
+	def __init__(self, strategy: 'MovementStrategy', tables: List['Table']):
+		self.strategy = strategy
+		self.strategy_version: int = strategy.version
+		self.tables: List['Table'] = list(tables)
+		self.table_index: Dict['Table', int] = {table: idx for idx, table in enumerate(self.tables)}
+		self.blocks: List[CompiledBlock] = []
+		self.round_lookup: Dict[int, int] = {}
+
+		for block_idx, (player_moves, board_moves, rounds) in enumerate(strategy.as_list()):
+			self.blocks.append(self._compile_block(player_moves, board_moves))
+			for round_number in rounds:
+				self.round_lookup.setdefault(round_number, block_idx)
+
+	def seat(self, table: 'Table', position: Position) -> int:
+		return self.table_index[table] * len(SEAT_POSITIONS) + POSITION_INDEX[position]
+
+	def _compile_block(self, player_moves, board_moves) -> CompiledBlock:
+		sources: Dict[int, Tuple[int, ...]] = {}
+		for (src_tbl, src_pos), (dst_tbl, dst_pos) in player_moves:
+			dst = self.seat(dst_tbl, dst_pos)
+			sources[dst] = (self.seat(src_tbl, src_pos),) + sources.get(dst, ())
+
+		board_pops = [0] * len(self.tables)
+		board_appends: List[Tuple[int, int, int]] = []
+		for src_tbl, dst_tbl in board_moves:
+			src = self.table_index[src_tbl]
+			board_appends.append((self.table_index[dst_tbl], src, board_pops[src]))
+			board_pops[src] += 1
+
+		return CompiledBlock(list(sources.items()), board_pops, board_appends)
+
+	def block_for_round(self, round_number: int) -> CompiledBlock:
+		idx = self.round_lookup.get(round_number)
+		if idx is None:
+			raise ValueError(f"No strategy defined for round {round_number}")
+		return self.blocks[idx]
+
+	def initial_state(self, initial_sitting: Dict['Table', Dict[Position, Pair]], initial_boardgroup_placement: Dict['Table', List[BoardGroup]]) -> Tuple[Seats, Queues]:
+		seats: Seats = [None] * (len(self.tables) * len(SEAT_POSITIONS))
+		for table, sitting in initial_sitting.items():
+			if table not in self.table_index:
+				continue
+			for position, pair in sitting.items():
+				seats[self.seat(table, position)] = pair
+		queues: Queues = [list(initial_boardgroup_placement.get(table, [])) for table in self.tables]
+		return seats, queues
+
+	def state_from_round(self, round_dict: Dict['Table', Tuple[Dict[Position, Pair], List[BoardGroup]]]) -> Tuple[Seats, Queues]:
+		"""Inverse of `materialize`: rebuilds the flat state from a `round_data` entry."""
+		sitting = {table: sit for table, (sit, _) in round_dict.items()}
+		placement = {table: bgs for table, (_, bgs) in round_dict.items()}
+		return self.initial_state(sitting, placement)
+
+	def advance(self, block: CompiledBlock, seats: Seats, queues: Queues) -> Tuple[Seats, Queues]:
+		"""Applies one compiled strategy entry to the previous round's state."""
+		new_seats = list(seats)
+		for dst, srcs in block.pair_moves:
+			for src in srcs:
+				pair = seats[src]
+				if pair:
+					new_seats[dst] = pair
+					break
+
+		pops = block.board_pops
+		new_queues = [queue[pops[idx]:] for idx, queue in enumerate(queues)]
+		for dst, src, k in block.board_appends:
+			src_queue = queues[src]
+			if k < len(src_queue):
+				new_queues[dst].append(src_queue[k])
+
+		return new_seats, new_queues
+
+	def play(self, initial_sitting: Dict['Table', Dict[Position, Pair]], initial_boardgroup_placement: Dict['Table', List[BoardGroup]], rounds: Optional[int] = None) -> Dict[int, Dict['Table', Tuple[Dict[Position, Pair], List[BoardGroup]]]]:
+		"""
+		`round_data` of rounds 1..`rounds` from an initial placement; `rounds` defaults to
+		the last round the strategy defines.
+		"""
+		if rounds is None:
+			rounds = max(self.round_lookup, default=1)
+		seats, queues = self.initial_state(initial_sitting, initial_boardgroup_placement)
+		round_data = {1: self.materialize(seats, queues)}
+		for rnd in range(2, rounds + 1):
+			seats, queues = self.advance(self.block_for_round(rnd), seats, queues)
+			round_data[rnd] = self.materialize(seats, queues)
+		return round_data
+
+	def materialize(self, seats: Seats, queues: Queues) -> Dict['Table', Tuple[Dict[Position, Pair], List[BoardGroup]]]:
+		"""Turns flat state into the `round_data` shape used by `BaseMovement`."""
+		width = len(SEAT_POSITIONS)
+		round_dict = {}
+		for idx, table in enumerate(self.tables):
+			sitting = {}
+			for offset, position in enumerate(SEAT_POSITIONS):
+				pair = seats[idx * width + offset]
+				if pair is not None:
+					sitting[position] = pair
+			round_dict[table] = (sitting, queues[idx])
+		return round_dict
+
+	def __repr__(self) -> str:
+		return f"CompiledMovementPlan({len(self.tables)} tables, {len(self.blocks)} blocks)"
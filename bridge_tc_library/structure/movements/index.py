@@ -0,0 +1,148 @@
+"""
+Inverted indexes over `round_data`.
+
+`RoundIndex` answers "where is board 17 in round 6", "who has played board 17"
+and "where does pair 5 sit in round 3" with dict lookups instead of scanning
+every table of every round. Rounds are added and dropped one at a time, so a
+`BaseMovement` keeps its index in step with `round_data` as rounds are built
+and invalidated.
+"""
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, TYPE_CHECKING
+
+from bridge_tc_library.structure.core import Position, Pair, BoardGroup
+
+if TYPE_CHECKING:
+	from bridge_tc_library.structure.tournament import Table
+
+RoundDict = Dict['Table', Tuple[Dict[Position, Pair], List[BoardGroup]]]
+
+
+class BoardPlay(NamedTuple):
+	round: int
+	table: 'Table'
+	ns: Pair
+	ew: Pair
+
+
+class PairRound(NamedTuple):
+	"""Where a pair sits in a round; `opponent` is None and `boards` empty when it sits out."""
+	table: 'Table'
+	position: Position
+	opponent: Optional[Pair]
+	boards: Tuple[int, ...]
+
+
+class RoundIndex:
+	"""
+	- board -> {round: [BoardPlay]} for tables where both NS and EW are seated
+	- board -> {pair: plays} for the same plays, so `has_played` is one lookup
+	- (board, round) -> tables holding the board, relay tables included; more than
+	  one when a board is played at several tables in a round (barometer)
+	- (pair, round) -> PairRound
+	"""
+
+	def __init__(self):
+		self._plays: Dict[int, Dict[int, List[BoardPlay]]] = {}
+		self._players: Dict[int, Dict[Pair, int]] = {}
+		self._locations: Dict[Tuple[int, int], List['Table']] = {}
+		self._pair_rounds: Dict[Tuple[Pair, int], PairRound] = {}
+		# keys added per round, so a round is dropped without scanning the others
+		self._round_keys: Dict[int, Tuple[Set[int], List[Tuple[int, int]], List[Tuple[Pair, int]]]] = {}
+
+	@property
+	def rounds(self) -> List[int]:
+		return sorted(self._round_keys)
+
+	def add_round(self, round_number: int, round_dict: RoundDict):
+		"""Indexes one round, replacing what was indexed for it before."""
+		self.drop_round(round_number)
+		boards: Set[int] = set()
+		locations: List[Tuple[int, int]] = []
+		pair_keys: List[Tuple[Pair, int]] = []
+		for table, (sitting, groups) in round_dict.items():
+			played = tuple(board for group in groups for board in group.boards)
+			for board in played:
+				tables = self._locations.get((board, round_number))
+				if tables is None:
+					tables = self._locations[(board, round_number)] = []
+					locations.append((board, round_number))
+				tables.append(table)
+			ns, ew = sitting.get(Position.NS), sitting.get(Position.EW)
+			if ns is not None and ew is not None:
+				play = BoardPlay(round_number, table, ns, ew)
+				for board in played:
+					self._plays.setdefault(board, {}).setdefault(round_number, []).append(play)
+					players = self._players.setdefault(board, {})
+					players[ns] = players.get(ns, 0) + 1
+					players[ew] = players.get(ew, 0) + 1
+					boards.add(board)
+				self._pair_rounds[(ns, round_number)] = PairRound(table, Position.NS, ew, played)
+				self._pair_rounds[(ew, round_number)] = PairRound(table, Position.EW, ns, played)
+				pair_keys += [(ns, round_number), (ew, round_number)]
+			else:
+				for position, pair in sitting.items():
+					self._pair_rounds[(pair, round_number)] = PairRound(table, position, None, ())
+					pair_keys.append((pair, round_number))
+		self._round_keys[round_number] = (boards, locations, pair_keys)
+
+	def drop_round(self, round_number: int):
+		keys = self._round_keys.pop(round_number, None)
+		if keys is None:
+			return
+		boards, locations, pair_keys = keys
+		for board in boards:
+			by_round = self._plays[board]
+			players = self._players[board]
+			for play in by_round.pop(round_number):
+				for pair in (play.ns, play.ew):
+					players[pair] -= 1
+					if not players[pair]:
+						del players[pair]
+			if not by_round:
+				del self._plays[board]
+				del self._players[board]
+		for key in locations:
+			self._locations.pop(key, None)
+		for key in pair_keys:
+			self._pair_rounds.pop(key, None)
+
+	def drop_from(self, round_number: int):
+		"""Drops rounds >= round_number."""
+		for rnd in [r for r in self._round_keys if r >= round_number]:
+			self.drop_round(rnd)
+
+	def clear(self):
+		self._plays.clear()
+		self._players.clear()
+		self._locations.clear()
+		self._pair_rounds.clear()
+		self._round_keys.clear()
+
+	def board_table(self, board: int, round_number: int) -> Optional['Table']:
+		"""The first table holding `board` in `round_number`, or None; see `board_tables`."""
+		tables = self._locations.get((board, round_number))
+		return tables[0] if tables else None
+
+	def board_tables(self, board: int, round_number: int) -> List['Table']:
+		"""Every table holding `board` in `round_number`, in round_data order."""
+		return list(self._locations.get((board, round_number), ()))
+
+	def board_plays(self, board: int, round_number: Optional[int] = None) -> List[BoardPlay]:
+		"""Plays of `board` in round order, or only those of `round_number`."""
+		by_round = self._plays.get(board)
+		if not by_round:
+			return []
+		if round_number is not None:
+			return list(by_round.get(round_number, ()))
+		return [play for rnd in sorted(by_round) for play in by_round[rnd]]
+
+	def pairs_played(self, board: int) -> Set[Pair]:
+		"""Pairs that have played `board` in the indexed rounds."""
+		return set(self._players.get(board, ()))
+
+	def has_played(self, pair: Pair, board: int) -> bool:
+		return pair in self._players.get(board, ())
+
+	def pair_round(self, pair: Pair, round_number: int) -> Optional[PairRound]:
+		"""Table, position, opponent and boards of `pair` in `round_number`, or None if not seated."""
+		return self._pair_rounds.get((pair, round_number))
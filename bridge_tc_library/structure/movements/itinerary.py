@@ -0,0 +1,144 @@
+"""
+Pair itineraries, table cards and their exporters.
+
+`build_itineraries` and `build_table_cards` go over `round_data` once and
+produce every pair's (or table's) schedule at the same time. The exporters
+stream rows to a file object: CSV through `csv.writer`, text cards as lines
+joined per card, so a large event is never assembled in one string.
+"""
+import csv
+from typing import Dict, IO, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, TYPE_CHECKING
+
+from bridge_tc_library.structure.core import Position, Pair, BoardGroup
+
+if TYPE_CHECKING:
+	from bridge_tc_library.structure.tournament import Table
+
+RoundData = Dict[int, Dict['Table', Tuple[Dict[Position, Pair], List[BoardGroup]]]]
+
+PAIR_CARD_HEADER = ("pair", "round", "table", "direction", "opponent", "boards")
+TABLE_CARD_HEADER = ("table", "round", "ns", "ew", "boards")
+
+
+class ItineraryStop(NamedTuple):
+	"""One round of a pair; `opponent` is None and `boards` empty when the pair sits out."""
+	round: int
+	table: 'Table'
+	position: Position
+	opponent: Optional[Pair]
+	boards: Tuple[int, ...]
+
+
+class TableStop(NamedTuple):
+	round: int
+	ns: Optional[Pair]
+	ew: Optional[Pair]
+	boards: Tuple[int, ...]
+
+
+def build_itineraries(round_data: RoundData) -> Dict[Pair, List[ItineraryStop]]:
+	"""Every seated pair's rounds, in round order, from one pass over `round_data`."""
+	itineraries: Dict[Pair, List[ItineraryStop]] = {}
+	for rnd in sorted(round_data):
+		for table, (sitting, groups) in round_data[rnd].items():
+			if not sitting:
+				continue
+			ns, ew = sitting.get(Position.NS), sitting.get(Position.EW)
+			played = tuple(board for group in groups for board in group.boards) if ns is not None and ew is not None else ()
+			for position, pair in sitting.items():
+				opponent = ew if position == Position.NS else ns
+				itineraries.setdefault(pair, []).append(ItineraryStop(rnd, table, position, opponent, played))
+	return itineraries
+
+
+def build_table_cards(round_data: RoundData, playable_only: bool = True) -> Dict['Table', List[TableStop]]:
+	"""Every table's rounds, in round order; relay tables are left out unless `playable_only` is False."""
+	cards: Dict['Table', List[TableStop]] = {}
+	for rnd in sorted(round_data):
+		for table, (sitting, groups) in round_data[rnd].items():
+			if playable_only and not table.isplayable:
+				continue
+			boards = tuple(board for group in groups for board in group.boards)
+			cards.setdefault(table, []).append(TableStop(rnd, sitting.get(Position.NS), sitting.get(Position.EW), boards))
+	return cards
+
+
+def format_boards(boards: Sequence[int]) -> str:
+	"""Boards as ranges: (1, 2, 3, 7) -> '1-3, 7'."""
+	parts = []
+	start = prev = None
+	for board in boards:
+		if prev is not None and board == prev + 1:
+			prev = board
+			continue
+		if start is not None:
+			parts.append(str(start) if start == prev else f"{start}-{prev}")
+		start = prev = board
+	if start is not None:
+		parts.append(str(start) if start == prev else f"{start}-{prev}")
+	return ", ".join(parts)
+
+
+def _name(pair: Optional[Pair]) -> str:
+	return "----" if pair is None else str(pair)
+
+
+def iter_pair_card_rows(itineraries: Dict[Pair, List[ItineraryStop]]) -> Iterator[Tuple[str, ...]]:
+	"""Rows of PAIR_CARD_HEADER, pairs in id order."""
+	for pair in sorted(itineraries, key=lambda p: p.id):
+		name = str(pair)
+		for stop in itineraries[pair]:
+			yield name, str(stop.round), str(stop.table), stop.position.value, _name(stop.opponent), format_boards(stop.boards)
+
+
+def iter_table_card_rows(cards: Dict['Table', List[TableStop]]) -> Iterator[Tuple[str, ...]]:
+	"""Rows of TABLE_CARD_HEADER, tables in the order they appear in round_data."""
+	for table, stops in cards.items():
+		name = str(table)
+		for stop in stops:
+			yield name, str(stop.round), _name(stop.ns), _name(stop.ew), format_boards(stop.boards)
+
+
+def iter_pair_cards_text(itineraries: Dict[Pair, List[ItineraryStop]]) -> Iterator[str]:
+	"""One printable guide card per pair."""
+	for pair in sorted(itineraries, key=lambda p: p.id):
+		lines = [f"Pair {pair}", "Round\tTable\tDirection\tOpponent\tBoards"]
+		lines += [
+			f"{stop.round}\t{stop.table}\t{stop.position.value}\t{_name(stop.opponent)}\t{format_boards(stop.boards)}"
+			for stop in itineraries[pair]
+		]
+		yield "\n".join(lines) + "\n"
+
+
+def iter_table_cards_text(cards: Dict['Table', List[TableStop]]) -> Iterator[str]:
+	"""One printable card per table."""
+	for table, stops in cards.items():
+		lines = [f"Table {table}", "Round\tNS\tEW\tBoards"]
+		lines += [f"{stop.round}\t{_name(stop.ns)}\t{_name(stop.ew)}\t{format_boards(stop.boards)}" for stop in stops]
+		yield "\n".join(lines) + "\n"
+
+
+def _write(fh: IO[str], fmt: str, header: Tuple[str, ...], rows: Iterable[Tuple[str, ...]], cards: Iterable[str]):
+	if fmt == "csv":
+		writer = csv.writer(fh)
+		writer.writerow(header)
+		writer.writerows(rows)
+	elif fmt == "text":
+		for idx, card in enumerate(cards):
+			if idx:
+				fh.write("\n")
+			fh.write(card)
+	else:
+		raise ValueError(f"Unknown card format {fmt!r} (expected 'csv' or 'text')")
+
+
+def export_pair_cards(round_data: RoundData, fh: IO[str], fmt: str = "csv"):
+	"""Writes every pair's guide card to `fh` as CSV rows or text cards."""
+	itineraries = build_itineraries(round_data)
+	_write(fh, fmt, PAIR_CARD_HEADER, iter_pair_card_rows(itineraries), iter_pair_cards_text(itineraries))
+
+
+def export_table_cards(round_data: RoundData, fh: IO[str], fmt: str = "csv"):
+	"""Writes every playing table's card to `fh` as CSV rows or text cards."""
+	cards = build_table_cards(round_data)
+	_write(fh, fmt, TABLE_CARD_HEADER, iter_table_card_rows(cards), iter_table_cards_text(cards))
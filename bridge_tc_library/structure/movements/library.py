@@ -0,0 +1,168 @@
+"""
+On-disk library of movement templates.
+
+A library is a directory holding `index.json` and one compact JSON record per
+movement. Opening a library reads only the index; a record is decoded into a
+`MovementTemplate` the first time it is requested and kept afterwards.
+
+Seats are stored as `table_index * 2 + position_index` (NS 0, EW 1), the same
+numbering `CompiledMovementPlan` uses.
+"""
+import json
+import os
+import re
+import tempfile
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from .compiled import SEAT_POSITIONS, POSITION_INDEX
+from .template import MovementTemplate
+
+INDEX_FILE = "index.json"
+LIBRARY_VERSION = 1
+# names become file names inside the library directory
+NAME_PATTERN = re.compile(r"[A-Za-z0-9][A-Za-z0-9_.-]*")
+
+
+class LibraryEntry(NamedTuple):
+	"""
+	Index record of one stored movement.
+	A movement for `pairs` pairs is also offered to a field one pair smaller (the missing pair is a bye).
+	"""
+	name: str
+	family: str
+	pairs: int
+	tables: int
+	num_board_groups: int
+	rounds: int
+	file: str
+
+	def fits(self, pairs: Optional[int] = None, tables: Optional[int] = None, boards: Optional[int] = None) -> bool:
+		"""Whether the movement suits `pairs` pairs, `tables` playing tables and `boards` boards in play."""
+		if pairs is not None and not self.pairs - 1 <= pairs <= self.pairs:
+			return False
+		if tables is not None and tables != self.tables:
+			return False
+		return boards is None or boards % self.num_board_groups == 0
+
+
+def _seat(seat: Tuple[int, Any]) -> int:
+	return seat[0] * len(SEAT_POSITIONS) + POSITION_INDEX[seat[1]]
+
+
+def _unseat(code: int) -> Tuple[int, Any]:
+	return code // len(SEAT_POSITIONS), SEAT_POSITIONS[code % len(SEAT_POSITIONS)]
+
+
+def encode_template(template: MovementTemplate) -> Dict[str, Any]:
+	return {
+		"family": template.family,
+		"playable": [int(p) for p in template.playable],
+		"entries": [
+			[[v for s, d in pair_moves for v in (_seat(s), _seat(d))], [v for move in board_moves for v in move], list(rounds)]
+			for pair_moves, board_moves, rounds in template.entries
+		],
+		"initial_seats": None if template.initial_seats is None else [_seat(s) for s in template.initial_seats],
+		"initial_groups": None if template.initial_groups is None else list(template.initial_groups),
+	}
+
+
+def decode_template(record: Dict[str, Any]) -> MovementTemplate:
+	entries = []
+	for pair_moves, board_moves, rounds in record["entries"]:
+		entries.append((
+			tuple((_unseat(pair_moves[i]), _unseat(pair_moves[i + 1])) for i in range(0, len(pair_moves), 2)),
+			tuple((board_moves[i], board_moves[i + 1]) for i in range(0, len(board_moves), 2)),
+			tuple(rounds),
+		))
+	seats = record.get("initial_seats")
+	groups = record.get("initial_groups")
+	return MovementTemplate(
+		record["family"],
+		tuple(entries),
+		tuple(bool(p) for p in record["playable"]),
+		initial_seats=None if seats is None else tuple(_unseat(s) for s in seats),
+		initial_groups=None if groups is None else tuple(groups),
+	)
+
+
+def _write_json(path: str, data: Any):
+	"""Writes `data` next to `path` and moves it into place, so readers never see a partial file."""
+	fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+	try:
+		with os.fdopen(fd, "w", encoding="utf-8") as fh:
+			json.dump(data, fh, separators=(",", ":"))
+		os.replace(tmp_path, path)
+	except BaseException:
+		os.unlink(tmp_path)
+		raise
+
+
+class MovementLibrary:
+	"""
+	Movement templates stored under `path`.
+	Only the index is read on construction; `load` decodes records on first use.
+	"""
+	def __init__(self, path: str):
+		self.path = path
+		self._templates: Dict[str, MovementTemplate] = {}
+		self.entries: Dict[str, LibraryEntry] = {}
+		self._by_tables: Dict[int, List[LibraryEntry]] = {}
+		index_path = os.path.join(path, INDEX_FILE)
+		if os.path.exists(index_path):
+			with open(index_path, "r", encoding="utf-8") as fh:
+				index = json.load(fh)
+			if index.get("version") != LIBRARY_VERSION:
+				raise ValueError(f"Unsupported movement library version {index.get('version')}")
+			for item in index["movements"]:
+				self._add_entry(LibraryEntry(**item))
+
+	def _add_entry(self, entry: LibraryEntry):
+		old = self.entries.get(entry.name)
+		if old is not None:
+			self._by_tables[old.tables].remove(old)
+		self.entries[entry.name] = entry
+		self._by_tables.setdefault(entry.tables, []).append(entry)
+
+	def __len__(self) -> int:
+		return len(self.entries)
+
+	def __contains__(self, name: str) -> bool:
+		return name in self.entries
+
+	def find(self, pairs: Optional[int] = None, tables: Optional[int] = None, boards: Optional[int] = None) -> List[LibraryEntry]:
+		"""Index entries matching the given field; answered without reading any record."""
+		if tables is not None:
+			candidates = self._by_tables.get(tables, [])
+		else:
+			candidates = list(self.entries.values())
+		return [entry for entry in candidates if entry.fits(pairs, tables, boards)]
+
+	def load(self, name: str) -> MovementTemplate:
+		template = self._templates.get(name)
+		if template is None:
+			entry = self.entries[name]
+			with open(os.path.join(self.path, entry.file), "r", encoding="utf-8") as fh:
+				template = decode_template(json.load(fh))
+			self._templates[name] = template
+		return template
+
+	def save(self, name: str, template: MovementTemplate, pairs: Optional[int] = None) -> LibraryEntry:
+		"""
+		Stores `template` under `name` and rewrites the index.
+		`pairs` defaults to the number of initially seated pairs. `name` is used as a file
+		name, so it must be letters, digits, '_', '-' and '.', not starting with '.'.
+		"""
+		if not NAME_PATTERN.fullmatch(name) or f"{name}.json" == INDEX_FILE:
+			raise ValueError(f"Invalid movement name {name!r}")
+		if pairs is None:
+			if template.initial_seats is None:
+				raise ValueError("pairs must be given for templates without initial seating")
+			pairs = len(template.initial_seats)
+		num_board_groups = len(template.initial_groups) if template.initial_groups is not None else template.size
+		entry = LibraryEntry(name, template.family, pairs, sum(template.playable), num_board_groups, template.rounds, f"{name}.json")
+		os.makedirs(self.path, exist_ok=True)
+		_write_json(os.path.join(self.path, entry.file), encode_template(template))
+		self._add_entry(entry)
+		self._templates[name] = template
+		_write_json(os.path.join(self.path, INDEX_FILE), {"version": LIBRARY_VERSION, "movements": [e._asdict() for e in self.entries.values()]})
+		return entry
@@ -1,6 +1,9 @@
-from typing import Dict, Tuple, List, TYPE_CHECKING
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple, List, TYPE_CHECKING
 
 from .strategy import MovementStrategy
+from .compiled import CompiledMovementPlan
+from .index import RoundIndex, PairRound
 from bridge_tc_library.structure.core import Position, Pair, BoardGroup
 
 if TYPE_CHECKING:
@@ -13,8 +16,6 @@ class BaseMovement:
 	board_groups: list['BoardGroup']
 	pairs: list['Pair']
 	movement_strategies: MovementStrategy
-	initial_sitting: Dict['Table', Dict[Position, Pair]]
-	initial_boardgroup_placement: Dict['Table', list['BoardGroup']]
 	round_data: Dict[int, Dict['Table', Tuple[Dict[Position, Pair], 'BoardGroup']]]
 
 	def __init__(self, tables: list['Table'], board_groups: list['BoardGroup'], pairs: list[Pair], movement_strategies: MovementStrategy):
@@ -22,21 +23,92 @@ class BaseMovement:
 		self.board_groups = board_groups
 		self.pairs = pairs
 		self.movement_strategies = movement_strategies
-		self.initial_sitting: Dict['Table', Dict[Position, Pair]] = None
-		self.initial_boardgroup_placement: Dict['Table', list['BoardGroup']] = None
+		# bumped whenever initial_sitting or initial_boardgroup_placement is assigned
+		self._input_version = 0
+		self._initial_sitting: Dict['Table', Dict[Position, Pair]] = None
+		self._initial_boardgroup_placement: Dict['Table', list['BoardGroup']] = None
 		self.round_data: Dict[int, Dict['Table', Tuple[Dict[Position, Pair], 'BoardGroup']]] = {}
+		self._compiled_plan: CompiledMovementPlan = None
+		# (round_number, seats, queues, round_dict) of the last round built lazily
+		self._build_state: Optional[tuple] = None
+		# input version round_data was built from
+		self._build_inputs: Optional[int] = None
+		# built on first use of `index`, then updated as rounds are built and invalidated
+		self._index: Optional[RoundIndex] = None
+		# round -> (object the view was built from, read-only view); for round 1 the input version
+		self._sitting_views: Dict[int, Tuple[Any, Mapping]] = {}
+		self._boards_views: Dict[int, Tuple[Any, Mapping]] = {}
+
+	@property
+	def initial_sitting(self) -> Dict['Table', Dict[Position, Pair]]:
+		"""
+		Pairs seated in round 1. Assigning it marks the movement inputs as changed; after
+		editing it in place, pass it to `set_initial_sitting` again.
+		"""
+		return self._initial_sitting
+
+	@initial_sitting.setter
+	def initial_sitting(self, initial_sitting: Dict['Table', Dict[Position, Pair]]):
+		self._initial_sitting = initial_sitting
+		self._input_version += 1
+
+	@property
+	def initial_boardgroup_placement(self) -> Dict['Table', list['BoardGroup']]:
+		"""Board groups on each table in round 1; assigned and edited like `initial_sitting`."""
+		return self._initial_boardgroup_placement
+
+	@initial_boardgroup_placement.setter
+	def initial_boardgroup_placement(self, initial_boardgroup_placement: Dict['Table', list['BoardGroup']]):
+		self._initial_boardgroup_placement = initial_boardgroup_placement
+		self._input_version += 1
 
 	def set_initial_sitting(self, initial_sitting: Dict['Table', Dict[Position, Pair]]):
 		"""
-		Set the initial sitting for the movement.
+		Set the initial sitting for the movement. Invalidates all constructed rounds.
 		"""
 		self.initial_sitting = initial_sitting
+		self.invalidate_from(1)
 	
 	def set_initial_boardgroup_placement(self, initial_boardgroup_placement: Dict['Table', list['BoardGroup']]):
 		"""
-		Set the initial boardgroups placement for the movement.
+		Set the initial boardgroups placement for the movement. Invalidates all constructed rounds.
 		"""
 		self.initial_boardgroup_placement = initial_boardgroup_placement
+		self.invalidate_from(1)
+
+	def update_strategy(self, index: int, strategy: Tuple[List, List, List[int]]) -> Optional[int]:
+		"""
+		Replace one entry of movement_strategies and invalidate only the rounds it affects.
+		Returns the first invalidated round, or None if no constructed round changed.
+		"""
+		first = self.movement_strategies.replace(index, strategy)
+		if first is not None:
+			self.invalidate_from(max(first, 2))
+		return first
+
+	def set_movement_strategies(self, movement_strategies: MovementStrategy) -> Optional[int]:
+		"""
+		Swap in a new MovementStrategy, invalidating rounds from the first one it changes.
+		"""
+		first = self.movement_strategies.first_difference(movement_strategies)
+		self.movement_strategies = movement_strategies
+		if first is not None:
+			self.invalidate_from(max(first, 2))
+		return first
+
+	def invalidate_from(self, round_number: int):
+		"""
+		Drop constructed rounds >= round_number; they are rebuilt on the next request.
+		"""
+		for rnd in [r for r in self.round_data if r >= round_number]:
+			del self.round_data[rnd]
+		if self._index is not None:
+			self._index.drop_from(round_number)
+		for views in (self._sitting_views, self._boards_views):
+			for rnd in [r for r in views if r >= round_number]:
+				del views[rnd]
+		if self._build_state is not None and self._build_state[0] >= round_number:
+			self._build_state = None
 
 	def autogenerate_initial_sitting(self) -> Dict['Table', Dict[Position, Pair]]:
 		"""
@@ -84,47 +156,189 @@ class BaseMovement:
 					# TODO: should create storage table automatically? for now, raise error
 		return self.initial_boardgroup_placement
 
-	def get_sitting_for_round(self, round_number: int) -> Dict['Table', Dict[Position, Pair]]:
+	def get_sitting_for_round(self, round_number: int) -> Mapping['Table', Mapping[Position, Pair]]:
 		"""
-		{(table_name, position): Pair}
+		Read-only {table: {position: Pair}}; from round 2 only tables with both NS and EW seated.
+		Views are built once per round and reused until the round is rebuilt or invalidated;
+		the round 1 view is rebuilt when initial_sitting is set again.
 		"""
-		
 		if round_number == 1:
-			return self.initial_sitting
+			if self.initial_sitting is None:
+				return None
+			source = self._input_version
 		else:
-			if self.round_data.get(round_number):
-				sitting_for_round = {}
-				for table, (sitting, _) in self.round_data[round_number].items():
-					# Only include tables that have both NS and EW positions filled
-					if sitting and Position.NS in sitting and Position.EW in sitting:
-						sitting_for_round[table] = sitting
-				return sitting_for_round
-			else:
+			if not self._ensure_round(round_number):
 				raise ValueError(f"Sitting for round {round_number} not found. Make sure to run construct_movement first.")
+			source = self.round_data[round_number]
+		cached = self._sitting_views.get(round_number)
+		if cached is not None and (cached[0] == source if round_number == 1 else cached[0] is source):
+			return cached[1]
 
+		if round_number == 1:
+			# copied, so later edits of initial_sitting do not show through
+			view = MappingProxyType({table: MappingProxyType(dict(sitting)) for table, sitting in self.initial_sitting.items()})
+		else:
+			view = MappingProxyType({
+				table: MappingProxyType(sitting)
+				for table, (sitting, _) in source.items()
+				# Only include tables that have both NS and EW positions filled
+				if sitting and Position.NS in sitting and Position.EW in sitting
+			})
+		self._sitting_views[round_number] = (source, view)
+		return view
 
-	def get_boards_for_round(self, round_number: int) -> Dict['Table', 'BoardGroup']:
+	def get_boards_for_round(self, round_number: int) -> Mapping['Table', Tuple['BoardGroup', ...]]:
 		"""
-		{table_name: BoardGroup}
+		Read-only {table: (BoardGroup, ...)} in FIFO order, cached like `get_sitting_for_round`.
 		"""
-		
 		if round_number == 1:
-			return self.initial_boardgroup_placement
+			if self.initial_boardgroup_placement is None:
+				return None
+			source = self._input_version
 		else:
-			if self.round_data.get(round_number):
-				boards_for_round = {}
-				for table, (_, boardgroup) in self.round_data[round_number].items():
-					boards_for_round[table] = boardgroup
-				return boards_for_round
-			else:
+			if not self._ensure_round(round_number):
 				raise ValueError(f"Board placement for round {round_number} not found. Make sure to run construct_movement first.")
+			source = self.round_data[round_number]
+		cached = self._boards_views.get(round_number)
+		if cached is not None and (cached[0] == source if round_number == 1 else cached[0] is source):
+			return cached[1]
+
+		if round_number == 1:
+			view = MappingProxyType({table: tuple(groups) for table, groups in self.initial_boardgroup_placement.items()})
+		else:
+			view = MappingProxyType({table: tuple(boardgroups) for table, (_, boardgroups) in source.items()})
+		self._boards_views[round_number] = (source, view)
+		return view
 
-	def construct_movement(self, rounds: int) -> Dict[int, Dict['Table', Tuple[Dict[Position, Pair], List['BoardGroup']]]]:
+	@property
+	def index(self) -> RoundIndex:
+		"""
+		Inverted indexes over the constructed rounds (board -> plays, (pair, round) -> seat).
+		Built on first use and kept in step with round_data as rounds are built or invalidated.
+		"""
+		if self._index is None:
+			self._index = RoundIndex()
+			for rnd in sorted(self.round_data):
+				self._index.add_round(rnd, self.round_data[rnd])
+		return self._index
+
+	def get_board_table(self, board: int, round_number: int) -> Optional['Table']:
+		"""The (first) table holding `board` in `round_number`, building the round if needed."""
+		if not self._ensure_round(round_number):
+			raise ValueError(f"Round {round_number} not found. Make sure to run construct_movement first.")
+		return self.index.board_table(board, round_number)
+
+	def get_pair_round(self, pair: Pair, round_number: int) -> Optional[PairRound]:
+		"""Table, position, opponent and boards of `pair` in `round_number`, building the round if needed."""
+		if not self._ensure_round(round_number):
+			raise ValueError(f"Round {round_number} not found. Make sure to run construct_movement first.")
+		return self.index.pair_round(pair, round_number)
+
+	def _set_round(self, round_number: int, round_dict: Dict['Table', Tuple[Dict[Position, Pair], List['BoardGroup']]]):
+		self.round_data[round_number] = round_dict
+		if self._index is not None:
+			self._index.add_round(round_number, round_dict)
+
+	def compile_plan(self) -> CompiledMovementPlan:
+		"""
+		Returns the compiled form of movement_strategies for the current tables.
+		The plan is cached and rebuilt only when the strategy or the table list changes.
+		"""
+		plan = self._compiled_plan
+		strategy = self.movement_strategies
+		if plan is None or plan.strategy is not strategy or plan.strategy_version != strategy.version or plan.tables != self.tables:
+			plan = strategy.compile(self.tables)
+			self._compiled_plan = plan
+		return plan
+
+	def construct_movement(self, rounds: int, compiled: bool = True) -> Dict[int, Dict['Table', Tuple[Dict[Position, Pair], List['BoardGroup']]]]:
 		"""
 		Construct round_data for all rounds based on initial state and movement strategies.
 		Uses simultaneous-move semantics for pairs and FIFO queue semantics for board-groups.
+		With compiled=True (default) the strategy is applied through a `CompiledMovementPlan`,
+		which gives the same round_data in O(tables x rounds). Rounds that are already
+		constructed and still valid are kept; only the missing ones are built.
+		"""
+		if not compiled:
+			self._build_state = None
+			return self._construct_movement_uncompiled(rounds)
+
+		self._build_until(rounds)
+		self.invalidate_from(rounds + 1)
+		return self.round_data
+
+	def iter_rounds(self, start: int = 1, stop: Optional[int] = None) -> Iterator[Tuple[int, Dict['Table', Tuple[Dict[Position, Pair], List['BoardGroup']]]]]:
+		"""
+		Yields (round_number, round_data[round_number]) building rounds on demand.
+		Without `stop` iteration ends at the first round the strategy does not define.
+		"""
+		rnd = start
+		while stop is None or rnd <= stop:
+			if stop is None and rnd > 1 and rnd not in self.round_data and rnd not in self.compile_plan().round_lookup:
+				return
+			self._build_until(rnd)
+			yield rnd, self.round_data[rnd]
+			rnd += 1
+
+	def _ensure_round(self, round_number: int) -> bool:
+		"""
+		Makes sure round_number is constructed, building it lazily when the initial state is known.
+		"""
+		if self.round_data.get(round_number):
+			return True
+		if self.initial_sitting is None or self.initial_boardgroup_placement is None or round_number < 1:
+			return False
+		if round_number > 1 and round_number not in self.compile_plan().round_lookup:
+			return False
+		self._build_until(round_number)
+		return True
+
+	def _build_until(self, rounds: int):
+		"""
+		Extends round_data up to `rounds`, resuming from the last constructed round.
+		"""
+		if self._build_inputs != self._input_version:
+			# initial state set again since round_data was built
+			self.invalidate_from(1)
+			self._build_inputs = self._input_version
+
+		state = self._build_state
+		# invalidate_from drops the state when it removes the rounds it ends with
+		if state is not None and state[0] >= rounds and self.round_data.get(state[0]) is state[3]:
+			return
+
+		plan = self.compile_plan()
+		if state is None or self.round_data.get(state[0]) is not state[3]:
+			last = 0
+			while (last + 1) in self.round_data:
+				last += 1
+			self.invalidate_from(last + 1)
+			if last == 0:
+				seats, queues = plan.initial_state(self.initial_sitting, self.initial_boardgroup_placement)
+				last = 1
+				self._set_round(1, plan.materialize(seats, queues))
+			else:
+				seats, queues = plan.state_from_round(self.round_data[last])
+			state = (last, seats, queues, self.round_data[last])
+
+		last, seats, queues, _ = state
+		try:
+			for rnd in range(last + 1, rounds + 1):
+				seats, queues = plan.advance(plan.block_for_round(rnd), seats, queues)
+				self._set_round(rnd, plan.materialize(seats, queues))
+				last = rnd
+		finally:
+			self._build_state = (last, seats, queues, self.round_data[last])
+
+	def _construct_movement_uncompiled(self, rounds: int) -> Dict[int, Dict['Table', Tuple[Dict[Position, Pair], List['BoardGroup']]]]:
+		"""
+		Reference implementation of construct_movement working on per-table dict snapshots.
 		"""
 		self.round_data = {}
+		self._index = None
+		self._sitting_views.clear()
+		self._boards_views.clear()
+		self._build_inputs = self._input_version
 
 		# Round 1: copy from initial state
 		self.round_data[1] = {
@@ -0,0 +1,261 @@
+"""
+Simulated-annealing search for custom movements.
+
+For pair counts without a classic movement the optimizer searches the seating
+and the board group placement of every round directly:
+- seats[r][s] is the pair at seat s in round r; seat 2t is NS and 2t + 1 EW at playing
+  table t, and with an odd field the last seat is the bye (the pair sits out)
+- slots[r][k] is the board group at slot k; slots 0..tables-1 are the playing tables, the
+  rest are relay tables holding idle board groups
+
+Round 1 is fixed (pair k at seat k, group k at slot k). A move swaps two seats
+or two slots within one round; only the two tables it touches are taken out of
+and put back into the running counters, so every move is scored in O(1).
+
+The cost counts replayed boards and repeated opponents (the `ValidationEngine`
+rules) with a large weight, then the squared NS/EW imbalance and the squared
+number of byes of every pair. Independent restarts run on a process pool and
+the best result becomes a `MovementTemplate` with relay tables.
+"""
+import os
+import random
+import time
+from math import exp
+from typing import List, NamedTuple, Optional, Tuple, TYPE_CHECKING
+
+from bridge_tc_library.structure.core import Position
+from .strategy import MovementStrategy
+from .template import MovementTemplate
+
+if TYPE_CHECKING:
+	from bridge_tc_library.structure.tournament import Table
+
+FAMILY = "annealed"
+HARD_WEIGHT = 20
+START_TEMPERATURE = 10.0
+END_TEMPERATURE = 0.3
+
+
+class OptimizedMovement(NamedTuple):
+	"""Best movement found: `conflicts` counts replayed boards plus repeated meetings (0 when valid)."""
+	template: MovementTemplate
+	cost: int
+	conflicts: int
+
+	@property
+	def ok(self) -> bool:
+		return self.conflicts == 0
+
+	def strategy(self, tables: List['Table']) -> MovementStrategy:
+		return self.template.bind(tables)
+
+
+def lower_bound(num_pairs: int, rounds: int) -> int:
+	"""Smallest reachable soft cost: byes spread evenly, NS/EW off by one only for odd rounds played."""
+	byes, extra = divmod(rounds * (num_pairs % 2), num_pairs)
+	bound = extra * (byes + 1) ** 2 + (num_pairs - extra) * byes ** 2
+	return bound + extra * ((rounds - byes - 1) % 2) + (num_pairs - extra) * ((rounds - byes) % 2)
+
+
+class _Search:
+	"""Annealing state with incrementally maintained conflict counters."""
+
+	def __init__(self, num_pairs: int, rounds: int, num_board_groups: int, rng: random.Random):
+		self.num_pairs = num_pairs
+		self.rounds = rounds
+		self.num_board_groups = num_board_groups
+		self.tables = num_pairs // 2
+		self.rng = rng
+		self.seats: List[List[int]] = [list(range(num_pairs))]
+		self.slots: List[List[int]] = [list(range(num_board_groups))]
+		for _ in range(1, rounds):
+			seats, slots = list(range(num_pairs)), list(range(num_board_groups))
+			rng.shuffle(seats)
+			rng.shuffle(slots)
+			self.seats.append(seats)
+			self.slots.append(slots)
+
+		self.meet = [0] * (num_pairs * num_pairs)
+		self.play = [0] * (num_pairs * num_board_groups)
+		self.balance = [0] * num_pairs  # NS rounds - EW rounds
+		self.byes = [0] * num_pairs
+		self.hard = 0
+		self.soft = 0
+		for rnd in range(rounds):
+			for table in range(self.tables + num_pairs % 2):
+				self._table(rnd, table, 1)
+
+	@property
+	def cost(self) -> int:
+		return HARD_WEIGHT * self.hard + self.soft
+
+	def _table(self, rnd: int, table: int, sign: int):
+		"""Adds (sign 1) or removes (sign -1) the contribution of `table` in round `rnd`."""
+		seats = self.seats[rnd]
+		if table == self.tables:
+			pair = seats[2 * table]
+			old = self.byes[pair]
+			self.byes[pair] = old + sign
+			self.soft += 2 * old * sign + 1
+			return
+		ns, ew = seats[2 * table], seats[2 * table + 1]
+		group = self.slots[rnd][table]
+		width = self.num_board_groups
+
+		met = self.meet[ns * self.num_pairs + ew]
+		if met - (sign < 0) >= 1:
+			self.hard += sign
+		self.meet[ns * self.num_pairs + ew] = self.meet[ew * self.num_pairs + ns] = met + sign
+		for pair, direction in ((ns, sign), (ew, -sign)):
+			played = self.play[pair * width + group]
+			if played - (sign < 0) >= 1:
+				self.hard += sign
+			self.play[pair * width + group] = played + sign
+			old = self.balance[pair]
+			self.balance[pair] = old + direction
+			self.soft += 2 * old * direction + 1
+
+	def _swap(self, rnd: int, row: List[int], a: int, b: int, tables: Tuple[int, ...]):
+		for table in tables:
+			self._table(rnd, table, -1)
+		row[a], row[b] = row[b], row[a]
+		for table in tables:
+			self._table(rnd, table, 1)
+
+	def anneal(self, time_budget: Optional[float], target: int, max_iterations: Optional[int] = None) -> Tuple[int, int, List[List[int]], List[List[int]]]:
+		"""
+		Anneals until the cost reaches `target`, `time_budget` seconds pass or `max_iterations`
+		moves were tried. The temperature follows whichever limit is closer, so a search with
+		only `max_iterations` does not depend on the speed of the machine.
+		"""
+		rng = self.rng
+		num_pairs, tables, num_board_groups = self.num_pairs, self.tables, self.num_board_groups
+		best = cost = self.cost
+		best_state = ([list(s) for s in self.seats], [list(s) for s in self.slots], self.hard)
+		start = time.perf_counter()
+		temperature = START_TEMPERATURE
+		ratio = END_TEMPERATURE / START_TEMPERATURE
+		iteration = 0
+		limit = max_iterations if max_iterations is not None else float("inf")
+		while best > target and self.rounds > 1 and iteration < limit:
+			iteration += 1
+			if iteration & 255 == 0:
+				progress = iteration / limit
+				if time_budget is not None:
+					progress = max(progress, (time.perf_counter() - start) / time_budget)
+				if progress >= 1.0:
+					break
+				temperature = START_TEMPERATURE * ratio ** progress
+
+			rnd = rng.randrange(1, self.rounds)
+			if rng.random() < 0.5:
+				row = self.seats[rnd]
+				a, b = rng.randrange(num_pairs), rng.randrange(num_pairs)
+				if a // 2 == b // 2:
+					if a == b:
+						continue
+					touched: Tuple[int, ...] = (a // 2,)
+				else:
+					touched = (a // 2, b // 2)
+			else:
+				row = self.slots[rnd]
+				a, b = rng.randrange(tables), rng.randrange(num_board_groups)
+				if a == b:
+					continue
+				touched = (a, b) if b < tables else (a,)
+
+			self._swap(rnd, row, a, b, touched)
+			new_cost = self.cost
+			delta = new_cost - cost
+			if delta <= 0 or rng.random() < exp(-delta / temperature):
+				cost = new_cost
+				if cost < best:
+					best = cost
+					best_state = ([list(s) for s in self.seats], [list(s) for s in self.slots], self.hard)
+			else:
+				self._swap(rnd, row, a, b, touched)
+		seats, slots, hard = best_state
+		return best, hard, seats, slots
+
+
+def _run_restart(args: Tuple[int, int, int, Optional[float], Optional[int], int]) -> Tuple[int, int, List[List[int]], List[List[int]]]:
+	num_pairs, rounds, num_board_groups, time_budget, max_iterations, seed = args
+	search = _Search(num_pairs, rounds, num_board_groups, random.Random(seed))
+	return search.anneal(time_budget, lower_bound(num_pairs, rounds), max_iterations)
+
+
+def build_template(num_pairs: int, seats: List[List[int]], slots: List[List[int]]) -> MovementTemplate:
+	"""
+	The movement of per-round `seats` / `slots` as a template: playing tables, then the bye
+	table for an odd field (its NS seat is the bye), then one relay table per idle board group.
+	"""
+	tables = num_pairs // 2
+	bye = num_pairs % 2
+	num_board_groups = len(slots[0])
+
+	def seat(index: int) -> Tuple[int, Position]:
+		return index // 2, Position.EW if index % 2 else Position.NS
+
+	def slot_table(index: int) -> int:
+		return index if index < tables else index + bye
+
+	entries = []
+	previous_seat = {pair: idx for idx, pair in enumerate(seats[0])}
+	previous_slot = {group: idx for idx, group in enumerate(slots[0])}
+	for rnd in range(1, len(seats)):
+		pair_moves = tuple((seat(previous_seat[pair]), seat(idx)) for idx, pair in enumerate(seats[rnd]))
+		board_moves = tuple((slot_table(previous_slot[group]), slot_table(idx)) for idx, group in enumerate(slots[rnd]))
+		entries.append((pair_moves, board_moves, (rnd + 1,)))
+		previous_seat = {pair: idx for idx, pair in enumerate(seats[rnd])}
+		previous_slot = {group: idx for idx, group in enumerate(slots[rnd])}
+
+	first_seat = {pair: idx for idx, pair in enumerate(seats[0])}
+	first_slot = {group: idx for idx, group in enumerate(slots[0])}
+	return MovementTemplate(
+		FAMILY,
+		tuple(entries),
+		(True,) * (tables + bye) + (False,) * (num_board_groups - tables),
+		initial_seats=tuple(seat(first_seat[pair]) for pair in range(num_pairs)),
+		initial_groups=tuple(slot_table(first_slot[group]) for group in range(num_board_groups)),
+	)
+
+
+def optimize_movement(num_pairs: int, rounds: int, num_board_groups: Optional[int] = None, time_budget: Optional[float] = 5.0, restarts: Optional[int] = None, processes: Optional[int] = None, seed: Optional[int] = None, max_iterations: Optional[int] = None) -> OptimizedMovement:
+	"""
+	Searches a movement of `rounds` rounds for `num_pairs` pairs over `num_board_groups` board
+	groups (default: one per round, so no group has to be replayed).
+
+	`restarts` independent searches (default: one per worker) run on `processes` workers
+	(default: CPU count; 1 runs them here) and share the `time_budget` in seconds; a search
+	stops early once it reaches the lower bound of the cost. `max_iterations` caps the moves
+	tried by each search; with `time_budget=None` and a `seed` the result is reproducible on
+	any machine. Tight fields (e.g. complete round robins) may keep conflicts, see
+	`OptimizedMovement.ok`. The returned template can be bound to tables or saved to a
+	`MovementLibrary`.
+	"""
+	if num_pairs < 2 or rounds < 1:
+		raise ValueError("A movement needs at least 2 pairs and 1 round")
+	if time_budget is None and max_iterations is None:
+		raise ValueError("Give a time_budget, max_iterations or both")
+	if num_board_groups is None:
+		num_board_groups = rounds
+	if num_board_groups < num_pairs // 2:
+		raise ValueError(f"{num_pairs} pairs need at least {num_pairs // 2} board groups")
+	workers = 1 if processes == 1 else processes or os.cpu_count() or 1
+	if restarts is None:
+		restarts = workers
+	restarts = max(restarts, 1)
+	budget = None if time_budget is None else time_budget / -(-restarts // workers)
+	base = random.randrange(1 << 30) if seed is None else seed
+	jobs = [(num_pairs, rounds, num_board_groups, budget, max_iterations, base + k) for k in range(restarts)]
+
+	if workers == 1 or restarts == 1:
+		results = [_run_restart(job) for job in jobs]
+	else:
+		# imported here: the process pool machinery is only needed for parallel restarts
+		from concurrent.futures import ProcessPoolExecutor
+		with ProcessPoolExecutor(max_workers=workers) as pool:
+			results = list(pool.map(_run_restart, jobs))
+
+	cost, hard, seats, slots = min(results, key=lambda result: result[0])
+	return OptimizedMovement(build_template(num_pairs, seats, slots), cost, hard)
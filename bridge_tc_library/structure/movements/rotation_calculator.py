@@ -1,56 +1,215 @@
 # python
-import importlib
-import inspect
-from typing import Dict, Type, Any, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterable, Type, Any, List, Optional, Tuple, Union, TYPE_CHECKING
 
 from bridge_tc_library.structure import AbstractRotation
 from bridge_tc_library.structure.movements.abstract_rotation import RotationParams
+from bridge_tc_library.structure.movements.canonical import AnalysisCache, fingerprint
+from bridge_tc_library.structure.movements.library import LibraryEntry, MovementLibrary
+from bridge_tc_library.structure.movements.rotations.registry import get_registry
+from bridge_tc_library.structure.movements.template import MovementTemplate, get_template
 
+if TYPE_CHECKING:
+    from bridge_tc_library.structure.movements.balance import BalanceReport
+    from bridge_tc_library.structure.movements.verifier import VerificationReport
 
-class RotationCalculator:
+# (num_pairs, min_boards_amount, max_boards_amount, min_boards_per_boardgroup)
+RotationQuery = Tuple[int, int, int, int]
+
+
+@lru_cache(maxsize=8192)
+def _class_rotations(cls: Type[AbstractRotation], num_pairs: int, min_boards_amount: int, max_boards_amount: int, min_boards_per_boardgroup: int) -> Tuple[RotationParams, ...]:
+    """Memoized `generate_possible_rotations` per (family, pairs, bounds)."""
+    if max_boards_amount < max(min_boards_per_boardgroup, 1) or min_boards_amount > max_boards_amount:
+        return ()
+    return tuple(cls.generate_possible_rotations(num_pairs, min_boards_amount, max_boards_amount, min_boards_per_boardgroup))
+
+
+def boards_played(params: RotationParams) -> int:
+    """Boards each pair plays in a rotation."""
+    rounds = params.num_rounds if params.num_rounds is not None else params.num_board_groups
+    return rounds * params.boards_per_board_group
+
+
+def rank_rotations(rotations: Iterable[Tuple[Any, RotationParams]], min_boards_amount: int, max_boards_amount: int) -> List[Tuple[Any, RotationParams]]:
     """
-    During initialization, dynamically imports all rotation classes from the
-    'bridge_tc_library.structure.movements.rotations' module and stores them in a dictionary.
+    Orders candidates best first: boards played closest to the middle of the requested
+    range, then more rounds (more opponents met), then fewer boards per board group.
     """
+    middle = (min_boards_amount + max_boards_amount) / 2
 
-    def __init__(self) -> None:
-        module_name = "bridge_tc_library.structure.movements.rotations"
-        try:
-            mod = importlib.import_module(module_name)
-        except Exception as e:
-            raise ImportError(f"Couldn't import {module_name}: {e}") from e
+    def key(item: Tuple[Any, RotationParams]):
+        params = item[1]
+        rounds = params.num_rounds if params.num_rounds is not None else params.num_board_groups
+        return abs(boards_played(params) - middle), -rounds, params.boards_per_board_group
 
-        rotations: Dict[str, Type[Any]] = {}
+    return sorted(rotations, key=key)
+
+
+_worker_calculator: Optional["RotationCalculator"] = None
 
-        if hasattr(mod, "_rotation_classes") and isinstance(getattr(mod, "_rotation_classes"), dict):
-            for name, cls in getattr(mod, "_rotation_classes").items():
-                rotations[name] = cls
-        else:
-            for name in dir(mod):
-                if name.startswith("_"):
-                    continue
-                attr = getattr(mod, name)
-                if inspect.isclass(attr) and getattr(attr, "__module__", None) == mod.__name__:
-                    rotations[name] = attr
 
-        self.rotations = rotations
+def _enumerate_query(query: RotationQuery) -> List[Tuple[Any, RotationParams]]:
+    # runs in pool workers; each worker discovers the rotation classes once
+    global _worker_calculator
+    if _worker_calculator is None:
+        _worker_calculator = RotationCalculator()
+    return rank_rotations(_worker_calculator.get_rotations(*query), query[1], query[2])
+
+
+class RotationCalculator:
+    """
+    Looks up rotation classes of the 'bridge_tc_library.structure.movements.rotations'
+    package through its lazy registry; rotation modules are imported when first needed.
+    An optional `MovementLibrary` is queried alongside the rotation classes.
+    """
+
+    def __init__(self, library: Optional[MovementLibrary] = None) -> None:
+        self.library = library
+        self._registry = get_registry()
+        self._rotations: Optional[Dict[str, Type[Any]]] = None
+        self.analysis_cache = AnalysisCache()
+
+    @property
+    def rotations(self) -> Dict[str, Type[Any]]:
+        """Rotation classes by name; their modules are imported on first access."""
+        if self._rotations is None:
+            self._rotations = {name: cls for name, cls in self._registry.load_all().items() if cls is not None}
+        return self._rotations
 
     def get(self, name: str):
-        """Returns the rotation class by its name, or None if not found."""
-        return self.rotations.get(name)
+        """Returns the rotation class by its name, or None if not found. Imports only its module."""
+        if self._rotations is not None:
+            return self._rotations.get(name)
+        return self._registry.get(name)
 
-    def get_rotations(self, num_pairs: int, min_boards_amount: int, max_boards_amount: int, min_boards_per_boardgroup: int) -> List[Tuple[Type[AbstractRotation], RotationParams]]:
+    def get_rotations(self, num_pairs: int, min_boards_amount: int, max_boards_amount: int, min_boards_per_boardgroup: int) -> List[Tuple[Union[Type[AbstractRotation], LibraryEntry], RotationParams]]:
         """
         Returns a list of tuples containing the rotation class and possible rotation parameters.
         Each tuple contains (RotationClass, RotationParams) where RotationParams has
-        (num_tables, num_board_groups, boards_per_board_group).
+        (num_tables, num_board_groups, boards_per_board_group, num_rounds).
+        Movements from the library come as (LibraryEntry, RotationParams); boards amounts
+        count the boards each pair plays (num_rounds * boards_per_board_group).
         """
-        results: List[Tuple[Type[AbstractRotation], RotationParams]] = []
+        return self._generated_rotations(num_pairs, min_boards_amount, max_boards_amount, min_boards_per_boardgroup) + \
+            self._library_rotations(num_pairs, min_boards_amount, max_boards_amount, min_boards_per_boardgroup)
+
+    def _generated_rotations(self, num_pairs: int, min_boards_amount: int, max_boards_amount: int, min_boards_per_boardgroup: int) -> List[Tuple[Any, RotationParams]]:
+        results: List[Tuple[Any, RotationParams]] = []
         for cls in self.rotations.values():
             if hasattr(cls, 'generate_possible_rotations'):
-                possible_rotations = cls.generate_possible_rotations(
-                    num_pairs, min_boards_amount, max_boards_amount, min_boards_per_boardgroup
+                possible_rotations = _class_rotations(
+                    cls, num_pairs, min_boards_amount, max_boards_amount, min_boards_per_boardgroup
                 )
                 for params in possible_rotations:
                     results.append((cls, params))
-        return results
\ No newline at end of file
+        return results
+
+    def _library_rotations(self, num_pairs: int, min_boards_amount: int, max_boards_amount: int, min_boards_per_boardgroup: int) -> List[Tuple[Any, RotationParams]]:
+        results: List[Tuple[Any, RotationParams]] = []
+        if self.library is None:
+            return results
+        for entry in self.library.find(pairs=num_pairs):
+            for boards_per_boardgroup in AbstractRotation.boards_per_boardgroup_range(entry.rounds, min_boards_amount, max_boards_amount, min_boards_per_boardgroup):
+                results.append((entry, RotationParams(entry.tables, entry.num_board_groups, boards_per_boardgroup, entry.rounds)))
+        return results
+
+    def get_ranked_rotations(self, num_pairs: int, min_boards_amount: int, max_boards_amount: int, min_boards_per_boardgroup: int) -> List[Tuple[Union[Type[AbstractRotation], LibraryEntry], RotationParams]]:
+        """`get_rotations` ordered by `rank_rotations`."""
+        return rank_rotations(
+            self.get_rotations(num_pairs, min_boards_amount, max_boards_amount, min_boards_per_boardgroup),
+            min_boards_amount, max_boards_amount,
+        )
+
+    def enumerate_rotations(self, queries: Iterable[RotationQuery], processes: Optional[int] = None) -> Dict[RotationQuery, List[Tuple[Union[Type[AbstractRotation], LibraryEntry], RotationParams]]]:
+        """
+        Ranked rotations for many (num_pairs, min_boards, max_boards, min_boards_per_boardgroup) queries,
+        e.g. a season's calendar. Distinct generator queries are spread over a process pool
+        (`processes` workers, default: CPU count; 1 runs them here). Library movements are
+        looked up in this process from the index.
+        """
+        unique = list(dict.fromkeys(tuple(q) for q in queries))
+        if processes == 1 or len(unique) < 2:
+            generated = [rank_rotations(self._generated_rotations(*q), q[1], q[2]) for q in unique]
+        else:
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                generated = list(pool.map(_enumerate_query, unique, chunksize=max(1, len(unique) // 32)))
+
+        results = {}
+        for query, rotations in zip(unique, generated):
+            if self.library is not None:
+                rotations = rank_rotations(rotations + self._library_rotations(*query), query[1], query[2])
+            results[query] = rotations
+        return results
+
+    def get_library_template(self, entry: LibraryEntry) -> MovementTemplate:
+        """Decodes (once) the template of a library movement returned by `get_rotations`."""
+        if self.library is None:
+            raise ValueError("RotationCalculator has no movement library")
+        return self.library.load(entry.name)
+
+    def get_template(self, source: Union[Type[AbstractRotation], LibraryEntry], params: RotationParams) -> MovementTemplate:
+        """The template a (source, params) candidate from `get_rotations` is played with."""
+        if isinstance(source, LibraryEntry):
+            return self.get_library_template(source)
+        family = getattr(source, 'family', None)
+        if family is None:
+            raise ValueError(f"{source.__name__} is not built from a movement template")
+        return get_template(family, params.num_tables, params.num_rounds)
+
+    def candidate_fingerprint(self, source: Union[Type[AbstractRotation], LibraryEntry], params: RotationParams, num_pairs: Optional[int] = None) -> str:
+        """Fingerprint of the movement a candidate plays; equal for candidates that only renumber tables, pairs or board groups."""
+        return fingerprint(self.get_template(source, params).round_data(params.boards_per_board_group, num_pairs))
+
+    def unique_rotations(self, rotations: Iterable[Tuple[Union[Type[AbstractRotation], LibraryEntry], RotationParams]], num_pairs: Optional[int] = None) -> List[Tuple[Union[Type[AbstractRotation], LibraryEntry], RotationParams]]:
+        """
+        `rotations` without candidates isomorphic to an earlier one (the first is kept).
+        Candidates that are not template based are all kept.
+        """
+        seen = set()
+        unique = []
+        for source, params in rotations:
+            try:
+                key = self.candidate_fingerprint(source, params, num_pairs)
+            except ValueError:
+                unique.append((source, params))
+                continue
+            if key not in seen:
+                seen.add(key)
+                unique.append((source, params))
+        return unique
+
+    def _played_candidates(self, rotations: Iterable[Tuple[Union[Type[AbstractRotation], LibraryEntry], RotationParams]], num_pairs: Optional[int]) -> Iterable[Tuple[Any, RotationParams, Dict[int, Any]]]:
+        """(source, params, round_data) of the template based candidates."""
+        for source, params in rotations:
+            try:
+                template = self.get_template(source, params)
+            except ValueError:
+                continue
+            yield source, params, template.round_data(params.boards_per_board_group, num_pairs)
+
+    def verify_rotations(self, rotations: Iterable[Tuple[Union[Type[AbstractRotation], LibraryEntry], RotationParams]], num_pairs: Optional[int] = None) -> List[Tuple[Union[Type[AbstractRotation], LibraryEntry], RotationParams, 'VerificationReport']]:
+        """
+        Candidates with the `VerificationReport` of the movement they play, in the given order.
+        Candidates that are not template based are skipped. Reports are kept in
+        `analysis_cache`, so an isomorphic candidate is verified once.
+        """
+        return [
+            (source, params, self.analysis_cache.verify(round_data))
+            for source, params, round_data in self._played_candidates(rotations, num_pairs)
+        ]
+
+    def rank_by_balance(self, rotations: Iterable[Tuple[Union[Type[AbstractRotation], LibraryEntry], RotationParams]], num_pairs: Optional[int] = None) -> List[Tuple[Union[Type[AbstractRotation], LibraryEntry], RotationParams, 'BalanceReport']]:
+        """
+        Candidates with their `BalanceReport`, fairest first (requires numpy).
+        `num_pairs` seats fewer pairs than the template holds (odd fields); candidates that
+        are not template based are skipped. Reports are kept in `analysis_cache`, so an
+        isomorphic candidate is analyzed once.
+        """
+        ranked = [
+            (source, params, self.analysis_cache.balance(round_data))
+            for source, params, round_data in self._played_candidates(rotations, num_pairs)
+        ]
+        ranked.sort(key=lambda item: -item[2].fairness)
+        return ranked
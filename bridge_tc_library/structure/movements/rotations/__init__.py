@@ -1,23 +1,23 @@
 from .analyzer import RotationAnalyzer
+from .registry import get_registry
 
-# Dynamically load all rotation classes from available modules
-_rotation_classes = RotationAnalyzer.get_rotation_classes()
+# Rotation classes are resolved lazily: the names come from the cached manifest and a
+# rotation module is imported the first time one of its classes is accessed.
 
-# Make rotation classes available at package level
-for _class_name, _class_obj in _rotation_classes.items():
-    if _class_obj is not None:
-        globals()[_class_name] = _class_obj
 
-"""# Maintain backward compatibility with explicit imports
-try:
-    from .howell import HowellMovement  # type: ignore
-except Exception:
-    HowellMovement = _rotation_classes.get('HowellMovement')  # type: ignore
+def __getattr__(name):
+    if name.startswith('_'):
+        raise AttributeError(name)
+    cls = get_registry().get(name)
+    if cls is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = cls
+    return cls
+
+
+def __dir__():
+    return sorted(set(globals()) | set(get_registry().class_names()))
+
 
-try:
-    from .mitchell import MitchellMovement  # type: ignore
-except Exception:
-    MitchellMovement = _rotation_classes.get('MitchellMovement')  # type: ignore
-"""
 # Export available rotation classes
-__all__ = [name for name in _rotation_classes.keys() if _rotation_classes[name] is not None]
+__all__ = list(get_registry().class_names())
@@ -1,13 +1,13 @@
 """
 Analyzer for dynamically discovering and loading rotation classes from the rotations folder.
+Discovery goes through the lazy `RotationRegistry`; modules are imported only when asked for.
 """
 
-import importlib
-import inspect
-import os
 from typing import Dict, Type, Optional, List
 from pathlib import Path
 
+from .registry import get_registry
+
 
 class RotationAnalyzer:
     """Analyzes rotation modules and discovers available rotation classes."""
@@ -15,7 +15,7 @@ class RotationAnalyzer:
     @staticmethod
     def get_rotations_dir() -> Path:
         """Get the path to the rotation directory."""
-        return Path(__file__).parent
+        return get_registry().rotations_dir
     
     @staticmethod
     def get_rotation_modules() -> List[str]:
@@ -25,16 +25,7 @@ class RotationAnalyzer:
         Returns:
             List of module names (without .py extension)
         """
-        rotations_dir = RotationAnalyzer.get_rotations_dir()
-        modules = []
-        
-        for file in rotations_dir.glob('*.py'):
-            if file.name.startswith('_'):
-                continue
-            if file.is_file():
-                modules.append(file.stem)
-        
-        return sorted(modules)
+        return get_registry().module_names()
     
     @staticmethod
     def load_rotation_module(module_name: str):
@@ -47,12 +38,20 @@ class RotationAnalyzer:
         Returns:
             The imported module or None if import fails
         """
-        try:
-            return importlib.import_module(f'.{module_name}', package='bridge_tc_library.structure.movements.rotations')
-        except Exception as e:
-            print(f"Failed to load rotation module '{module_name}': {e}")
-            return None
+        registry = get_registry()
+        module = registry.load_module(module_name)
+        if module is None:
+            print(f"Failed to load rotation module '{module_name}': {registry.failed_imports()[module_name]}")
+        return module
     
+    @staticmethod
+    def get_rotation_names() -> Dict[str, str]:
+        """
+        Rotation class names mapped to their module names, read from the cached manifest
+        without importing any rotation module.
+        """
+        return get_registry().class_names()
+
     @staticmethod
     def get_rotation_classes() -> Dict[str, Optional[Type]]:
         """
@@ -61,34 +60,18 @@ class RotationAnalyzer:
         Returns:
             Dictionary mapping class names to classes (or None if import failed)
         """
-        rotations = {}
-        
-        for module_name in RotationAnalyzer.get_rotation_modules():
-            module = RotationAnalyzer.load_rotation_module(module_name)
-            if module is None:
-                continue
-            
-            # Look for classes that end with 'Movement'
-            for name, obj in inspect.getmembers(module, inspect.isclass):
-                if name.endswith('Movement') and obj.__module__ == module.__name__:
-                    rotations[name] = obj
-        
-        return rotations
+        return get_registry().load_all()
     
     @staticmethod
     def get_failed_imports() -> Dict[str, str]:
         """
         Get modules that failed to import.
+        Every module is attempted at most once per process; earlier failures are reported as recorded.
         
         Returns:
             Dictionary mapping module names to error messages
         """
-        failed = {}
-        
-        for module_name in RotationAnalyzer.get_rotation_modules():
-            try:
-                importlib.import_module(f'.{module_name}', package='bridge_tc_library.structure.movements.rotations')
-            except Exception as e:
-                failed[module_name] = str(e)
-        
-        return failed
+        registry = get_registry()
+        for module_name in registry.module_names():
+            registry.load_module(module_name)
+        return registry.failed_imports()
@@ -1,11 +1,92 @@
-from collections import deque
-from typing import List, Dict, Tuple, Any, TYPE_CHECKING
+from math import ceil
+from typing import List, Dict, Tuple, Optional, TYPE_CHECKING
 
 from bridge_tc_library.structure import MovementStrategy
+from bridge_tc_library.structure.core import Position, Pair, BoardGroup
 from bridge_tc_library.structure.movements.abstract_rotation import AbstractRotation, RotationParams
+from bridge_tc_library.structure.movements.template import MovementTemplate, template_builder
+from bridge_tc_library.structure.tournament import Table
 
 if TYPE_CHECKING:
-	from bridge_tc_library.structure.tournament import Table
+	from bridge_tc_library.structure.tournament import Sector
+
+
+# Adders a_k of the patterned starter {k, -k} for m = 2 * tables - 1, k = 1..(m - 1) / 2
+PATTERNED_ADDERS: Dict[int, Tuple[int, ...]] = {
+	7: (2, 4, 1),
+	11: (6, 10, 7, 2, 8),
+	13: (3, 5, 9, 1, 6, 2),
+	15: (6, 10, 1, 7, 11, 8, 2),
+	17: (8, 14, 7, 9, 3, 12, 4, 11),
+	19: (7, 18, 8, 11, 9, 4, 6, 1, 12),
+	21: (16, 1, 13, 2, 9, 7, 4, 20, 14, 19),
+	23: (18, 4, 19, 1, 9, 7, 14, 3, 17, 2, 21),
+	25: (20, 9, 21, 8, 3, 11, 13, 18, 6, 24, 2, 15),
+	27: (9, 17, 8, 26, 18, 12, 5, 1, 25, 14, 10, 2, 15),
+	29: (12, 18, 9, 5, 19, 27, 15, 23, 8, 17, 14, 22, 10, 4),
+	31: (24, 10, 6, 20, 27, 8, 14, 21, 26, 5, 17, 30, 23, 13, 4),
+	33: (5, 11, 28, 6, 13, 20, 10, 24, 31, 1, 8, 17, 14, 9, 30, 4),
+	35: (12, 22, 13, 23, 2, 27, 10, 26, 32, 18, 25, 17, 9, 16, 24, 31, 8),
+	37: (28, 13, 27, 32, 30, 11, 9, 14, 4, 24, 7, 19, 34, 26, 23, 25, 6, 1),
+	39: (24, 36, 33, 18, 32, 11, 8, 37, 2, 6, 35, 16, 5, 27, 34, 10, 25, 30, 1),
+}
+
+# (x, y, adder) per table: circle positions seated NS / EW and the board station played
+STARTERS: Dict[int, Tuple[Tuple[int, int, int], ...]] = {
+	m: tuple((k, m - k, a) for k, a in enumerate(adders, start=1)) for m, adders in PATTERNED_ADDERS.items()
+}
+# no patterned starter exists for m = 9
+STARTERS[9] = ((1, 2, 5), (3, 7, 4), (4, 6, 2), (5, 8, 7))
+
+
+def howell_round_range(num_pairs: int) -> Tuple[int, int]:
+	"""(min, max) number of rounds of a Howell for `num_pairs` pairs (a bye counts as a pair)."""
+	num_pairs += num_pairs % 2
+	return ceil(num_pairs * 3 / 4 - 1), num_pairs - 1
+
+
+@template_builder("howell")
+def howell_template(num_tables: int, rounds: Optional[int] = None, switch_round_num: Optional[int] = None) -> MovementTemplate:
+	"""
+	Howell over `num_tables` playing tables (indices 0..num_tables-1) followed by num_tables - 1
+	relay tables. With m = 2 * num_tables - 1, circle position c moves to c - 1 and board station
+	d to d - 1 every round; the last playing table holds station 0 and seats position 0 EW and the
+	stationary pair NS. Howells have no switch round; `switch_round_num` is ignored.
+	"""
+	m = 2 * num_tables - 1
+	if m not in STARTERS:
+		raise ValueError(f"No Howell movement for {num_tables} tables")
+	min_rounds, max_rounds = howell_round_range(2 * num_tables)
+	if rounds is None:
+		rounds = max_rounds
+	if not min_rounds <= rounds <= max_rounds:
+		raise ValueError(f"Howell for {2 * num_tables} pairs needs between {min_rounds} and {max_rounds} rounds")
+	starter = STARTERS[m]
+	last = num_tables - 1
+
+	seats: List[Optional[Tuple[int, Position]]] = [None] * m
+	stations: List[Optional[int]] = [None] * m
+	for table, (x, y, adder) in enumerate(starter):
+		seats[x] = (table, Position.NS)
+		seats[y] = (table, Position.EW)
+		stations[adder] = table
+	seats[0] = (last, Position.EW)
+	stations[0] = last
+	relay = num_tables
+	for station in range(m):
+		if stations[station] is None:
+			stations[station] = relay
+			relay += 1
+
+	pair_moves = tuple((seats[c], seats[c - 1]) for c in range(m))
+	board_moves = tuple((stations[d], stations[d - 1]) for d in range(m))
+	return MovementTemplate(
+		"howell",
+		((pair_moves, board_moves, tuple(range(1, rounds + 1))),),
+		(True,) * num_tables + (False,) * (num_tables - 1),
+		initial_seats=tuple(seats) + ((last, Position.NS),),
+		initial_groups=tuple(stations),
+	)
 
 
 class HowellMovement(AbstractRotation):
@@ -14,16 +95,79 @@ class HowellMovement(AbstractRotation):
 	How does howell work:
 	basic: all vs all, num_round = num_pairs - 1
 	reduced: for bigger, (num_pairs*3/4 -1) <= num_rounds <= (num_pairs - 1)
+
+	Built with the circle method (see `howell_template`): pairs 0..m-1 (m = 2 * tables - 1) move
+	one circle position back every round and pair m, the bye for an odd field, stays at the last
+	table. Table i seats positions STARTERS[m][i][:2] and plays the board group at station a_i;
+	board groups move one station back every round. The starter-adder (a Room square
+	construction) makes every pair meet every other pair once and play every board group once.
+	Stations no table plays are relay tables holding the idle board groups.
 	"""
-	def __init__(self, tables: List['Table']):
-		super().__init__(tables)
-		self.num_pairs = len(tables) * 2
+	family = "howell"
+
+	def __init__(self, tables: List['Table'], num_pairs: Optional[int] = None):
+		super().__init__([t for t in tables if t.isplayable])
+		self.relay_tables: List['Table'] = [t for t in tables if not t.isplayable]
+		self.num_pairs = len(self.tables) * 2 if num_pairs is None else num_pairs
+		if self.num_pairs not in (len(self.tables) * 2, len(self.tables) * 2 - 1):
+			raise ValueError(f"{self.num_pairs} pairs do not fit {len(self.tables)} tables")
 		self.bye = self.check_if_bye_needed(self.num_pairs)
+		self.m = self.num_pairs - 1
+		if self.m not in STARTERS:
+			raise ValueError(f"No Howell movement for {len(self.tables)} tables")
+
+	round_range = staticmethod(howell_round_range)
 
 	@classmethod
 	def generate_possible_rotations(cls, num_pairs: int, min_boards_amount: int, max_boards_amount: int, min_boards_per_boardgroup: int) -> List[RotationParams]:
-		return []
+		"""
+		Board amounts are boards played by each pair (num_rounds * boards_per_board_group).
+		Every rotation uses 2 * num_tables - 1 board groups, idle ones resting on relay tables.
+		"""
+		list_of_rotations: List[RotationParams] = []
+		num_tables = (num_pairs + 1) // 2
+		m = 2 * num_tables - 1
+		if m not in STARTERS:
+			return list_of_rotations
+		min_rounds, max_rounds = howell_round_range(num_pairs)
+		for rounds in range(min_rounds, max_rounds + 1):
+			for boards_per_boardgroup in cls.boards_per_boardgroup_range(rounds, min_boards_amount, max_boards_amount, min_boards_per_boardgroup):
+				list_of_rotations.append(RotationParams(num_tables, m, boards_per_boardgroup, rounds))
+		return list_of_rotations
+
+	def template(self, rounds: Optional[int] = None) -> MovementTemplate:
+		return howell_template(len(self.tables), rounds, None)
+
+	@property
+	def all_tables(self) -> List['Table']:
+		"""
+		Playing tables followed by the len(tables) - 1 relay tables the movement needs,
+		taken from the given non-playable tables and created if missing. Created relay
+		tables join the sector of the first playing table.
+		"""
+		needed = len(self.tables) - 1
+		if len(self.relay_tables) < needed:
+			next_id = max(t.table_id for t in self.tables + self.relay_tables) + 1
+			sector: Optional['Sector'] = self.tables[0].sector
+			while len(self.relay_tables) < needed:
+				relay = Table(next_id, isplayable=False)
+				relay.change_sector(sector)
+				self.relay_tables.append(relay)
+				next_id += 1
+		return self.tables + self.relay_tables[:needed]
+
+	def generate_strategy_for_rotation(self, rounds: Optional[int] = None, optionalint: Optional[int] = None) -> MovementStrategy:
+		"""
+		One strategy entry for rounds 1..`rounds` (default: all vs all) over `all_tables`.
+		"""
+		return self.template(rounds).bind(self.all_tables)
 
-	def generate_strategy_for_rotation(self, rounds: int) -> MovementStrategy:
-		pass
+	def generate_initial_sitting(self, pairs: List[Pair]) -> Dict['Table', Dict[Position, Pair]]:
+		"""Pair k starts on circle position k; the last pair (if any) stays at the last table NS."""
+		if len(pairs) != self.num_pairs - self.bye:
+			raise ValueError(f"Expected {self.num_pairs - self.bye} pairs, got {len(pairs)}")
+		return self.template().initial_sitting(self.all_tables, pairs)
 
+	def generate_initial_boardgroup_placement(self, board_groups: List[BoardGroup]) -> Dict['Table', List[BoardGroup]]:
+		"""Board group k starts on station k."""
+		return self.template().initial_placement(self.all_tables, board_groups)
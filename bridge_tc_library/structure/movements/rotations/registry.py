@@ -0,0 +1,120 @@
+"""
+Lazy registry of rotation classes.
+
+Rotation modules are scanned with `ast` instead of being imported: the class
+names found in each module are kept in a manifest under `__pycache__`, reused
+as long as the module's mtime is unchanged. A module is imported only when
+one of its classes is first requested, and an import failure is recorded
+from that single attempt.
+"""
+
+import ast
+import importlib
+import json
+import os
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, List, Optional, Type
+
+PACKAGE = 'bridge_tc_library.structure.movements.rotations'
+MANIFEST_NAME = 'rotation_manifest.json'
+MANIFEST_VERSION = 1
+
+
+def scan_module(path: Path) -> List[str]:
+    """Names of the top-level classes ending with 'Movement' defined in `path`."""
+    tree = ast.parse(path.read_text(encoding='utf-8'), filename=str(path))
+    return [node.name for node in tree.body if isinstance(node, ast.ClassDef) and node.name.endswith('Movement')]
+
+
+class RotationRegistry:
+    """Maps rotation class names to their modules and imports them on demand."""
+
+    def __init__(self, rotations_dir: Optional[Path] = None, package: str = PACKAGE) -> None:
+        self.rotations_dir = Path(rotations_dir) if rotations_dir is not None else Path(__file__).parent
+        self.package = package
+        self.manifest_path = self.rotations_dir / '__pycache__' / MANIFEST_NAME
+        self._manifest: Optional[Dict[str, Dict]] = None
+        self._modules: Dict[str, Optional[ModuleType]] = {}
+        self._failed: Dict[str, str] = {}
+
+    def module_names(self) -> List[str]:
+        return sorted(self.manifest())
+
+    def manifest(self) -> Dict[str, Dict]:
+        """{module_name: {"mtime": ..., "classes": [...]}}, rescanning only modules that changed."""
+        if self._manifest is not None:
+            return self._manifest
+        cached: Dict[str, Dict] = {}
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as fh:
+                data = json.load(fh)
+            if data.get('version') == MANIFEST_VERSION:
+                cached = data['modules']
+        except (OSError, ValueError, KeyError):
+            pass
+
+        manifest: Dict[str, Dict] = {}
+        for file in sorted(self.rotations_dir.glob('*.py')):
+            if file.name.startswith('_') or not file.is_file() or file.stem == 'registry':
+                continue
+            mtime = file.stat().st_mtime_ns
+            entry = cached.get(file.stem)
+            if entry is None or entry.get('mtime') != mtime:
+                try:
+                    classes = scan_module(file)
+                except SyntaxError as e:
+                    self._failed[file.stem] = str(e)
+                    classes = []
+                entry = {'mtime': mtime, 'classes': classes}
+            manifest[file.stem] = entry
+
+        if manifest != cached:
+            try:
+                os.makedirs(self.manifest_path.parent, exist_ok=True)
+                with open(self.manifest_path, 'w', encoding='utf-8') as fh:
+                    json.dump({'version': MANIFEST_VERSION, 'modules': manifest}, fh)
+            except OSError:
+                pass
+        self._manifest = manifest
+        return manifest
+
+    def class_names(self) -> Dict[str, str]:
+        """{class_name: module_name} from the manifest, without importing anything."""
+        return {name: module for module, entry in self.manifest().items() for name in entry['classes']}
+
+    def load_module(self, module_name: str) -> Optional[ModuleType]:
+        """Imports a rotation module once; returns None (and records why) if that fails."""
+        if module_name not in self._modules:
+            try:
+                self._modules[module_name] = importlib.import_module(f'.{module_name}', package=self.package)
+            except Exception as e:
+                self._modules[module_name] = None
+                self._failed[module_name] = str(e)
+        return self._modules[module_name]
+
+    def get(self, class_name: str) -> Optional[Type]:
+        """The rotation class `class_name`, importing its module on first use."""
+        module_name = self.class_names().get(class_name)
+        if module_name is None:
+            return None
+        module = self.load_module(module_name)
+        return getattr(module, class_name, None) if module is not None else None
+
+    def load_all(self) -> Dict[str, Optional[Type]]:
+        """All rotation classes (None for those whose module failed to import)."""
+        return {name: self.get(name) for name in self.class_names()}
+
+    def failed_imports(self) -> Dict[str, str]:
+        """Modules that failed to scan or import, with the error of the single attempt made."""
+        return dict(self._failed)
+
+
+_registry: Optional[RotationRegistry] = None
+
+
+def get_registry() -> RotationRegistry:
+    global _registry
+    if _registry is None:
+        _registry = RotationRegistry()
+    return _registry
@@ -1,8 +1,9 @@
-from typing import List, Tuple, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 from bridge_tc_library.structure.core import Position
 
 if TYPE_CHECKING:
     from bridge_tc_library.structure.tournament.table import Table
+    from .compiled import CompiledMovementPlan
 
 class MovementStrategy:
     """
@@ -12,38 +13,119 @@ class MovementStrategy:
     - player_change_list: list of tuples ((Table, Position), (Table, Position)) indicating pair moves (from, to)
     - board_change_list: list of tuples (Table, Table) indicating board moves (from, to)
     - rounds_list: list[int] specifying rounds when this change_list applies
+
+    Entries are frozen into tuples on the way in, so the per-round index never
+    goes stale: `as_list()` hands them out as tuples, and entries are changed
+    through `replace()` and `append()`.
     """
-    strategies: List[Tuple[List[Tuple[Tuple['Table', Position], Tuple['Table', Position]]], List[Tuple['Table', 'Table']], List[int]]]
 
     def __init__(self, strategies: List[Tuple[List[Tuple[Tuple['Table', Position], Tuple['Table', Position]]], List[Tuple['Table', 'Table']], List[int]]]):
         # minimal structural validation
         if not isinstance(strategies, list):
             raise TypeError("MovStrat expects a list of (change_list, rounds_list) tuples")
-        self.strategies = []
+        self._strategies = []
         for item in strategies:
-            if not (isinstance(item, tuple) or isinstance(item, list)) or len(item) != 3:
-                raise TypeError("each strategy must be a 3-tuple: (player_change_list, board_change_list, rounds_list)")
-            player_change_list, board_change_list, rounds = item
-            if not isinstance(player_change_list, list):
-                raise TypeError("player_change_list must be a list")
-            if not isinstance(board_change_list, list):
-                raise TypeError("board_change_list must be a list")
-            if not isinstance(rounds, list):
-                raise TypeError("rounds must be a list of ints")
-            self.strategies.append((player_change_list, board_change_list, rounds))
-
-    def as_list(self) -> List[Tuple[List[Tuple[Tuple['Table', Position], Tuple['Table', Position]]], List[Tuple['Table', 'Table']], List[int]]]:
-        return self.strategies
+            self._strategies.append(self._validate_item(item))
+        self.version = 0
+        self._round_index: Dict[int, int] = self._build_round_index()
+
+    @staticmethod
+    def _validate_item(item) -> Tuple[List[Tuple[Tuple['Table', Position], Tuple['Table', Position]]], List[Tuple['Table', 'Table']], List[int]]:
+        if not (isinstance(item, tuple) or isinstance(item, list)) or len(item) != 3:
+            raise TypeError("each strategy must be a 3-tuple: (player_change_list, board_change_list, rounds_list)")
+        player_change_list, board_change_list, rounds = item
+        if not isinstance(player_change_list, (list, tuple)):
+            raise TypeError("player_change_list must be a list")
+        if not isinstance(board_change_list, (list, tuple)):
+            raise TypeError("board_change_list must be a list")
+        if not isinstance(rounds, (list, tuple)):
+            raise TypeError("rounds must be a list of ints")
+        return tuple(player_change_list), tuple(board_change_list), tuple(rounds)
+
+    def _build_round_index(self) -> Dict[int, int]:
+        # round -> strategy index; the first strategy listing a round wins, as in a linear scan
+        index: Dict[int, int] = {}
+        for idx, (_, _, rounds) in enumerate(self._strategies):
+            for round_number in rounds:
+                index.setdefault(round_number, idx)
+        return index
+
+    def replace(self, index: int, item: Tuple[List[Tuple[Tuple['Table', Position], Tuple['Table', Position]]], List[Tuple['Table', 'Table']], List[int]]) -> Optional[int]:
+        """
+        Replaces the strategy at `index` and returns the earliest round whose
+        change lists differ afterwards (None if no round is affected).
+        """
+        item = self._validate_item(item)
+        old_index = self._round_index
+        old_rounds = self._strategies[index][2]
+        self._strategies[index] = item
+        self._round_index = self._build_round_index()
+        self.version += 1
+
+        affected = [
+            r for r in set(old_rounds) | set(item[2])
+            if old_index.get(r) != self._round_index.get(r) or self._round_index.get(r) == index
+        ]
+        return min(affected) if affected else None
+
+    def append(self, item: Tuple[List[Tuple[Tuple['Table', Position], Tuple['Table', Position]]], List[Tuple['Table', 'Table']], List[int]]) -> Optional[int]:
+        """
+        Adds a strategy entry after the existing ones and returns the earliest round
+        it newly defines (None if earlier entries already cover all its rounds).
+        """
+        item = self._validate_item(item)
+        self._strategies.append(item)
+        added = [r for r in item[2] if r not in self._round_index]
+        self._round_index = self._build_round_index()
+        self.version += 1
+        return min(added) if added else None
+
+    def first_difference(self, other: 'MovementStrategy') -> Optional[int]:
+        """
+        Returns the earliest round for which `other` defines different change
+        lists than this strategy (None if they agree on every round).
+        """
+        same: Dict[Tuple[int, int], bool] = {}
+        for round_number in sorted(set(self._round_index) | set(other._round_index)):
+            mine = self._round_index.get(round_number)
+            theirs = other._round_index.get(round_number)
+            if mine is None or theirs is None:
+                return round_number
+            key = (mine, theirs)
+            if key not in same:
+                same[key] = self._strategies[mine][:2] == other._strategies[theirs][:2]
+            if not same[key]:
+                return round_number
+        return None
+
+    def as_list(self) -> Tuple[Tuple[Tuple[Tuple[Tuple['Table', Position], Tuple['Table', Position]], ...], Tuple[Tuple['Table', 'Table'], ...], Tuple[int, ...]], ...]:
+        """
+        The strategy entries as read-only tuples; use `replace()` or `append()` to change them.
+        """
+        return tuple(self._strategies)
+
+    @property
+    def strategies(self) -> Tuple[Tuple[Tuple[Tuple[Tuple['Table', Position], Tuple['Table', Position]], ...], Tuple[Tuple['Table', 'Table'], ...], Tuple[int, ...]], ...]:
+        return self.as_list()
     
-    def get_strategy_for_round(self, round_number: int) -> Tuple[List[Tuple[Tuple['Table', Position], Tuple['Table', Position]]], List[Tuple['Table', 'Table']]]:
+    def get_strategy_for_round(self, round_number: int) -> Tuple[Tuple[Tuple[Tuple['Table', Position], Tuple['Table', Position]], ...], Tuple[Tuple['Table', 'Table'], ...]]:
         """
         Returns the player and board change lists for a specific round. Round numbers start at 1.
         Raises ValueError if no strategy is defined for the given round.
         """
-        for player_change_list, board_change_list, rounds in self.strategies:
-            if round_number in rounds:
-                return player_change_list, board_change_list
-        raise ValueError(f"No strategy defined for round {round_number}")
+        idx = self._round_index.get(round_number)
+        if idx is None:
+            raise ValueError(f"No strategy defined for round {round_number}")
+        player_change_list, board_change_list, _ = self._strategies[idx]
+        return player_change_list, board_change_list
+
+    def compile(self, tables: List['Table']) -> 'CompiledMovementPlan':
+        """
+        Compiles the strategy against an ordered table list into integer-indexed
+        permutation arrays (see `CompiledMovementPlan`).
+        """
+        from .compiled import CompiledMovementPlan
+        return CompiledMovementPlan(self, tables)
 
     def __repr__(self) -> str:
-        return f"MovStrat({len(self.strategies)} strategies)"
\ No newline at end of file
+        return f"MovStrat({len(self._strategies)} strategies)"
\ No newline at end of file
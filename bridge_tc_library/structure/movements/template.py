@@ -0,0 +1,131 @@
+"""
+Table-independent movement templates.
+
+A `MovementTemplate` is a movement strategy written over table indices
+instead of `Table` objects. Templates are generated once per
+(family, num_tables, rounds, switch round) and cached; `bind` maps one onto a
+concrete table list in O(moves), so identical sectors share one generation.
+"""
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from bridge_tc_library.structure.core import Position, Pair, BoardGroup
+from .strategy import MovementStrategy
+
+if TYPE_CHECKING:
+	from bridge_tc_library.structure.tournament import Table
+
+
+Seat = Tuple[int, Position]
+TemplateEntry = Tuple[Tuple[Tuple[Seat, Seat], ...], Tuple[Tuple[int, int], ...], Tuple[int, ...]]
+
+
+class MovementTemplate:
+	"""
+	Strategy entries over table indices 0..size-1.
+	- entries: (pair_moves, board_moves, rounds) like `MovementStrategy`, with (table_index, Position)
+	  seats and table indices in place of tables
+	- playable: per index, whether the table is played at (False for relay tables)
+	- initial_seats: optional seat of the k-th pair in round 1
+	- initial_groups: optional table index of the k-th board group in round 1
+	"""
+	__slots__ = ('family', 'entries', 'playable', 'initial_seats', 'initial_groups')
+
+	def __init__(self, family: str, entries: Tuple[TemplateEntry, ...], playable: Tuple[bool, ...], initial_seats: Optional[Tuple[Seat, ...]] = None, initial_groups: Optional[Tuple[int, ...]] = None):
+		self.family = family
+		self.entries = entries
+		self.playable = playable
+		self.initial_seats = initial_seats
+		self.initial_groups = initial_groups
+
+	@property
+	def size(self) -> int:
+		return len(self.playable)
+
+	@property
+	def rounds(self) -> int:
+		return max((r for _, _, rounds in self.entries for r in rounds), default=1)
+
+	def _check(self, tables: List['Table']):
+		if len(tables) != self.size:
+			raise ValueError(f"{self.family} template needs {self.size} tables, got {len(tables)}")
+
+	def bind(self, tables: List['Table']) -> MovementStrategy:
+		"""The strategy of this template on `tables` (table i taking index i)."""
+		self._check(tables)
+		return MovementStrategy([
+			(
+				[((tables[s], sp), (tables[d], dp)) for (s, sp), (d, dp) in pair_moves],
+				[(tables[s], tables[d]) for s, d in board_moves],
+				list(rounds),
+			)
+			for pair_moves, board_moves, rounds in self.entries
+		])
+
+	def initial_sitting(self, tables: List['Table'], pairs: List[Pair]) -> Dict['Table', Dict[Position, Pair]]:
+		self._check(tables)
+		if self.initial_seats is None:
+			raise ValueError(f"{self.family} template has no initial seating")
+		if len(pairs) > len(self.initial_seats):
+			raise ValueError(f"{self.family} template seats {len(self.initial_seats)} pairs, got {len(pairs)}")
+		sitting: Dict['Table', Dict[Position, Pair]] = {table: {} for table, playable in zip(tables, self.playable) if playable}
+		for (idx, position), pair in zip(self.initial_seats, pairs):
+			sitting[tables[idx]][position] = pair
+		return sitting
+
+	def initial_placement(self, tables: List['Table'], board_groups: List[BoardGroup]) -> Dict['Table', List[BoardGroup]]:
+		self._check(tables)
+		if self.initial_groups is None:
+			raise ValueError(f"{self.family} template has no initial board placement")
+		if len(board_groups) != len(self.initial_groups):
+			raise ValueError(f"{self.family} template places {len(self.initial_groups)} board groups, got {len(board_groups)}")
+		placement: Dict['Table', List[BoardGroup]] = {table: [] for table in tables}
+		for idx, group in zip(self.initial_groups, board_groups):
+			placement[tables[idx]].append(group)
+		return placement
+
+	def round_data(self, boards_per_board_group: int = 1, num_pairs: Optional[int] = None) -> Dict[int, Dict['Table', Tuple[Dict[Position, Pair], List[BoardGroup]]]]:
+		"""
+		`round_data` of this template played with placeholder tables, pairs and board groups
+		(pair k has id k + 1, board group k holds boards k * boards_per_board_group + 1, ...).
+		`num_pairs` seats fewer pairs than the template holds.
+		"""
+		from bridge_tc_library.structure.core import Player
+		from bridge_tc_library.structure.tournament import Table
+		from .compiled import CompiledMovementPlan
+
+		tables = [Table(idx + 1, isplayable=playable) for idx, playable in enumerate(self.playable)]
+		num_pairs = len(self.initial_seats) if num_pairs is None else num_pairs
+		pairs = [Pair(idx + 1, (Player(), Player())) for idx in range(num_pairs)]
+		groups = [
+			BoardGroup(idx + 1, tuple(range(idx * boards_per_board_group + 1, (idx + 1) * boards_per_board_group + 1)))
+			for idx in range(len(self.initial_groups))
+		]
+		plan = CompiledMovementPlan(self.bind(tables), tables)
+		return plan.play(self.initial_sitting(tables, pairs), self.initial_placement(tables, groups), self.rounds)
+
+	def __repr__(self) -> str:
+		return f"<MovementTemplate {self.family} tables={self.size} rounds={self.rounds} entries={len(self.entries)}>"
+
+
+_BUILDERS: Dict[str, Callable[..., MovementTemplate]] = {}
+
+
+def template_builder(family: str):
+	"""Registers a memoized template builder `fn(num_tables, rounds, switch_round)` for `family`."""
+	def register(fn: Callable[..., MovementTemplate]) -> Callable[..., MovementTemplate]:
+		cached = lru_cache(maxsize=None)(fn)
+		_BUILDERS[family] = cached
+		return cached
+	return register
+
+
+def get_template(family: str, num_tables: int, rounds: Optional[int] = None, switch_round: Optional[int] = None) -> MovementTemplate:
+	"""The cached template of `family` ("mitchell", "howell", ...)."""
+	if family not in _BUILDERS:
+		# builders live in the rotation modules
+		from .rotations.registry import get_registry
+		get_registry().load_all()
+	if family not in _BUILDERS:
+		raise ValueError(f"Unknown movement family {family!r}")
+	return _BUILDERS[family](num_tables, rounds, switch_round)
@@ -0,0 +1,47 @@
+"""Movements shared by the movement tests (and the BWS store tests)."""
+from bridge_tc_library.structure.core import BoardGroup, Pair, Player, Position
+from bridge_tc_library.structure.movements.movement import BaseMovement
+from bridge_tc_library.structure.movements.strategy import MovementStrategy
+from bridge_tc_library.structure.tournament import Sector, Table
+
+
+def make_howell_movement(split_round=None):
+    """4-table Howell with two storage tables, as in examples/example_strategy.py.
+
+    With `split_round` the same moves are stored as two strategy entries,
+    rounds before and from `split_round`.
+    """
+    sector = Sector("A")
+    tables = [Table(i + 1, sector) for i in range(6)]
+    tables[3].isplayable = False
+    tables[5].isplayable = False
+    pairs = [Pair(i + 1, (Player(f"P{2 * i + 1}"), Player(f"P{2 * i + 2}"))) for i in range(8)]
+    board_groups = [BoardGroup(i + 1, tuple(range(i * 3 + 1, i * 3 + 4))) for i in range(7)]
+    ft = [t for t in tables if t.isplayable]
+
+    pair_moves = [((ft[0], Position.EW), (ft[3], Position.NS)),
+         ((ft[3], Position.NS), (ft[1], Position.NS)),
+         ((ft[1], Position.NS), (ft[1], Position.EW)),
+         ((ft[1], Position.EW), (ft[2], Position.NS)),
+         ((ft[2], Position.NS), (ft[3], Position.EW)),
+         ((ft[2], Position.EW), (ft[0], Position.EW)),
+         ((ft[3], Position.EW), (ft[2], Position.EW))]
+    board_moves = [(tables[0], tables[5]),
+         (tables[5], tables[4]),
+         (tables[4], tables[3]),
+         (tables[3], tables[2]),
+         (tables[2], tables[1]),
+         (tables[1], tables[0])]
+    if split_round is None:
+        strategy = MovementStrategy([(pair_moves, board_moves, [1, 2, 3, 4, 5, 6, 7])])
+    else:
+        strategy = MovementStrategy([
+            (pair_moves, board_moves, list(range(1, split_round))),
+            (list(pair_moves), list(board_moves), list(range(split_round, 8))),
+        ])
+
+    movement = BaseMovement(tables=tables, board_groups=board_groups, pairs=pairs, movement_strategies=strategy)
+    sector.set_movement(movement)
+    movement.autogenerate_initial_sitting()
+    movement.autogenerate_initial_boardgroup_placement()
+    return movement
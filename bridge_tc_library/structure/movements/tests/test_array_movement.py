@@ -0,0 +1,29 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from bridge_tc_library.structure.movements.array_movement import ArrayMovement
+from bridge_tc_library.structure.movements.tests.helpers import make_howell_movement
+
+
+def test_array_engine_matches_object_engine():
+    movement = make_howell_movement(split_round=4)
+    expected = movement.construct_movement(7, compiled=False)
+
+    arrays = ArrayMovement.from_movement(movement).construct_movement(7)
+    assert arrays.sitting.shape == (7, 6, 2)
+    assert arrays.sitting.dtype == np.int32
+    assert arrays.to_round_data() == expected
+
+
+def test_round_views():
+    movement = make_howell_movement()
+    movement.construct_movement(7)
+    arrays = ArrayMovement.from_movement(movement).construct_movement(7)
+
+    for rnd in range(2, 8):
+        assert dict(arrays.get_sitting_for_round(rnd)) == movement.get_sitting_for_round(rnd)
+        assert dict(arrays.get_boards_for_round(rnd)) == movement.get_boards_for_round(rnd)
+
+    with pytest.raises(ValueError):
+        arrays.get_sitting_for_round(8)
@@ -0,0 +1,97 @@
+from itertools import combinations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from bridge_tc_library.structure.core import BoardGroup, Pair, Player, Position
+from bridge_tc_library.structure.movements.balance import analyze_balance, template_round_data
+from bridge_tc_library.structure.movements.rotation_calculator import RotationCalculator
+from bridge_tc_library.structure.movements.rotations.howell import HowellMovement, howell_template
+from bridge_tc_library.structure.movements.rotations.mitchell import MitchellMovement, mitchell_template
+from bridge_tc_library.structure.tournament import Table
+
+
+def naive_counts(round_data):
+    played = {}
+    meetings = {}
+    for tables in round_data.values():
+        for sitting, groups in tables.values():
+            if len(sitting) < 2:
+                continue
+            ns, ew = sitting[Position.NS], sitting[Position.EW]
+            meetings[(ns.id, ew.id)] = meetings.get((ns.id, ew.id), 0) + 1
+            meetings[(ew.id, ns.id)] = meetings.get((ew.id, ns.id), 0) + 1
+            for group in groups:
+                for board in group.boards:
+                    played[(ns.id, board)] = Position.NS
+                    played[(ew.id, board)] = Position.EW
+    return played, meetings
+
+
+def test_matrices_match_naive_counts():
+    round_data = template_round_data(howell_template(7, 10), boards_per_board_group=2)
+    report = analyze_balance(round_data)
+    played, meetings = naive_counts(round_data)
+
+    ids = [pair.id for pair in report.pairs]
+    assert ids == list(range(1, 15))
+    for p, q in combinations(range(len(ids)), 2):
+        common = same = 0
+        for board in report.boards:
+            a, b = played.get((ids[p], board)), played.get((ids[q], board))
+            if a is not None and b is not None:
+                common += 1
+                same += a == b
+        assert report.boards_in_common[p, q] == report.boards_in_common[q, p] == common
+        assert report.comparisons[p, q] == report.comparisons[q, p] == same
+        assert report.meetings[p, q] == meetings.get((ids[p], ids[q]), 0)
+    for p, pair_id in enumerate(ids):
+        assert report.ns_boards[p] == sum(1 for (i, _), pos in played.items() if i == pair_id and pos == Position.NS)
+        assert report.ew_boards[p] == sum(1 for (i, _), pos in played.items() if i == pair_id and pos == Position.EW)
+    assert report.pair_comparisons.tolist() == report.comparisons.sum(axis=0).tolist()
+
+
+def test_scores():
+    howell = analyze_balance(template_round_data(howell_template(7)))
+    assert howell.scores["meeting_coverage"] == 1.0
+    assert howell.scores["repeat_meetings"] == 0.0
+    assert (howell.meetings + np.eye(14, dtype=np.int32) == 1).all()
+
+    mitchell = analyze_balance(template_round_data(mitchell_template(7)))
+    # Mitchell pairs never change direction nor meet pairs of their own direction
+    assert mitchell.scores["direction_imbalance"] == 1.0
+    assert mitchell.scores["meeting_coverage"] == pytest.approx(49 / 91)
+    assert howell.fairness > mitchell.fairness
+    assert 0 < mitchell.fairness < 1
+
+
+def test_rank_by_balance():
+    calculator = RotationCalculator()
+    ranked = calculator.rank_by_balance(calculator.get_rotations(14, 20, 28, 1))
+    assert ranked
+    fairness = [report.fairness for _, _, report in ranked]
+    assert fairness == sorted(fairness, reverse=True)
+    assert ranked[0][0] is HowellMovement
+    assert ranked[0][1].num_rounds == 13
+    assert ranked[-1][0] is MitchellMovement
+
+
+def test_sixty_pair_howell_is_fast():
+    # all vs all over 59 rounds (circle method), two boards per round
+    num_pairs = 60
+    tables = [Table(i + 1) for i in range(num_pairs // 2)]
+    pairs = [Pair(i + 1, (Player(), Player())) for i in range(num_pairs)]
+    round_data = {}
+    for rnd in range(num_pairs - 1):
+        circle = [pairs[-1]] + [pairs[(rnd + k) % (num_pairs - 1)] for k in range(num_pairs - 1)]
+        group = BoardGroup(rnd + 1, (2 * rnd + 1, 2 * rnd + 2))
+        round_data[rnd + 1] = {
+            table: ({Position.NS: circle[i], Position.EW: circle[num_pairs - 1 - i]}, [group])
+            for i, table in enumerate(tables)
+        }
+
+    report = analyze_balance(round_data)
+    assert report.meetings.shape == (60, 60)
+    assert report.scores["meeting_coverage"] == 1.0
+    assert (report.ns_boards + report.ew_boards == 118).all()
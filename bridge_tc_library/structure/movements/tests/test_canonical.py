@@ -0,0 +1,104 @@
+import random
+
+import pytest
+
+from bridge_tc_library.structure.core import BoardGroup, Pair, Player, Position
+from bridge_tc_library.structure.movements.abstract_rotation import RotationParams
+from bridge_tc_library.structure.movements.canonical import AnalysisCache, canonical_form, fingerprint, strategy_fingerprint
+from bridge_tc_library.structure.movements.library import MovementLibrary
+from bridge_tc_library.structure.movements.rotation_calculator import RotationCalculator
+from bridge_tc_library.structure.movements.rotations.howell import HowellMovement, howell_template
+from bridge_tc_library.structure.movements.rotations.mitchell import mitchell_template
+from bridge_tc_library.structure.tournament import Table
+
+
+def relabel(round_data, seed):
+    """The same movement with tables, pairs and board groups renumbered and reordered."""
+    rng = random.Random(seed)
+    tables = list(next(iter(round_data.values())))
+    pairs = sorted({pair for rnd in round_data.values() for sitting, _ in rnd.values() for pair in sitting.values()}, key=lambda p: p.id)
+    groups = sorted({group for rnd in round_data.values() for _, bgs in rnd.values() for group in bgs}, key=lambda g: g.BoardGroupId)
+
+    new_ids = rng.sample(range(1, 1000), len(pairs))
+    pair_map = {pair: Pair(new_id, (Player(), Player())) for pair, new_id in zip(pairs, new_ids)}
+    group_ids = rng.sample(range(1, 1000), len(groups))
+    group_map = {group: BoardGroup(new_id, tuple(b + 500 for b in group.boards)) for group, new_id in zip(groups, group_ids)}
+    table_ids = rng.sample(range(1, 1000), len(tables))
+    table_map = {table: Table(new_id, isplayable=table.isplayable) for table, new_id in zip(tables, table_ids)}
+
+    order = list(tables)
+    rng.shuffle(order)
+    return {
+        rnd: {
+            table_map[table]: (
+                {pos: pair_map[pair] for pos, pair in round_data[rnd][table][0].items()},
+                [group_map[group] for group in round_data[rnd][table][1]],
+            )
+            for table in order
+        }
+        for rnd in round_data
+    }
+
+
+@pytest.mark.parametrize("template", [howell_template(7), howell_template(7, 10), mitchell_template(9), mitchell_template(9, 9, 5)])
+def test_invariant_under_relabeling(template):
+    round_data = template.round_data(2)
+    for seed in range(3):
+        assert canonical_form(relabel(round_data, seed)) == canonical_form(round_data)
+        assert fingerprint(relabel(round_data, seed)) == fingerprint(round_data)
+
+
+def test_distinguishes_movements():
+    prints = {
+        fingerprint(howell_template(7).round_data(2)),
+        fingerprint(howell_template(7, 10).round_data(2)),
+        fingerprint(howell_template(7).round_data(3)),
+        fingerprint(howell_template(7).round_data(2, num_pairs=13)),
+        fingerprint(mitchell_template(9).round_data(2)),
+        fingerprint(mitchell_template(9, 9, 5).round_data(2)),
+    }
+    assert len(prints) == 6
+
+
+def test_strategy_fingerprint_ignores_table_numbering():
+    template = howell_template(5)
+    tables = [Table(i + 1, isplayable=playable) for i, playable in enumerate(template.playable)]
+    renumbered = [Table(100 - i, isplayable=playable) for i, playable in enumerate(template.playable)]
+    assert strategy_fingerprint(template.bind(tables)) == strategy_fingerprint(template.bind(renumbered))
+    assert strategy_fingerprint(template.bind(tables)) != strategy_fingerprint(howell_template(6).bind(
+        [Table(i + 1, isplayable=playable) for i, playable in enumerate(howell_template(6).playable)]
+    ))
+
+
+def test_calculator_deduplicates_library_copies(tmp_path):
+    library = MovementLibrary(str(tmp_path))
+    library.save("howell-14", howell_template(7))
+    calculator = RotationCalculator(library)
+    candidates = calculator.get_rotations(14, 26, 26, 2)
+    assert [source for source, _ in candidates] == [HowellMovement, library.entries["howell-14"]]
+    assert calculator.unique_rotations(candidates) == [(HowellMovement, RotationParams(7, 13, 2, 13))]
+
+
+def test_analysis_cache():
+    cache = AnalysisCache(maxsize=2)
+    round_data = howell_template(7).round_data(2)
+    first = cache.verify(round_data)
+    assert first.ok
+    assert cache.verify(relabel(round_data, 1)) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache.verify(howell_template(6).round_data(2))
+    cache.verify(howell_template(5).round_data(2))
+    assert len(cache) == 2
+    assert cache.verify(round_data) is not first
+
+
+def test_calculator_verifies_isomorphic_candidates_once(tmp_path):
+    library = MovementLibrary(str(tmp_path))
+    library.save("howell-14", howell_template(7))
+    calculator = RotationCalculator(library)
+    verified = calculator.verify_rotations(calculator.get_rotations(14, 26, 26, 2))
+    assert [source for source, _, _ in verified] == [HowellMovement, library.entries["howell-14"]]
+    assert all(report.ok for _, _, report in verified)
+    assert verified[0][2] is verified[1][2]
+    assert (calculator.analysis_cache.hits, calculator.analysis_cache.misses) == (1, 1)
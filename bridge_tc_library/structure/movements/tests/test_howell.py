@@ -0,0 +1,83 @@
+import pytest
+
+from bridge_tc_library.structure.core import BoardGroup, Pair, Player, Position
+from bridge_tc_library.structure.movements.movement import BaseMovement
+from bridge_tc_library.structure.movements.rotation_calculator import RotationCalculator
+from bridge_tc_library.structure.movements.rotations.howell import HowellMovement, STARTERS
+from bridge_tc_library.structure.movements.verifier import verify_round_data
+from bridge_tc_library.structure.tournament import Sector, Table
+
+
+def build(num_tables, num_pairs, rounds=None):
+    sector = Sector("A")
+    howell = HowellMovement([Table(i + 1, sector) for i in range(num_tables)], num_pairs)
+    pairs = [Pair(i + 1, (Player(), Player())) for i in range(num_pairs)]
+    groups = [BoardGroup(i + 1, (2 * i + 1, 2 * i + 2)) for i in range(howell.m)]
+    strategy = howell.generate_strategy_for_rotation(rounds)
+    movement = BaseMovement(howell.all_tables, groups, pairs, strategy)
+    movement.set_initial_sitting(howell.generate_initial_sitting(pairs))
+    movement.set_initial_boardgroup_placement(howell.generate_initial_boardgroup_placement(groups))
+    return howell, movement
+
+
+def meetings(round_data):
+    met = []
+    for tables in round_data.values():
+        for sitting, _ in tables.values():
+            if Position.NS in sitting and Position.EW in sitting:
+                met.append(frozenset((sitting[Position.NS].id, sitting[Position.EW].id)))
+    return met
+
+
+def test_starters_are_valid():
+    for m, starter in STARTERS.items():
+        seats = [v for x, y, _ in starter for v in (x, y)]
+        differences = [d for x, y, _ in starter for d in ((x - y) % m, (y - x) % m)]
+        played = [v for x, y, a in starter for v in ((a - x) % m, (a - y) % m)]
+        adders = [a for _, _, a in starter]
+        assert sorted(seats) == sorted(differences) == sorted(played) == list(range(1, m)), m
+        assert len(set(adders)) == len(adders) and 0 not in adders, m
+
+
+@pytest.mark.parametrize("num_tables", [4, 5, 7, 10, 20])
+@pytest.mark.parametrize("bye", [False, True])
+def test_full_howell_is_all_vs_all(num_tables, bye):
+    num_pairs = 2 * num_tables - bye
+    howell, movement = build(num_tables, num_pairs)
+    round_data = movement.construct_movement(howell.m)
+    assert verify_round_data(round_data).ok
+    met = meetings(round_data)
+    assert len(met) == len(set(met)) == num_pairs * (num_pairs - 1) // 2
+    assert len(howell.relay_tables) == num_tables - 1
+    assert not any(t.isplayable for t in howell.relay_tables)
+    sector = howell.tables[0].sector
+    assert all(t.sector is sector and t in sector.tables for t in howell.relay_tables)
+
+
+def test_reduced_rounds():
+    assert HowellMovement.round_range(16) == (11, 15)
+    assert HowellMovement.round_range(15) == (11, 15)
+    howell, movement = build(8, 16, rounds=11)
+    assert verify_round_data(movement.construct_movement(11)).ok
+    with pytest.raises(ValueError, match="between 11 and 15 rounds"):
+        howell.generate_strategy_for_rotation(10)
+
+
+def test_unsupported_sizes():
+    with pytest.raises(ValueError, match="No Howell movement for 3 tables"):
+        HowellMovement([Table(i + 1) for i in range(3)])
+    assert HowellMovement.generate_possible_rotations(6, 1, 100, 1) == []
+
+
+def test_possible_rotations_reach_the_calculator():
+    rotations = HowellMovement.generate_possible_rotations(8, 20, 28, 2)
+    assert [(p.num_rounds, p.boards_per_board_group) for p in rotations] == [(5, 4), (5, 5), (6, 4), (7, 3), (7, 4)]
+    assert all(p.num_tables == 4 and p.num_board_groups == 7 for p in rotations)
+    classes = {cls.__name__ for cls, _ in RotationCalculator().get_rotations(8, 20, 28, 2)}
+    assert "HowellMovement" in classes
+
+
+def test_enumerating_up_to_40_pairs():
+    for num_pairs in range(7, 41):
+        for params in HowellMovement.generate_possible_rotations(num_pairs, 18, 30, 2):
+            HowellMovement([Table(i + 1) for i in range(params.num_tables)], num_pairs).generate_strategy_for_rotation(params.num_rounds)
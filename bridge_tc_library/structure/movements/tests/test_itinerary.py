@@ -0,0 +1,104 @@
+import csv
+import io
+
+import pytest
+
+from bridge_tc_library.structure.core import Position
+from bridge_tc_library.structure.movements.itinerary import (
+    PAIR_CARD_HEADER, build_itineraries, build_table_cards, export_pair_cards, export_table_cards, format_boards,
+)
+from bridge_tc_library.structure.movements.rotations.mitchell import mitchell_template
+from bridge_tc_library.structure.movements.tests.helpers import make_howell_movement
+
+
+def test_itineraries_match_per_pair_scan():
+    movement = make_howell_movement()
+    round_data = movement.construct_movement(7)
+    itineraries = build_itineraries(round_data)
+
+    assert set(itineraries) == set(movement.pairs)
+    for pair in movement.pairs:
+        expected = []
+        for rnd in sorted(round_data):
+            for table, (sitting, groups) in round_data[rnd].items():
+                for position, seated in sitting.items():
+                    if seated is pair:
+                        other = sitting.get(Position.EW if position == Position.NS else Position.NS)
+                        boards = tuple(b for g in groups for b in g.boards) if other is not None else ()
+                        expected.append((rnd, table, position, other, boards))
+        assert [tuple(stop) for stop in itineraries[pair]] == expected
+        assert [stop.round for stop in itineraries[pair]] == list(range(1, 8))
+
+
+def test_table_cards():
+    movement = make_howell_movement()
+    round_data = movement.construct_movement(7)
+    cards = build_table_cards(round_data)
+    assert list(cards) == [t for t in movement.tables if t.isplayable]
+    for table, stops in cards.items():
+        for stop in stops:
+            sitting, groups = round_data[stop.round][table]
+            assert (stop.ns, stop.ew) == (sitting.get(Position.NS), sitting.get(Position.EW))
+            assert stop.boards == tuple(b for g in groups for b in g.boards)
+    assert len(build_table_cards(round_data, playable_only=False)) == len(movement.tables)
+
+
+def test_format_boards():
+    assert format_boards(()) == ""
+    assert format_boards((4,)) == "4"
+    assert format_boards((1, 2, 3, 7, 9, 10)) == "1-3, 7, 9-10"
+
+
+def test_csv_export():
+    movement = make_howell_movement()
+    round_data = movement.construct_movement(7)
+    out = io.StringIO()
+    export_pair_cards(round_data, out)
+    rows = list(csv.reader(io.StringIO(out.getvalue())))
+    assert tuple(rows[0]) == PAIR_CARD_HEADER
+    assert len(rows) == 1 + 8 * 7
+    first = rows[1]
+    stop = build_itineraries(round_data)[movement.pairs[0]][0]
+    assert first == ["1", "1", str(stop.table), stop.position.value, str(stop.opponent), format_boards(stop.boards)]
+
+    out = io.StringIO()
+    export_table_cards(round_data, out)
+    assert len(out.getvalue().splitlines()) == 1 + 4 * 7
+
+
+def test_text_export():
+    movement = make_howell_movement()
+    round_data = movement.construct_movement(7)
+    out = io.StringIO()
+    export_pair_cards(round_data, out, fmt="text")
+    cards = out.getvalue().split("\n\n")
+    assert len(cards) == 8
+    assert cards[0].splitlines()[0] == "Pair 1"
+    assert len(cards[0].splitlines()) == 2 + 7
+
+    out = io.StringIO()
+    export_table_cards(round_data, out, fmt="text")
+    assert out.getvalue().startswith("Table A1\nRound\tNS\tEW\tBoards\n1\t1\t2\t1-3\n")
+    with pytest.raises(ValueError):
+        export_table_cards(round_data, io.StringIO(), fmt="pdf")
+
+
+def test_large_event_in_one_pass():
+    # 150 pairs: a 75-table Mitchell
+    round_data = mitchell_template(75).round_data(2)
+    itineraries = build_itineraries(round_data)
+    assert len(itineraries) == 150
+    assert all(len(stops) == 75 for stops in itineraries.values())
+    out = io.StringIO()
+    export_pair_cards(round_data, out)
+    assert len(out.getvalue().splitlines()) == 1 + 150 * 75
+
+
+def test_sector_string():
+    movement = make_howell_movement()
+    movement.construct_movement(3)
+    text = movement.tables[0].sector.get_sector_as_string_for_round(2)
+    lines = text.split("\n")
+    assert lines[:2] == ["Round 2 Sitting and Boards:", "TABLE\tNS\tEW\tBoard Groups"]
+    assert len(lines) == 2 + len(movement.tables) + 1 and lines[-1] == ""
+    assert lines[5].startswith(f"{movement.tables[3]}\t----\t----\t")
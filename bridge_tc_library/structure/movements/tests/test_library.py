@@ -0,0 +1,69 @@
+import json
+import os
+
+import pytest
+
+from bridge_tc_library.structure.movements.library import MovementLibrary
+from bridge_tc_library.structure.movements.rotation_calculator import RotationCalculator
+from bridge_tc_library.structure.movements.rotations.howell import howell_template
+from bridge_tc_library.structure.movements.rotations.mitchell import mitchell_template
+
+
+def make_library(path):
+    library = MovementLibrary(str(path))
+    library.save("mitchell-7", mitchell_template(7))
+    library.save("mitchell-7-switch", mitchell_template(7, 7, 4))
+    library.save("howell-4", howell_template(4))
+    return library
+
+
+def test_roundtrip_and_lazy_loading(tmp_path):
+    make_library(tmp_path)
+    assert json.loads((tmp_path / "index.json").read_text())["version"] == 1
+
+    library = MovementLibrary(str(tmp_path))
+    assert len(library) == 3 and library._templates == {}
+    template = library.load("howell-4")
+    assert list(library._templates) == ["howell-4"]
+    assert library.load("howell-4") is template
+
+    original = howell_template(4)
+    assert template.entries == original.entries
+    assert template.playable == original.playable
+    assert template.initial_seats == original.initial_seats
+    assert template.initial_groups == original.initial_groups
+
+
+@pytest.mark.parametrize("name", ["", "../escape", "a/b", ".hidden", "..", "index", "sub\\dir"])
+def test_rejects_names_that_are_not_plain_file_names(tmp_path, name):
+    library = MovementLibrary(str(tmp_path))
+    with pytest.raises(ValueError):
+        library.save(name, howell_template(4))
+    assert len(library) == 0
+
+
+def test_save_leaves_no_temporary_files(tmp_path):
+    make_library(tmp_path)
+    assert sorted(os.listdir(tmp_path)) == ["howell-4.json", "index.json", "mitchell-7-switch.json", "mitchell-7.json"]
+
+
+def test_find_uses_the_index_only(tmp_path):
+    make_library(tmp_path)
+    library = MovementLibrary(str(tmp_path))
+    for entry in library.entries.values():
+        os.remove(tmp_path / entry.file)
+
+    assert [e.name for e in library.find(pairs=14)] == ["mitchell-7", "mitchell-7-switch"]
+    assert [e.name for e in library.find(pairs=13, boards=21)] == ["mitchell-7", "mitchell-7-switch"]
+    assert [e.name for e in library.find(pairs=8, tables=4, boards=21)] == ["howell-4"]
+    assert library.find(pairs=8, boards=20) == []
+    assert library.find(tables=5) == []
+
+
+def test_calculator_offers_library_movements(tmp_path):
+    calculator = RotationCalculator(library=make_library(tmp_path))
+    found = [(source, params) for source, params in calculator.get_rotations(8, 20, 24, 3) if source in calculator.library.entries.values()]
+    assert [(entry.name, params.boards_per_board_group) for entry, params in found] == [("howell-4", 3)]
+    entry, params = found[0]
+    assert params.num_rounds == 7 and params.num_board_groups == 7
+    assert calculator.get_library_template(entry).size == 7
@@ -0,0 +1,196 @@
+import pytest
+
+from bridge_tc_library.structure.core import Position
+from bridge_tc_library.structure.movements.tests.helpers import make_howell_movement
+
+
+def as_ids(round_data):
+    """round_data with tables, pairs and board groups replaced by their ids."""
+    return {
+        (rnd, table.display_id): ({pos: pair.id for pos, pair in sitting.items()}, [bg.BoardGroupId for bg in groups])
+        for rnd, tables in round_data.items()
+        for table, (sitting, groups) in tables.items()
+    }
+
+
+def test_compiled_matches_uncompiled():
+    movement = make_howell_movement()
+    expected = movement.construct_movement(7, compiled=False)
+    movement.round_data = {}
+    assert movement.construct_movement(7) == expected
+
+
+def test_compiled_plan_is_cached():
+    movement = make_howell_movement()
+    plan = movement.compile_plan()
+    assert movement.compile_plan() is plan
+    assert plan.round_lookup == {r: 0 for r in range(1, 8)}
+
+
+def test_missing_strategy_round_raises():
+    movement = make_howell_movement()
+    with pytest.raises(ValueError, match="No strategy defined for round 8"):
+        movement.construct_movement(8)
+
+
+def test_strategy_entries_are_read_only():
+    movement = make_howell_movement(split_round=4)
+    strategy = movement.movement_strategies
+    entries = strategy.as_list()
+    assert strategy.strategies == entries
+    with pytest.raises(AttributeError):
+        entries[1][2].clear()
+    with pytest.raises(TypeError):
+        entries[1][0][0] = entries[1][0][1]
+    assert strategy.get_strategy_for_round(5) == entries[1][:2]
+    assert movement.construct_movement(7) == movement.construct_movement(7, compiled=False)
+
+
+def test_strategy_append_defines_new_rounds():
+    movement = make_howell_movement()
+    strategy = movement.movement_strategies
+    pair_moves, board_moves, _ = strategy.as_list()[0]
+    assert strategy.append((list(pair_moves), list(board_moves), [6, 7, 8])) == 8
+    assert len(strategy.as_list()) == 2
+    assert strategy.get_strategy_for_round(7) == strategy.as_list()[0][:2]
+    assert movement.construct_movement(8) == movement.construct_movement(8, compiled=False)
+
+
+def test_construct_resumes_from_last_round():
+    movement = make_howell_movement()
+    first = movement.construct_movement(3)
+    kept = [first[r] for r in (1, 2, 3)]
+    data = movement.construct_movement(7)
+    assert [data[r] for r in (1, 2, 3)] == kept
+    assert all(data[r] is kept[r - 1] for r in (1, 2, 3))
+
+    reference = make_howell_movement()
+    assert as_ids(data) == as_ids(reference.construct_movement(7, compiled=False))
+
+
+def test_rounds_built_on_demand():
+    movement = make_howell_movement()
+    movement.construct_movement(2)
+    sitting = movement.get_sitting_for_round(5)
+    assert set(movement.round_data) == {1, 2, 3, 4, 5}
+    assert len(sitting) == 4
+
+    rounds = [rnd for rnd, _ in movement.iter_rounds()]
+    assert rounds == [1, 2, 3, 4, 5, 6, 7]
+
+
+def test_strategy_update_invalidates_only_later_rounds():
+    movement = make_howell_movement(split_round=4)
+    data = movement.construct_movement(7)
+    early = [data[r] for r in (1, 2, 3)]
+
+    pair_moves, board_moves, rounds = movement.movement_strategies.as_list()[1]
+    first = movement.update_strategy(1, (pair_moves[::-1], board_moves[::-1], rounds))
+    assert first == 4
+    assert set(movement.round_data) == {1, 2, 3}
+
+    rebuilt = movement.construct_movement(7)
+    assert all(rebuilt[r] is early[r - 1] for r in (1, 2, 3))
+
+    expected = as_ids(rebuilt)
+    assert expected == as_ids(movement.construct_movement(7, compiled=False))
+
+
+def test_new_initial_sitting_invalidates_everything():
+    movement = make_howell_movement()
+    movement.construct_movement(4)
+    sitting = dict(movement.initial_sitting)
+    movement.set_initial_sitting(sitting)
+    assert movement.round_data == {}
+
+
+def test_in_place_edit_of_initial_state_rebuilds():
+    movement = make_howell_movement()
+    movement.construct_movement(7)
+    table = movement.tables[0]
+    seats = movement.initial_sitting[table]
+    seats[Position.NS], seats[Position.EW] = seats[Position.EW], seats[Position.NS]
+    movement.initial_boardgroup_placement[table].reverse()
+    movement.initial_boardgroup_placement[movement.tables[1]].append(movement.board_groups[-1])
+    movement.set_initial_sitting(movement.initial_sitting)
+    movement.initial_boardgroup_placement = movement.initial_boardgroup_placement
+
+    assert movement.construct_movement(7)[1][table][0][Position.NS] is seats[Position.NS]
+    expected = as_ids(movement.round_data)
+    assert expected == as_ids(movement.construct_movement(7, compiled=False))
+
+
+def test_built_rounds_are_not_rebuilt(monkeypatch):
+    movement = make_howell_movement()
+    built = dict(movement.construct_movement(7))
+
+    def fail(*args):
+        raise AssertionError("rebuilt")
+
+    monkeypatch.setattr(movement, "compile_plan", fail)
+    for rnd in range(1, 8):
+        assert movement.get_sitting_for_round(rnd) is movement.get_sitting_for_round(rnd)
+    movement.construct_movement(7)
+    assert all(movement.round_data[rnd] is built[rnd] for rnd in built)
+
+
+def test_round_views_are_cached_and_read_only():
+    movement = make_howell_movement(split_round=4)
+    movement.construct_movement(7)
+
+    for rnd in range(1, 8):
+        sitting = movement.get_sitting_for_round(rnd)
+        boards = movement.get_boards_for_round(rnd)
+        assert movement.get_sitting_for_round(rnd) is sitting
+        assert movement.get_boards_for_round(rnd) is boards
+        with pytest.raises(TypeError):
+            sitting[movement.tables[0]] = {}
+        with pytest.raises(TypeError):
+            boards[movement.tables[0]] = []
+    with pytest.raises(TypeError):
+        movement.get_sitting_for_round(3)[movement.tables[0]][Position.NS] = None
+
+
+def test_round_views_follow_invalidation():
+    movement = make_howell_movement(split_round=4)
+    movement.construct_movement(7)
+    early = movement.get_sitting_for_round(2)
+    late = movement.get_sitting_for_round(6)
+    late_boards = movement.get_boards_for_round(6)
+
+    pair_moves, board_moves, rounds = movement.movement_strategies.as_list()[1]
+    movement.update_strategy(1, (pair_moves[::-1], board_moves[::-1], rounds))
+    movement.construct_movement(7)
+    assert movement.get_sitting_for_round(2) is early
+    assert movement.get_sitting_for_round(6) is not late
+    assert movement.get_boards_for_round(6) is not late_boards
+    assert dict(movement.get_boards_for_round(6)) == {t: tuple(bgs) for t, (_, bgs) in movement.round_data[6].items()}
+
+    first = movement.get_sitting_for_round(1)
+    movement.set_initial_sitting(dict(movement.initial_sitting))
+    assert movement.get_sitting_for_round(1) is not first
+    assert movement.get_sitting_for_round(2) is not early
+    assert movement.get_sitting_for_round(1) == first
+
+
+def test_round_views_do_not_alias_round_data():
+    movement = make_howell_movement()
+    movement.construct_movement(7)
+    table = movement.tables[0]
+    boards = movement.get_boards_for_round(3)
+    with pytest.raises(AttributeError):
+        boards[table].append(movement.board_groups[0])
+    assert boards[table] == tuple(movement.round_data[3][table][1])
+
+    first = movement.get_sitting_for_round(1)
+    first_boards = movement.get_boards_for_round(1)
+    assert movement.get_sitting_for_round(1) is first
+    del movement.initial_sitting[table]
+    movement.initial_boardgroup_placement[table].clear()
+    # in-place edits are picked up once the initial state is set again
+    assert movement.get_sitting_for_round(1) is first and table in first
+    movement.set_initial_sitting(movement.initial_sitting)
+    movement.set_initial_boardgroup_placement(movement.initial_boardgroup_placement)
+    assert table not in movement.get_sitting_for_round(1)
+    assert movement.get_boards_for_round(1)[table] == ()
+    assert first_boards[table] != ()
@@ -0,0 +1,82 @@
+import random
+
+import pytest
+
+from bridge_tc_library.structure.core import BoardGroup, Pair, Player, Position
+from bridge_tc_library.structure.movements.movement import BaseMovement
+from bridge_tc_library.structure.movements.optimizer import _Search, build_template, lower_bound, optimize_movement
+from bridge_tc_library.structure.movements.verifier import verify_round_data
+from bridge_tc_library.structure.tournament import Table
+
+
+def play(template, num_pairs, boards_per_group=2):
+    tables = [Table(i + 1, isplayable=playable) for i, playable in enumerate(template.playable)]
+    pairs = [Pair(i + 1, (Player(), Player())) for i in range(num_pairs)]
+    groups = [BoardGroup(i + 1, tuple(range(boards_per_group * i + 1, boards_per_group * (i + 1) + 1))) for i in range(len(template.initial_groups))]
+    movement = BaseMovement(tables, groups, pairs, template.bind(tables))
+    movement.set_initial_sitting(template.initial_sitting(tables, pairs))
+    movement.set_initial_boardgroup_placement(template.initial_placement(tables, groups))
+    return movement.construct_movement(template.rounds)
+
+
+def test_incremental_cost_matches_recount():
+    search = _Search(17, 12, 12, random.Random(3))
+    search.anneal(None, -1, 20000)
+
+    fresh = _Search(17, 12, 12, random.Random(0))
+    fresh.seats, fresh.slots = search.seats, search.slots
+    fresh.meet, fresh.play = [0] * len(fresh.meet), [0] * len(fresh.play)
+    fresh.balance, fresh.byes = [0] * 17, [0] * 17
+    fresh.hard = fresh.soft = 0
+    for rnd in range(12):
+        for table in range(9):
+            fresh._table(rnd, table, 1)
+    assert (fresh.hard, fresh.soft) == (search.hard, search.soft)
+
+
+def test_template_layout():
+    seats = [list(range(5)), [4, 3, 2, 1, 0]]
+    slots = [[0, 1, 2], [2, 0, 1]]
+    template = build_template(5, seats, slots)
+    # two playing tables, the bye table, one relay table
+    assert template.playable == (True, True, True, False)
+    assert template.initial_seats == ((0, Position.NS), (0, Position.EW), (1, Position.NS), (1, Position.EW), (2, Position.NS))
+    assert template.initial_groups == (0, 1, 3)
+    (pair_moves, board_moves, rounds), = template.entries
+    assert rounds == (2,)
+    assert pair_moves[0] == ((2, Position.NS), (0, Position.NS))
+    assert board_moves == ((3, 0), (0, 1), (1, 3))
+
+
+def test_finds_valid_movement_on_a_pool():
+    # 13 pairs, 8 rounds: 6 playing tables, the bye table and two relay tables
+    result = optimize_movement(13, 8, time_budget=None, max_iterations=200000, restarts=2, processes=2, seed=0)
+    assert result.ok
+    assert result.cost == lower_bound(13, 8)
+    assert result.template.rounds == 8
+    assert sum(result.template.playable) == 7
+
+    round_data = play(result.template, 13)
+    assert verify_round_data(round_data).ok
+    for rnd, tables in round_data.items():
+        seated = [pair for sitting, _ in tables.values() for pair in sitting.values()]
+        assert len(seated) == len(set(seated)) == 13
+
+
+def test_iteration_cap_is_reproducible():
+    first = optimize_movement(9, 8, time_budget=None, max_iterations=50000, processes=1, seed=1)
+    again = optimize_movement(9, 8, time_budget=None, max_iterations=50000, processes=1, seed=1)
+    assert (first.cost, first.template.entries) == (again.cost, again.template.entries)
+    assert first.ok
+    assert verify_round_data(play(first.template, 9)).ok
+
+    # a cap too small to converge still returns the best movement seen
+    capped = optimize_movement(17, 12, time_budget=None, max_iterations=256, processes=1, seed=0)
+    assert capped.cost > lower_bound(17, 12)
+
+
+def test_rejects_bad_arguments():
+    with pytest.raises(ValueError):
+        optimize_movement(17, 12, num_board_groups=7)
+    with pytest.raises(ValueError):
+        optimize_movement(9, 8, time_budget=None)
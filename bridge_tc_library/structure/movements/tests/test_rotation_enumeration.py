@@ -0,0 +1,37 @@
+from bridge_tc_library.structure.movements.abstract_rotation import AbstractRotation
+from bridge_tc_library.structure.movements.rotation_calculator import RotationCalculator, _class_rotations, boards_played
+from bridge_tc_library.structure.movements.rotations.mitchell import MitchellMovement
+
+
+def test_boards_per_boardgroup_range_matches_stepping():
+    for unit in range(1, 20):
+        for low in range(0, 40, 3):
+            for high in range(low, 45, 4):
+                for min_bpg in (0, 1, 2, 3):
+                    expected = [b for b in range(max(min_bpg, 1), high + 1) if low <= b * unit <= high]
+                    assert list(AbstractRotation.boards_per_boardgroup_range(unit, low, high, min_bpg)) == expected
+
+
+def test_rotations_are_memoized_and_ranked():
+    calculator = RotationCalculator()
+    _class_rotations.cache_clear()
+    calculator.get_rotations(14, 20, 36, 2)
+    calculator.get_rotations(14, 20, 36, 2)
+    assert _class_rotations.cache_info().hits == len(calculator.rotations)
+
+    ranked = calculator.get_ranked_rotations(14, 20, 36, 2)
+    assert sorted(map(repr, ranked)) == sorted(map(repr, calculator.get_rotations(14, 20, 36, 2)))
+    distances = [abs(boards_played(params) - 28) for _, params in ranked]
+    assert distances == sorted(distances)
+    assert (MitchellMovement, (7, 7, 4, None)) in ranked
+
+
+def test_bulk_enumeration_in_a_process_pool_matches_serial():
+    calculator = RotationCalculator()
+    queries = [(pairs, 20, 36, 2) for pairs in range(18, 41)] + [(24, 20, 36, 2)]
+    serial = calculator.enumerate_rotations(queries, processes=1)
+    pooled = calculator.enumerate_rotations(queries, processes=2)
+    assert len(serial) == 23
+    assert {q: [(cls.__name__, p) for cls, p in r] for q, r in pooled.items()} == \
+        {q: [(cls.__name__, p) for cls, p in r] for q, r in serial.items()}
+    assert serial[(26, 20, 36, 2)][0][0] is MitchellMovement
@@ -0,0 +1,62 @@
+import json
+import os
+import subprocess
+import sys
+
+from bridge_tc_library.structure.movements.rotations.registry import RotationRegistry
+
+
+def make_package(root, name="fake_rotations"):
+    pkg = root / name
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("")
+    (pkg / "good.py").write_text("class GoodMovement:\n    pass\n\nclass Helper:\n    pass\n")
+    (pkg / "broken.py").write_text("import does_not_exist\n\nclass BrokenMovement:\n    pass\n")
+    return pkg
+
+
+def test_manifest_is_cached_and_invalidated_by_mtime(tmp_path):
+    pkg = make_package(tmp_path)
+    registry = RotationRegistry(pkg, "fake_rotations")
+    assert registry.class_names() == {"BrokenMovement": "broken", "GoodMovement": "good"}
+    manifest = json.loads(registry.manifest_path.read_text())
+    assert manifest["modules"]["good"]["classes"] == ["GoodMovement"]
+
+    # unchanged modules are taken from the manifest, not rescanned
+    stat = (pkg / "good.py").stat()
+    manifest["modules"]["good"]["classes"] = ["CachedMovement"]
+    registry.manifest_path.write_text(json.dumps(manifest))
+    assert "CachedMovement" in RotationRegistry(pkg, "fake_rotations").class_names()
+
+    (pkg / "good.py").write_text("class NewMovement:\n    pass\n")
+    os.utime(pkg / "good.py", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert RotationRegistry(pkg, "fake_rotations").class_names() == {"BrokenMovement": "broken", "NewMovement": "good"}
+
+
+def test_modules_are_imported_on_demand_once(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    pkg = make_package(tmp_path, "lazy_rotations")
+    registry = RotationRegistry(pkg, "lazy_rotations")
+
+    assert registry.class_names()
+    assert "lazy_rotations.good" not in sys.modules
+    assert registry.get("GoodMovement").__name__ == "GoodMovement"
+    assert "lazy_rotations.broken" not in sys.modules
+
+    assert registry.get("BrokenMovement") is None
+    assert registry.get("BrokenMovement") is None
+    assert list(registry.failed_imports()) == ["broken"]
+    assert "does_not_exist" in registry.failed_imports()["broken"]
+
+
+def test_package_import_does_not_import_rotation_modules():
+    code = (
+        "import sys\n"
+        "import bridge_tc_library.structure.movements.rotations as rotations\n"
+        "assert 'bridge_tc_library.structure.movements.rotations.howell' not in sys.modules\n"
+        "assert 'HowellMovement' in rotations.__all__\n"
+        "assert rotations.HowellMovement.__name__ == 'HowellMovement'\n"
+        "assert 'bridge_tc_library.structure.movements.rotations.mitchell' not in sys.modules\n"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=root)
@@ -0,0 +1,118 @@
+import pytest
+
+from bridge_tc_library.structure.core import Position
+from bridge_tc_library.structure.movements.index import RoundIndex
+from bridge_tc_library.structure.movements.tests.helpers import make_howell_movement
+
+
+def scan(round_data):
+    """Brute-force answers: (board, round) -> tables, board -> plays, (pair, round) -> seat."""
+    locations, plays, seats = {}, {}, {}
+    for rnd in sorted(round_data):
+        for table, (sitting, groups) in round_data[rnd].items():
+            boards = tuple(b for g in groups for b in g.boards)
+            for board in boards:
+                locations.setdefault((board, rnd), []).append(table)
+            if Position.NS in sitting and Position.EW in sitting:
+                ns, ew = sitting[Position.NS], sitting[Position.EW]
+                for board in boards:
+                    plays.setdefault(board, []).append((rnd, table, ns, ew))
+                seats[(ns, rnd)] = (table, Position.NS, ew, boards)
+                seats[(ew, rnd)] = (table, Position.EW, ns, boards)
+    return locations, plays, seats
+
+
+def assert_matches(index, round_data, pairs):
+    locations, plays, seats = scan(round_data)
+    for rnd in round_data:
+        for board in range(1, 22):
+            tables = locations.get((board, rnd), [])
+            assert index.board_tables(board, rnd) == tables
+            assert index.board_table(board, rnd) == (tables[0] if tables else None)
+        for pair in pairs:
+            found = index.pair_round(pair, rnd)
+            assert (tuple(found) if found else None) == seats.get((pair, rnd))
+    for board in range(1, 22):
+        assert [tuple(p) for p in index.board_plays(board)] == plays.get(board, [])
+        played = {pair for _, _, ns, ew in plays.get(board, []) for pair in (ns, ew)}
+        assert index.pairs_played(board) == played
+        assert all(index.has_played(pair, board) == (pair in played) for pair in pairs)
+
+
+def test_index_matches_scan():
+    movement = make_howell_movement()
+    round_data = movement.construct_movement(7)
+    assert_matches(movement.index, round_data, movement.pairs)
+    assert movement.index.rounds == list(range(1, 8))
+
+
+def test_index_follows_invalidation_and_rebuilds():
+    movement = make_howell_movement(split_round=4)
+    movement.construct_movement(7)
+    index = movement.index
+
+    movement.invalidate_from(5)
+    assert index.rounds == [1, 2, 3, 4]
+    assert index.board_plays(1, 6) == []
+    assert all(play.round < 5 for board in range(1, 22) for play in index.board_plays(board))
+
+    # rebuilding the missing rounds lazily updates the same index
+    movement.get_sitting_for_round(7)
+    assert movement.index is index
+    assert_matches(index, movement.round_data, movement.pairs)
+
+    (pair_moves, board_moves, rounds) = movement.movement_strategies.as_list()[1]
+    movement.update_strategy(1, (pair_moves[::-1][:3], board_moves, rounds))
+    movement.construct_movement(7)
+    assert_matches(index, movement.round_data, movement.pairs)
+
+
+def test_lookups_build_rounds():
+    movement = make_howell_movement()
+    pair = movement.pairs[0]
+    seat = movement.get_pair_round(pair, 3)
+    assert seat.position in (Position.NS, Position.EW)
+    assert movement.round_data[3][seat.table][0][seat.position] is pair
+    board = seat.boards[0]
+    assert movement.get_board_table(board, 3) is seat.table
+    assert pair in movement.index.pairs_played(board)
+    assert movement.index.has_played(pair, board)
+    with pytest.raises(ValueError):
+        movement.get_pair_round(pair, 9)
+
+
+def test_uncompiled_construction_resets_index():
+    movement = make_howell_movement()
+    movement.construct_movement(3)
+    movement.index
+    movement.construct_movement(7, compiled=False)
+    assert movement.index.rounds == list(range(1, 8))
+    assert_matches(movement.index, movement.round_data, movement.pairs)
+
+
+def test_add_round_replaces_previous_entries():
+    movement = make_howell_movement()
+    round_data = movement.construct_movement(2)
+    index = RoundIndex()
+    index.add_round(2, round_data[1])
+    index.add_round(2, round_data[2])
+    _, plays, _ = scan({2: round_data[2]})
+    for board in range(1, 22):
+        assert [tuple(p) for p in index.board_plays(board)] == plays.get(board, [])
+
+
+def test_board_played_at_several_tables():
+    movement = make_howell_movement()
+    round_data = movement.construct_movement(1)
+    tables = list(round_data[1])
+    (first_sitting, groups), (second_sitting, _) = round_data[1][tables[0]], round_data[1][tables[1]]
+    index = RoundIndex()
+    # both tables play the same boards, as in a barometer
+    index.add_round(1, {tables[0]: (first_sitting, groups), tables[1]: (second_sitting, groups)})
+    board = groups[0].boards[0]
+    assert index.board_tables(board, 1) == tables[:2]
+    assert index.board_table(board, 1) is tables[0]
+    assert len(index.board_plays(board, 1)) == 2
+    index.drop_round(1)
+    assert index.board_tables(board, 1) == []
+    assert not index.has_played(first_sitting[Position.NS], board)
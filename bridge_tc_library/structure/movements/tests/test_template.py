@@ -0,0 +1,58 @@
+import pytest
+
+from bridge_tc_library.structure.core import BoardGroup, Pair, Player, Position
+from bridge_tc_library.structure.movements.movement import BaseMovement
+from bridge_tc_library.structure.movements.rotations.mitchell import MitchellMovement, mitchell_template
+from bridge_tc_library.structure.movements.template import get_template
+from bridge_tc_library.structure.movements.verifier import verify_round_data
+from bridge_tc_library.structure.tournament import Sector, Table
+
+
+def mitchell_sector(name, num_tables=13):
+    sector = Sector(name)
+    return [Table(i + 1, sector) for i in range(num_tables)]
+
+
+def play(template, tables):
+    pairs = [Pair(i + 1, (Player(), Player())) for i in range(2 * len(tables))]
+    groups = [BoardGroup(i + 1, (2 * i + 1, 2 * i + 2)) for i in range(len(tables))]
+    movement = BaseMovement(tables, groups, pairs, template.bind(tables))
+    movement.set_initial_sitting(template.initial_sitting(tables, pairs))
+    movement.set_initial_boardgroup_placement(template.initial_placement(tables, groups))
+    return movement.construct_movement(template.rounds)
+
+
+def test_templates_are_generated_once():
+    assert get_template("mitchell", 13) is get_template("mitchell", 13)
+    assert get_template("mitchell", 13, 13, 7) is not get_template("mitchell", 13)
+    assert get_template("howell", 5).size == 9
+
+    mitchell_template.cache_clear()
+    sectors = [mitchell_sector(chr(ord("A") + i)) for i in range(16)]
+    strategies = [MitchellMovement(tables).generate_strategy_for_rotation(13) for tables in sectors]
+    assert mitchell_template.cache_info().misses == 1
+    assert mitchell_template.cache_info().hits == 15
+    for tables, strategy in zip(sectors, strategies):
+        (pair_moves, board_moves, rounds), = strategy.as_list()
+        assert pair_moves[0] == ((tables[0], Position.EW), (tables[1], Position.EW))
+        assert board_moves[0] == (tables[0], tables[12])
+        assert rounds == tuple(range(1, 14))
+
+
+@pytest.mark.parametrize("switch", [None, 1, 4, 7])
+def test_mitchell_is_valid(switch):
+    tables = mitchell_sector("A", 7)
+    template = mitchell_template(7, 7, switch)
+    round_data = play(template, tables)
+    assert verify_round_data(round_data).ok
+    if switch not in (None, 1):
+        assert [len(rounds) for _, _, rounds in template.entries] == [n for n in (switch - 1, 1, 7 - switch) if n]
+        # the stationary NS pair of table 1 sits EW from the switch on
+        assert round_data[switch][tables[0]][0][Position.EW].id == 1
+
+
+def test_bind_checks_table_count():
+    with pytest.raises(ValueError, match="mitchell template needs 7 tables, got 5"):
+        mitchell_template(7).bind(mitchell_sector("A", 5))
+    with pytest.raises(ValueError, match="must be max 7"):
+        mitchell_template(7, 7, 8)
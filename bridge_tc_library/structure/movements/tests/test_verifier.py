@@ -0,0 +1,62 @@
+from bridge_tc_library.structure.core import BoardGroup, Pair, Player, Position
+from bridge_tc_library.structure.movements.verifier import (
+    GROUP_AT_TWO_TABLES, PAIR_SEATED_TWICE, REPEATED_OPPONENTS, REPLAYED_BOARD,
+    verify_movement, verify_round_data, verify_strategy,
+)
+from bridge_tc_library.structure.movements.tests.helpers import make_howell_movement
+from bridge_tc_library.structure.tournament import Table
+
+
+def mitchell_round_data(num_tables, rounds, ew_step=1):
+    tables = [Table(i + 1) for i in range(num_tables)]
+    pairs = [Pair(i + 1, (Player(), Player())) for i in range(2 * num_tables)]
+    groups = [BoardGroup(i + 1, (2 * i + 1, 2 * i + 2)) for i in range(num_tables)]
+    return {
+        rnd: {
+            table: ({Position.NS: pairs[t], Position.EW: pairs[num_tables + (t + ew_step * (rnd - 1)) % num_tables]},
+                    [groups[(t - rnd + 1) % num_tables]])
+            for t, table in enumerate(tables)
+        }
+        for rnd in range(1, rounds + 1)
+    }
+
+
+def test_howell_example_is_clean():
+    movement = make_howell_movement()
+    report = verify_movement(movement, 7)
+    assert report.ok, str(report)
+    assert report.rounds == 7
+
+
+def test_strategy_without_movement_matches_movement():
+    movement = make_howell_movement()
+    report = verify_strategy(movement.movement_strategies, movement.tables,
+                             movement.initial_sitting, movement.initial_boardgroup_placement)
+    assert report.ok and report.rounds == 7
+
+
+def test_reports_every_conflict():
+    # EW pairs skip a table each round, so with 4 tables they meet the same NS pairs again in round 3
+    round_data = mitchell_round_data(4, 3, ew_step=2)
+    report = verify_round_data(round_data)
+    repeated = report.by_kind(REPEATED_OPPONENTS)
+    assert [(c.round, c.first_round, c.pair.id, c.other.id) for c in repeated] == [(3, 1, 1, 5), (3, 1, 2, 6), (3, 1, 3, 7), (3, 1, 4, 8)]
+    assert report.by_kind(REPLAYED_BOARD) == []
+
+    tables = list(round_data[2])
+    sitting, groups = round_data[2][tables[1]]
+    round_data[2][tables[1]] = ({Position.NS: sitting[Position.NS], Position.EW: round_data[2][tables[0]][0][Position.NS]},
+                                groups + round_data[2][tables[0]][1])
+    report = verify_round_data(round_data)
+    seated = report.by_kind(PAIR_SEATED_TWICE)
+    assert [(c.round, c.table, c.first_table, c.pair.id) for c in seated] == [(2, tables[1], tables[0], 1)]
+    assert [(c.round, c.board_group.BoardGroupId) for c in report.by_kind(GROUP_AT_TWO_TABLES)] == [(2, 4)]
+    replays = report.by_kind(REPLAYED_BOARD)
+    # pair 1 also gets the boards it played in round 1; pair 2 now meets group 4 again in round 3
+    assert {(c.pair.id, c.board, c.round) for c in replays} == {(1, 1, 2), (1, 2, 2), (1, 7, 2), (1, 8, 2), (2, 7, 3), (2, 8, 3)}
+    assert str(replays[0]) == "1 replayed board 1 (round 2, table _2, first played in round 1)"
+
+
+def test_large_movement_is_clean():
+    report = verify_round_data(mitchell_round_data(60, 30))
+    assert report.ok
@@ -0,0 +1,139 @@
+"""
+Static verification of a whole movement before play starts.
+
+`verify_round_data` walks a constructed `round_data` once, round by round, and
+collects every conflict instead of stopping at the first one:
+- a pair replaying a board it already played
+- two pairs meeting a second time
+- a pair seated twice in the same round
+- a board group present at two tables in the same round
+
+A table plays every board group in its queue when both its NS and EW seats are
+taken; tables with an empty seat (relays, sit-outs) only hold boards.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from bridge_tc_library.structure.core import Position, Pair, BoardGroup
+from .compiled import CompiledMovementPlan
+
+if TYPE_CHECKING:
+	from bridge_tc_library.structure.tournament import Table
+	from .movement import BaseMovement
+	from .strategy import MovementStrategy
+
+
+REPLAYED_BOARD = "replayed_board"
+REPEATED_OPPONENTS = "repeated_opponents"
+PAIR_SEATED_TWICE = "pair_seated_twice"
+GROUP_AT_TWO_TABLES = "group_at_two_tables"
+
+RoundData = Dict[int, Dict['Table', Tuple[Dict[Position, Pair], List[BoardGroup]]]]
+
+
+@dataclass(frozen=True)
+class Conflict:
+	"""
+	One problem found in a movement.
+	`table` is where it shows up in `round`; `first_round` / `first_table` point at the earlier
+	occurrence it clashes with. `other` is the opponent for repeated meetings.
+	"""
+	kind: str
+	round: int
+	table: 'Table'
+	pair: Optional[Pair] = None
+	board: Optional[int] = None
+	board_group: Optional[BoardGroup] = None
+	other: Optional[Pair] = None
+	first_round: Optional[int] = None
+	first_table: Optional['Table'] = None
+
+	def __str__(self):
+		where = f"round {self.round}, table {self.table}"
+		if self.kind == REPLAYED_BOARD:
+			return f"{self.pair.id} replayed board {self.board} ({where}, first played in round {self.first_round})"
+		if self.kind == REPEATED_OPPONENTS:
+			return f"{self.pair.id} vs {self.other.id} repeated ({where}, first met in round {self.first_round})"
+		if self.kind == PAIR_SEATED_TWICE:
+			return f"{self.pair.id} seated twice ({where}, also at table {self.first_table})"
+		return f"board group {self.board_group} at two tables ({where}, also at table {self.first_table})"
+
+
+@dataclass
+class VerificationReport:
+	rounds: int = 0
+	conflicts: List[Conflict] = field(default_factory=list)
+
+	@property
+	def ok(self) -> bool:
+		return not self.conflicts
+
+	def by_kind(self, kind: str) -> List[Conflict]:
+		return [c for c in self.conflicts if c.kind == kind]
+
+	def raise_for_conflicts(self):
+		if self.conflicts:
+			raise ValueError("; ".join(str(c) for c in self.conflicts))
+
+	def __str__(self):
+		if self.ok:
+			return f"{self.rounds} rounds, no conflicts"
+		return "\n".join([f"{self.rounds} rounds, {len(self.conflicts)} conflicts"] + [str(c) for c in self.conflicts])
+
+
+def verify_round_data(round_data: RoundData) -> VerificationReport:
+	"""Check every round of `round_data` in one pass."""
+	report = VerificationReport(rounds=len(round_data))
+	conflicts = report.conflicts
+	played: Dict[Pair, Dict[int, int]] = {}
+	met: Dict[Tuple[Pair, Pair], int] = {}
+
+	for rnd in sorted(round_data):
+		seated: Dict[Pair, 'Table'] = {}
+		placed: Dict[BoardGroup, 'Table'] = {}
+		for table, (sitting, groups) in round_data[rnd].items():
+			for pair in sitting.values():
+				if pair is None:
+					continue
+				if pair in seated:
+					conflicts.append(Conflict(PAIR_SEATED_TWICE, rnd, table, pair=pair, first_round=rnd, first_table=seated[pair]))
+				else:
+					seated[pair] = table
+			for group in groups:
+				if group in placed:
+					conflicts.append(Conflict(GROUP_AT_TWO_TABLES, rnd, table, board_group=group, first_round=rnd, first_table=placed[group]))
+				else:
+					placed[group] = table
+
+			ns, ew = sitting.get(Position.NS), sitting.get(Position.EW)
+			if ns is None or ew is None:
+				continue
+			for pair in (ns, ew):
+				boards = played.setdefault(pair, {})
+				for group in groups:
+					for board in group.boards:
+						first = boards.get(board)
+						if first is not None:
+							conflicts.append(Conflict(REPLAYED_BOARD, rnd, table, pair=pair, board=board, board_group=group, first_round=first))
+						else:
+							boards[board] = rnd
+			first = met.get((ns, ew))
+			if first is not None:
+				conflicts.append(Conflict(REPEATED_OPPONENTS, rnd, table, pair=ns, other=ew, first_round=first))
+			else:
+				met[(ns, ew)] = met[(ew, ns)] = rnd
+	return report
+
+
+def verify_strategy(strategy: 'MovementStrategy', tables: List['Table'], initial_sitting: Dict['Table', Dict[Position, Pair]], initial_boardgroup_placement: Dict['Table', List[BoardGroup]], rounds: Optional[int] = None) -> VerificationReport:
+	"""
+	Verify a strategy from an initial placement without building a `BaseMovement`.
+	`rounds` defaults to the last round the strategy defines.
+	"""
+	plan = CompiledMovementPlan(strategy, tables)
+	return verify_round_data(plan.play(initial_sitting, initial_boardgroup_placement, rounds))
+
+
+def verify_movement(movement: 'BaseMovement', rounds: int) -> VerificationReport:
+	"""Construct the first `rounds` rounds of `movement` (if not built yet) and verify them."""
+	return verify_round_data(movement.construct_movement(rounds))
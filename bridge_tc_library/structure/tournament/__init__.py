@@ -1,4 +1,5 @@
 from .tournament import Tournament
 from .sector import Sector
 from .validator import ValidationEngine
-from .table import Table
\ No newline at end of file
+from .table import Table
+from .table_collection import TableCollection
\ No newline at end of file
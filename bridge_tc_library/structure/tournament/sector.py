@@ -1,8 +1,9 @@
-from typing import Dict, Type, TYPE_CHECKING
+from typing import Dict, Iterable, Type, TYPE_CHECKING
 
 from bridge_tc_library.structure.core.position import Position
 
 from .table import Table
+from .table_collection import TableCollection
 from bridge_tc_library.structure.core import BoardGroup, Status
 
 if TYPE_CHECKING:
@@ -10,13 +11,25 @@ if TYPE_CHECKING:
 
 
 class Sector:
+	# _add_detach_default is set while `__add__` clones tables into a copy
+	__slots__ = ('movement', 'name', '_tables', 'board_groups', 'status', '_add_detach_default')
+
 	def __init__(self, name: str):
 		self.movement = None
 		self.name = name
-		self.tables = []
+		self._tables = TableCollection()
 		self.board_groups: Dict[int, 'BoardGroup'] = {}
 		self.status: Status = Status.INACTIVE
 
+	@property
+	def tables(self) -> TableCollection:
+		"""The sector's tables in order, indexed by object and by table_id."""
+		return self._tables
+
+	@tables.setter
+	def tables(self, tables: Iterable[Table]):
+		self._tables = tables if isinstance(tables, TableCollection) else TableCollection(tables)
+
 	def set_movement(self, movement: 'BaseMovement'):
 		self.movement = movement
 		self.tables = movement.tables
@@ -59,26 +72,33 @@ class Sector:
 			table = [table]
 
 		for t in table:
-			target = None
 			if isinstance(t, Table):
-				if t in self.tables:
-					target = t
-				else:
-					for cand in self.tables:
-						if cand.table_id == t.display_id:
-							target = cand
-							break
+				target = t if t in self.tables else self.tables.get(t.display_id)
 			else:
-				for cand in self.tables:
-					if getattr(cand, 'table_id', None) == t:
-						target = cand
-						break
+				target = self.tables.get(t)
 
 			if target is None:
 				raise ValueError(f"Table {t} not found in sector {self.name}")
 
 			target.change_sector(None)
 
+	def transfer_tables(self, tables: Iterable[Table | int], target: 'Sector'):
+		"""
+		Moves tables (objects or table ids) of this sector to `target`, keeping their order.
+		Each table is unlinked and appended in O(1).
+		"""
+		moving = []
+		for t in tables:
+			if isinstance(t, Table):
+				found = t if t in self.tables else self.tables.get(t.table_id)
+			else:
+				found = self.tables.get(t)
+			if found is None:
+				raise ValueError(f"Table {t} not found in sector {self.name}")
+			moving.append(found)
+		for t in moving:
+			t.change_sector(target)
+
 	def advance_round(self):
 		for table in self.tables:
 			table.next_round()
@@ -133,16 +153,13 @@ class Sector:
 	def copy(self) -> 'Sector':
 		"""Return a shallow copy of this Sector with cloned Table objects.
 
-		The returned Sector shares immutable configuration (movement_cls,
-		board_groups mapping) but owns distinct `Table` instances so
+		The returned Sector shares the movement and a copy of the board_groups
+		mapping but owns distinct `Table` instances so
 		subsequent mutations to tables in the copy won't affect the source.
 		"""
-		new = Sector(self.name, min_boards=self.min_boards, max_boards=self.max_boards)
-		new.movement_cls = self.movement_cls
+		new = Sector(self.name)
 		new.movement = self.movement
 		new.board_groups = self.board_groups.copy()
-		new.max_boards = self.max_boards
-		new.min_boards = self.min_boards
 		new.status = self.status
 
 		for t in self.tables:
@@ -161,15 +178,14 @@ class Sector:
 		"""
 		Returns the sitting and board groups for the given round number as printable string.
 		"""
-		ret = f"Round {round_number} Sitting and Boards:\n"
-		ret += "TABLE\tNS\tEW\tBoard Groups\n"
-
 		sitting = self.movement.get_sitting_for_round(round_number)
 		boards = self.movement.get_boards_for_round(round_number)
 
+		lines = [f"Round {round_number} Sitting and Boards:", "TABLE\tNS\tEW\tBoard Groups"]
 		for tbl in self.movement.tables:
 			ns_pair = sitting[tbl][Position.NS] if tbl in sitting else "----"
 			ew_pair = sitting[tbl][Position.EW] if tbl in sitting else "----"
 			bg_list = boards[tbl] if tbl in boards else []
-			ret += f"{tbl}\t{ns_pair}\t{ew_pair}\t{', '.join(str(b) for b in bg_list)}\n"
-		return ret
\ No newline at end of file
+			lines.append(f"{tbl}\t{ns_pair}\t{ew_pair}\t{', '.join(str(b) for b in bg_list)}")
+		lines.append("")
+		return "\n".join(lines)
\ No newline at end of file
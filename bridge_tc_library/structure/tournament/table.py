@@ -1,3 +1,4 @@
+from abc import ABCMeta
 from typing import Optional, TYPE_CHECKING
 from bridge_tc_library.structure.core.status import Status
 
@@ -6,7 +7,13 @@ if TYPE_CHECKING:
     from bridge_tc_library.structure.core import Pair, Position, BoardGroup
     
 
-class Table:
+# ABCMeta lets registry handles register as virtual subclasses without inheriting the slots
+class Table(metaclass=ABCMeta):
+    __slots__ = (
+        '_table_id', 'display_id', 'sector', 'og_sector', 'isplayable',
+        'current_round', 'current_pairs', 'current_board', 'current_board_set', 'status',
+    )
+
     def __init__(self, table_id: int, sector: Optional['Sector'] = None, isplayable: bool = True) -> None:
         self._table_id: int = table_id
         self.display_id: int = table_id
@@ -19,6 +26,10 @@ class Table:
         self.current_board_set: Optional['BoardGroup'] = None
         self.status: Status = Status.INACTIVE
 
+    @property
+    def table_id(self) -> int:
+        return self._table_id
+
     def start(self, ns_pair: 'Pair', ew_pair: 'Pair', board_set: 'BoardGroup'):
         if not self.isplayable:
             raise ValueError("Cannot start a non-playable table.")
@@ -0,0 +1,190 @@
+from typing import Dict, Iterable, Iterator, List, Optional, Union, overload
+
+from .table import Table
+
+
+class TableCollection:
+    """
+    Ordered collection of tables indexed by object and by `table_id`.
+
+    Tables keep their insertion order (what `Sector.exclude_storage_tables_from_numbering`
+    numbers by). They sit in a list of slots; removing a table leaves an empty slot
+    (a tombstone) that is dropped when the tombstones outnumber the tables, so membership,
+    `append`, `remove` and lookups by id are O(1) amortized. A Fenwick tree over the
+    occupied slots gives positional access and `index` in O(log n) while tombstones are
+    present, and O(1) when there are none. A table is held at most once: appending a
+    table that is already present does nothing.
+    """
+
+    __slots__ = ('_slots', '_pos', '_by_id', '_tree', '_dead')
+
+    def __init__(self, tables: Iterable[Table] = ()) -> None:
+        self._slots: List[Optional[Table]] = []
+        # table -> index of its slot
+        self._pos: Dict[Table, int] = {}
+        self._by_id: Dict[int, Dict[Table, None]] = {}
+        # Fenwick tree (1-based) counting occupied slots
+        self._tree: List[int] = [0]
+        self._dead = 0
+        self.extend(tables)
+
+    # -- occupied-slot counts ----------------------------------------------
+
+    def _tree_append(self) -> None:
+        # the new node covers slots (i - lowbit(i), i]; all but the last are already counted
+        i = len(self._tree)
+        low = i - (i & -i)
+        covered, j = 1, i - 1
+        while j > low:
+            covered += self._tree[j]
+            j -= j & -j
+        self._tree.append(covered)
+
+    def _tree_remove(self, slot: int) -> None:
+        i = slot + 1
+        while i < len(self._tree):
+            self._tree[i] -= 1
+            i += i & -i
+
+    def _count_before(self, slot: int) -> int:
+        total, i = 0, slot
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def _slot_of_rank(self, rank: int) -> int:
+        # slot holding the (rank + 1)-th table, by binary lifting over the tree
+        slot, step = 0, 1 << (len(self._tree) - 1).bit_length()
+        while step:
+            nxt = slot + step
+            if nxt < len(self._tree) and self._tree[nxt] <= rank:
+                slot = nxt
+                rank -= self._tree[nxt]
+            step >>= 1
+        return slot
+
+    def _compact(self) -> None:
+        tables = [table for table in self._slots if table is not None]
+        self._slots = tables
+        self._pos = {table: idx for idx, table in enumerate(tables)}
+        self._tree = [0]
+        for _ in tables:
+            self._tree_append()
+        self._dead = 0
+
+    # -- sequence protocol -------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._pos)
+
+    def __iter__(self) -> Iterator[Table]:
+        # a snapshot, so tables may change sector while the collection is iterated
+        if not self._dead:
+            return iter(list(self._slots))
+        return iter([table for table in self._slots if table is not None])
+
+    def __contains__(self, table: object) -> bool:
+        return table in self._pos
+
+    @overload
+    def __getitem__(self, index: int) -> Table: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Table]: ...
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return list(self)[index]
+        size = len(self._pos)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("table index out of range")
+        if not self._dead:
+            return self._slots[index]
+        return self._slots[self._slot_of_rank(index)]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (TableCollection, list, tuple)):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # mutable
+
+    def __repr__(self) -> str:
+        return f"TableCollection({list(self)!r})"
+
+    def values(self) -> Iterator[Table]:
+        return iter(self)
+
+    def index(self, table: Table) -> int:
+        slot = self._pos.get(table)
+        if slot is None:
+            raise ValueError(f"{table!r} is not in the collection")
+        return slot if not self._dead else self._count_before(slot)
+
+    # -- lookups by id -----------------------------------------------------
+
+    def get(self, table_id: int) -> Optional[Table]:
+        """The first table with `table_id`, or None."""
+        tables = self._by_id.get(table_id)
+        return next(iter(tables)) if tables else None
+
+    def get_all(self, table_id: int) -> List[Table]:
+        return list(self._by_id.get(table_id, ()))
+
+    # -- changes -----------------------------------------------------------
+
+    def append(self, table: Table) -> None:
+        if table in self._pos:
+            return
+        self._pos[table] = len(self._slots)
+        self._slots.append(table)
+        self._tree_append()
+        self._by_id.setdefault(table.table_id, {})[table] = None
+
+    def extend(self, tables: Iterable[Table]) -> None:
+        for table in tables:
+            self.append(table)
+
+    def discard(self, table: Table) -> bool:
+        """Removes `table` if present; returns whether it was."""
+        slot = self._pos.pop(table, None)
+        if slot is None:
+            return False
+        same_id = self._by_id[table.table_id]
+        del same_id[table]
+        if not same_id:
+            del self._by_id[table.table_id]
+
+        self._slots[slot] = None
+        self._tree_remove(slot)
+        self._dead += 1
+        # trailing tombstones are simply cut off
+        while self._slots and self._slots[-1] is None:
+            self._slots.pop()
+            self._tree.pop()
+            self._dead -= 1
+        if self._dead > len(self._pos):
+            self._compact()
+        return True
+
+    def remove(self, table: Table) -> None:
+        if not self.discard(table):
+            raise ValueError(f"{table!r} is not in the collection")
+
+    def pop(self, index: int = -1) -> Table:
+        table = self[index]
+        self.discard(table)
+        return table
+
+    def clear(self) -> None:
+        self._slots.clear()
+        self._pos.clear()
+        self._by_id.clear()
+        self._tree = [0]
+        self._dead = 0
+
+    def copy(self) -> 'TableCollection':
+        return TableCollection(self)
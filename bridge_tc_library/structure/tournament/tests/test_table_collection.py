@@ -0,0 +1,123 @@
+import random
+
+import pytest
+
+from bridge_tc_library.structure.tournament import Sector, Table, TableCollection
+
+
+def test_collection_keeps_order_and_indexes_ids():
+    tables = [Table(i) for i in (3, 1, 2)]
+    collection = TableCollection(tables)
+    assert list(collection) == tables
+    assert collection == tables
+    assert collection[0] is tables[0] and collection[-1] is tables[2]
+    assert collection.get(1) is tables[1]
+    assert collection.get(9) is None
+
+    collection.append(tables[0])
+    assert len(collection) == 3
+
+    twin = Table(1)
+    collection.append(twin)
+    assert collection.get_all(1) == [tables[1], twin]
+    collection.remove(tables[1])
+    assert collection.get(1) is twin
+    assert collection == [tables[0], tables[2], twin]
+    assert collection.index(twin) == 2
+
+    assert collection.pop() is twin
+    assert collection.get(1) is None
+    with pytest.raises(ValueError):
+        collection.remove(twin)
+    assert list(collection.values()) == [tables[0], tables[2]]
+
+
+def test_sector_tables_and_numbering():
+    sector = Sector("A")
+    sector.add_tables(5)
+    assert isinstance(sector.tables, TableCollection)
+    sector.tables[1].isplayable = False
+    sector.tables[3].isplayable = False
+    sector.exclude_storage_tables_from_numbering()
+    assert [t.display_id for t in sector.tables] == [1, 1, 2, 2, 3]
+
+    sector.remove_tables([2, 4])
+    assert [t.table_id for t in sector.tables] == [1, 3, 5]
+    with pytest.raises(ValueError):
+        sector.remove_tables(2)
+
+
+def test_copy_keeps_sector_state():
+    sector = Sector("A")
+    sector.add_tables(3)
+    sector.tables[2].isplayable = False
+    copy = sector.copy()
+    assert copy.name == "A" and copy.movement is sector.movement
+    assert [t.table_id for t in copy.tables] == [1, 2, 3]
+    assert [t.isplayable for t in copy.tables] == [True, True, False]
+    assert all(t.sector is copy for t in copy.tables)
+    assert not any(t in sector.tables for t in copy.tables)
+
+
+def test_bulk_transfer():
+    a, b = Sector("A"), Sector("B")
+    a.add_tables(6)
+    moving = [a.tables[4], a.tables[1]]
+    a.transfer_tables([5, 2], b)
+    assert b.tables == moving
+    assert all(t.sector is b for t in moving)
+    assert [t.table_id for t in a.tables] == [1, 3, 4, 6]
+    with pytest.raises(ValueError):
+        a.transfer_tables([2], b)
+
+
+def test_matches_list_under_random_edits():
+    rng = random.Random(5)
+    tables = [Table(i % 40) for i in range(300)]
+    collection, reference = TableCollection(), []
+    for _ in range(4000):
+        op = rng.random()
+        if op < 0.45:
+            table = rng.choice(tables)
+            collection.append(table)
+            if table not in reference:
+                reference.append(table)
+        elif op < 0.75 and reference:
+            table = rng.choice(reference)
+            collection.remove(table)
+            reference.remove(table)
+        elif op < 0.85 and reference:
+            idx = rng.randrange(-len(reference), len(reference))
+            assert collection.pop(idx) is reference.pop(idx)
+        elif reference:
+            idx = rng.randrange(len(reference))
+            assert collection[idx] is reference[idx]
+            assert collection.index(reference[idx]) == idx
+        assert len(collection) == len(reference)
+    assert collection == reference
+    for table_id in range(40):
+        assert collection.get_all(table_id) == [t for t in reference if t.table_id == table_id]
+
+
+def test_interleaved_removes_and_reads_stay_cheap(monkeypatch):
+    # every removal followed by indexed reads; compaction work must stay linear in the operations
+    compacted = []
+    compact = TableCollection._compact
+
+    def counting(self):
+        compacted.append(len(self._pos))
+        compact(self)
+
+    monkeypatch.setattr(TableCollection, "_compact", counting)
+    a, b = Sector("A"), Sector("B")
+    a.add_tables(2000)
+    operations = 0
+    for _ in range(10):
+        while len(a.tables) > 1:
+            a.transfer_tables([a.tables[len(a.tables) // 2]], b)
+            assert a.tables.index(a.tables[-1]) == len(a.tables) - 1
+            operations += 1
+        while len(b.tables) > 1:
+            b.transfer_tables([b.tables[0]], a)
+            operations += 1
+    assert sum(compacted) <= 2 * operations
@@ -0,0 +1,73 @@
+import random
+from collections import defaultdict
+
+import pytest
+
+from bridge_tc_library.structure.core import BoardGroup, Pair, Player
+from bridge_tc_library.structure.tournament import ValidationEngine
+
+
+class SetValidationEngine:
+    """The set-based engine the bitset version replaces."""
+
+    def __init__(self):
+        self.pair_boards = defaultdict(set)
+        self.pair_opponents = defaultdict(set)
+
+    def validate_round(self, pairs_round, boards_round):
+        table_map = {}
+        for (table, pos), pair in pairs_round.items():
+            table_map.setdefault(table, {})[pos] = pair
+        for table, positions in table_map.items():
+            ns, ew = positions["NS"], positions["EW"]
+            for board in boards_round[table].boards:
+                if board in self.pair_boards[ns]:
+                    raise ValueError(f"{ns.id} replayed board {board}")
+                if board in self.pair_boards[ew]:
+                    raise ValueError(f"{ew.id} replayed board {board}")
+                self.pair_boards[ns].add(board)
+                self.pair_boards[ew].add(board)
+            if ew in self.pair_opponents[ns]:
+                raise ValueError(f"{ns.id} vs {ew.id} repeated")
+            self.pair_opponents[ns].add(ew)
+            self.pair_opponents[ew].add(ns)
+
+
+def make_pairs(n):
+    return [Pair(i + 1, (Player(f"P{2 * i + 1}"), Player(f"P{2 * i + 2}"))) for i in range(n)]
+
+
+def test_messages():
+    a, b, c = make_pairs(3)
+    engine = ValidationEngine()
+    engine.validate_round({(1, "NS"): a, (1, "EW"): b}, {1: BoardGroup(1, (1, 2, 3))})
+    with pytest.raises(ValueError, match="^2 replayed board 2$"):
+        engine.validate_round({(1, "NS"): c, (1, "EW"): b}, {1: BoardGroup(2, (4, 2))})
+    with pytest.raises(ValueError, match="^2 vs 1 repeated$"):
+        engine.validate_round({(1, "NS"): b, (1, "EW"): a}, {1: BoardGroup(3, (7, 8))})
+    assert engine.has_played(a, 8) and not engine.has_played(a, 9)
+    assert engine.have_met(a, b) and not engine.have_met(a, c)
+
+
+def test_matches_set_engine_including_partial_rounds():
+    rng = random.Random(3)
+    pairs = make_pairs(12)
+    groups = [BoardGroup(i, tuple(rng.sample(range(1, 40), 3))) for i in range(30)]
+    new, old = ValidationEngine(), SetValidationEngine()
+    for _ in range(60):
+        seated = rng.sample(pairs, 6)
+        pairs_round = {}
+        boards_round = {}
+        for t in range(3):
+            pairs_round[(t, "NS")], pairs_round[(t, "EW")] = seated[2 * t], seated[2 * t + 1]
+            boards_round[t] = rng.choice(groups)
+        errors = []
+        for engine in (new, old):
+            try:
+                engine.validate_round(pairs_round, boards_round)
+                errors.append(None)
+            except ValueError as exc:
+                errors.append(str(exc))
+        assert errors[0] == errors[1]
+        assert new.pair_boards == old.pair_boards
+        assert new.pair_opponents == old.pair_opponents
@@ -1,6 +1,7 @@
 from typing import List, Optional
 from .validator import ValidationEngine
 from .sector import Sector
+from .table import Table
 
 
 class Tournament:
@@ -10,6 +11,11 @@ class Tournament:
         # separate per-deal counter overall is optional; sectors manage their own within-round idx
         self.validator: ValidationEngine = ValidationEngine()
 
+    @property
+    def tables(self) -> List[Table]:
+        """All tables of all sectors, in sector order."""
+        return [table for sector in self.sectors for table in sector.tables]
+
     def add_sector(self, sector: Sector) -> None:
         self.sectors.append(sector)
 
@@ -1,9 +1,37 @@
 from collections import defaultdict
 
+
 class ValidationEngine:
+	"""
+	Checks that no pair replays a board and no two pairs meet twice.
+	Each pair gets an integer index; boards played and opponents met are kept as int bitmasks
+	(bit b of `_boards[i]` is board b, bit j of `_opponents[i]` is the pair with index j),
+	so a table is validated with a couple of ANDs against the cached mask of its board group.
+	"""
 	def __init__(self):
-		self.pair_boards = defaultdict(set)
-		self.pair_opponents = defaultdict(set)
+		self._pair_index = {}
+		self._pairs = []
+		self._boards = []
+		self._opponents = []
+		self._group_masks = {}
+
+	def _index(self, pair):
+		idx = self._pair_index.get(pair)
+		if idx is None:
+			idx = self._pair_index[pair] = len(self._pairs)
+			self._pairs.append(pair)
+			self._boards.append(0)
+			self._opponents.append(0)
+		return idx
+
+	def _group_mask(self, board_group):
+		mask = self._group_masks.get(board_group)
+		if mask is None:
+			mask = 0
+			for board in board_group.boards:
+				mask |= 1 << board
+			self._group_masks[board_group] = mask
+		return mask
 
 	def validate_round(self, pairs_round, boards_round):
 		table_map = {}
@@ -11,22 +39,62 @@ class ValidationEngine:
 		for (table, pos), pair in pairs_round.items():
 			table_map.setdefault(table, {})[pos] = pair
 
+		boards, opponents = self._boards, self._opponents
 		for table, positions in table_map.items():
 			ns = positions["NS"]
 			ew = positions["EW"]
 			board_group = boards_round[table]
+			n, e = self._index(ns), self._index(ew)
+			mask = self._group_mask(board_group)
 
-			for board in board_group.boards:
-				if board in self.pair_boards[ns]:
-					raise ValueError(f"{ns.id} replayed board {board}")
-				if board in self.pair_boards[ew]:
-					raise ValueError(f"{ew.id} replayed board {board}")
-
-				self.pair_boards[ns].add(board)
-				self.pair_boards[ew].add(board)
+			if (boards[n] | boards[e]) & mask:
+				# boards before the replayed one are recorded, as when checking board by board
+				for board in board_group.boards:
+					bit = 1 << board
+					if boards[n] & bit:
+						raise ValueError(f"{ns.id} replayed board {board}")
+					if boards[e] & bit:
+						raise ValueError(f"{ew.id} replayed board {board}")
+					boards[n] |= bit
+					boards[e] |= bit
+			boards[n] |= mask
+			boards[e] |= mask
 
-			if ew in self.pair_opponents[ns]:
+			if opponents[n] >> e & 1:
 				raise ValueError(f"{ns.id} vs {ew.id} repeated")
 
-			self.pair_opponents[ns].add(ew)
-			self.pair_opponents[ew].add(ns)
+			opponents[n] |= 1 << e
+			opponents[e] |= 1 << n
+
+	def has_played(self, pair, board) -> bool:
+		idx = self._pair_index.get(pair)
+		return idx is not None and bool(self._boards[idx] >> board & 1)
+
+	def have_met(self, pair, other) -> bool:
+		idx, other_idx = self._pair_index.get(pair), self._pair_index.get(other)
+		return idx is not None and other_idx is not None and bool(self._opponents[idx] >> other_idx & 1)
+
+	@staticmethod
+	def _bits(mask):
+		out = []
+		while mask:
+			low = mask & -mask
+			out.append(low.bit_length() - 1)
+			mask ^= low
+		return out
+
+	@property
+	def pair_boards(self):
+		"""{Pair: set of boards played}, decoded from the bitmasks."""
+		decoded = defaultdict(set)
+		for pair, idx in self._pair_index.items():
+			decoded[pair] = set(self._bits(self._boards[idx]))
+		return decoded
+
+	@property
+	def pair_opponents(self):
+		"""{Pair: set of Pairs met}, decoded from the bitmasks."""
+		decoded = defaultdict(set)
+		for pair, idx in self._pair_index.items():
+			decoded[pair] = {self._pairs[j] for j in self._bits(self._opponents[idx])}
+		return decoded